@@ -1,9 +1,11 @@
-#this belongs in apps/methods/dff_parser.py - Version: 6
+#this belongs in apps/methods/dff_parser.py - Version: 7
 # X-Seti - May08 2026 - Model Workshop - RenderWare DFF Parser
 """
 Parser for GTA RenderWare DFF (Clump) model files.
 Reads geometry, frames, materials, and atomic links.
 Supports GTA III / VC / SA PC DFF format.
+Works on bytes, bytearray, memoryview or mmap; chunk headers and strings are
+read in place via apps/methods/rw_chunks.py.
 """
 
 import struct
@@ -12,6 +14,7 @@ from apps.methods.dff_classes import (
     DFFModel, Frame, Geometry, Atomic, Material, Triangle,
     Vector3, RGBA, TexCoord, BoundingSphere, RWChunkType
 )
+from apps.methods.rw_chunks import as_view, read_chunk_header, read_cstring
 
 ## Methods list -
 # read_chunk
@@ -30,19 +33,19 @@ from apps.methods.dff_classes import (
 # load_dff
 
 
-def read_chunk(data: bytes, pos: int):
+def read_chunk(data, pos: int):
     """Read a 12-byte RW chunk header → (type, size, lib, payload_pos)."""
-    if pos + 12 > len(data):
+    chunk = read_chunk_header(data, pos)
+    if chunk is None:
         return None, 0, 0, pos
-    ct, sz, lib = struct.unpack_from('<III', data, pos)
-    return ct, sz, lib, pos + 12
+    return chunk.type, chunk.size, chunk.version, chunk.data_offset
 
 
 class DFFParser:
     """Parses a GTA RenderWare DFF (Clump) file into a DFFModel."""
 
-    def __init__(self, data: bytes, path: str = ""):
-        self.data  = data
+    def __init__(self, data, path: str = ""):
+        self.data  = as_view(data)
         self.path  = path
         self.model = DFFModel(source_path=path)
         self.errors: List[str] = []
@@ -118,18 +121,15 @@ class DFFParser:
                 while ep < ee - 12:
                     ect, esz, _, ep2 = read_chunk(self.data, ep)
                     if ect == 0x0253F2FE:   # Frame Name plugin (VC) — data IS the name string
-                        raw = self.data[ep2:ep2+esz]
-                        name = raw.split(b'\x00')[0].decode('ascii','replace').strip()
+                        name = read_cstring(self.data, ep2, esz).strip()
                         if name:
                             self.model.frames[frame_idx].name = name
                     elif ect == 0x0253F2FF: # Frame name string (RW 3.4+)
-                        raw = self.data[ep2:ep2+esz]
-                        name = raw.split(b'\x00')[0].decode('ascii','replace').strip()
+                        name = read_cstring(self.data, ep2, esz).strip()
                         if name:
                             self.model.frames[frame_idx].name = name
                     elif ect == 0x00000002: # RW_STRING — frame name in VC format
-                        raw = self.data[ep2:ep2+esz]
-                        name = raw.split(b'\x00')[0].decode('ascii','replace').strip()
+                        name = read_cstring(self.data, ep2, esz).strip()
                         if name and not self.model.frames[frame_idx].name:
                             self.model.frames[frame_idx].name = name
                     ep = ep2 + esz
@@ -449,11 +449,11 @@ class DFFParser:
                 ct3, sz3, _, p3 = read_chunk(self.data, tp); tp = p3 + sz3
                 # Texture name string
                 ct3, sz3, _, p3 = read_chunk(self.data, tp)
-                mat.texture_name = self.data[p3:p3+sz3].split(b'\x00')[0].decode('ascii','replace')
+                mat.texture_name = read_cstring(self.data, p3, sz3)
                 tp = p3 + sz3
                 # Mask name string
                 ct3, sz3, _, p3 = read_chunk(self.data, tp)
-                mat.texture_mask = self.data[p3:p3+sz3].split(b'\x00')[0].decode('ascii','replace')
+                mat.texture_mask = read_cstring(self.data, p3, sz3)
             pos = p2 + sz2
 
         return mat
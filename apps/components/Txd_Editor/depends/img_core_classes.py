@@ -1,4 +1,4 @@
-#this belongs in methods.img_core_classes.py - Version: 11
+#this belongs in methods.img_core_classes.py - Version: 29
 # X-Seti - November29 2025 - IMG Factory 1.5 - IMG Core Classes with Fixed RW Version Detection
 
 """
@@ -6,19 +6,30 @@ IMG Core Classes
 """
 
 import os
+import re
+import bisect
+import hashlib
+import mmap
 import struct
 import json
 import shutil
+import tempfile
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from typing import List, Dict, Optional, Any, Union, BinaryIO
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
     QPushButton, QComboBox, QLineEdit, QGroupBox, QLabel)
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QThread
 
 # Import existing RW version functions - KEPT ALL ORIGINAL IMPORTS
 from apps.methods.rw_versions import get_rw_version_name, parse_rw_version, get_model_format_version
+from apps.methods import img_index
+from apps.methods.lzo_entry_cache import get_lzo_entry_cache
 from apps.debug.debug_functions import img_debugger
 from apps.methods.populate_img_table import DragSelectTableWidget
 
@@ -58,6 +69,13 @@ def _find_companion(base_path: str, new_ext: str) -> str:
 
 
 ##Methods list -
+# _copy_range
+# _journal_path
+# _rollback_journal
+# _write_journal
+# _lzo1x_compress
+# _xbox_lzo_compress_all
+# _xbox_lzo_compress_entry
 # create_entries_table_panel
 # create_img_file
 # detect_img_version
@@ -77,9 +95,12 @@ def _find_companion(base_path: str, new_ext: str) -> str:
 # IMGPlatform
 # IMGVersion
 # Platform
+# RWVersionScanner
 # RecentFilesManager
+# SectorAllocator
 # TabFilterWidget
 # ValidationResult
+# _MappedFile
 
 def _is_v3_encrypted(first16: bytes) -> bool:
     """Return True if first 16 bytes decrypt (AES-256 ECB, 16 rounds) to a valid V3 header start."""
@@ -271,129 +292,279 @@ _KNOWN_GTA_EXTENSIONS = {
     'ped', 'grp', 'cut', 'cnf', 'img', 'dir', 'scm', 'mp3', 'ogg',
     'fxp', 'bmp', 'png', 'jpg', 'spl', 'rrr', 'rdb', 'rsc',
 }
+_KNOWN_EXTENSION_LENGTHS = tuple(sorted({len(ext) for ext in _KNOWN_GTA_EXTENSIONS}, reverse=True))
+_SAFE_NAME_RE = re.compile(r'^[A-Za-z0-9_\-@+.]+')
+
+# V1 / VER2 directory row: offset(4), size(4) in sectors, name(24)
+_DIR_ENTRY = struct.Struct('<II24s')
+_SECTOR_SIZE = 2048
+
+# Chunk size when entry data can't be copied by the kernel
+_COPY_CHUNK = 1 << 20
+
+# Single-file versions with a VER2 header + directory at the start
+_VER2_LAYOUT_VERSIONS = (
+    IMGVersion.VERSION_2, IMGVersion.VERSION_SA_ANDROID, IMGVersion.VERSION_LCS_ANDROID,
+)
+
+# Versions IMGFile._save_in_place() can update without a rebuild
+_IN_PLACE_VERSIONS = (
+    IMGVersion.VERSION_1, IMGVersion.VERSION_1_5, IMGVersion.VERSION_XBOX,
+    IMGVersion.VERSION_2, IMGVersion.VERSION_SA_ANDROID,
+)
+
+# Versions whose entries come from a plain directory table - these can be
+# restored from the sidecar index (apps/methods/img_index.py)
+_INDEXED_VERSIONS = (
+    IMGVersion.VERSION_1, IMGVersion.VERSION_1_5, IMGVersion.VERSION_SOL,
+    IMGVersion.VERSION_XBOX, IMGVersion.VERSION_2, IMGVersion.VERSION_SA_ANDROID,
+    IMGVersion.VERSION_LCS_ANDROID,
+)
 
 _XBOX_LZO_MAGIC = 0x67A3A1CE  # little-endian master header magic for Xbox LZO streams
 
-def _lzo1x_decompress(data: bytes, expected_size: int = 0) -> bytes:
-    """Pure-Python LZO1X-1 decompressor (lzo1x_decompress_safe compatible).
+# First bytes of an in-place save journal (_write_journal)
+_JOURNAL_MAGIC = b'IMGJ'
 
-    Based on the canonical LZO1X algorithm. Handles the compressed block
-    data as produced by lzo1x-999 (used in GTA Xbox TXD/DFF entries).
-    Returns decompressed bytes. Raises ValueError on malformed input.
+# Decompressed bytes per block written by _xbox_lzo_compress_entry
+_XBOX_LZO_BLOCK_SIZE = 0x20000
+
+# Below this much data, _xbox_lzo_compress_all compresses without a process pool
+_LZO_POOL_MIN_BYTES = 2 << 20
+
+def _lzo1x_decompress(data: bytes, expected_size: int = 0) -> bytes: #vers 2
+    """Pure-Python LZO1X decompressor (lzo1x_decompress_safe compatible).
+
+    Decodes any LZO1X stream (lzo1x-1 or lzo1x-999, as used in GTA Xbox
+    TXD/DFF entries). The state machine is inlined into one loop; output
+    goes into a bytearray preallocated to expected_size (the block header's
+    decompressed size) and grows only if the stream is longer. Literal runs
+    and non-overlapping matches are copied as slice assignments, overlapping
+    matches (runs) by repeating the pattern. Raises ValueError on malformed
+    input.
     """
-    out = bytearray(expected_size) if expected_size else bytearray()
-    if expected_size:
-        out = bytearray()
-
-    src = 0
-    n = len(data)
-
-    def peek():
-        return data[src] if src < n else 0
-
-    def get():
-        nonlocal src
-        if src >= n:
-            raise ValueError("LZO: truncated input")
-        b = data[src]; src += 1
-        return b
-
-    def copy_match(dist, length):
-        start = len(out) - dist
-        if start < 0:
-            raise ValueError(f"LZO: invalid match distance {dist}")
-        for _ in range(length):
-            out.append(out[start])
-            start += 1
-
-    # Decode first instruction
-    t = get()
-    if t >= 18:
-        # Initial literal run
-        cnt = t - 17
-        for _ in range(cnt):
-            out.append(get())
-        t = get()
-    elif t >= 16:
-        pass  # fall through to main loop
-    else:
-        # t < 16 on first byte: short literal
-        pass
+    out = bytearray(expected_size)
+    op = 0
+    ip = 0
+    # Where the next instruction byte is interpreted:
+    # 0 = loop (literal run or match), 1 = after a literal run
+    # (t < 16 is a 3-byte M1 match), 2 = match (t < 16 is a 2-byte M1 match)
+    state = 0
+    try:
+        t = data[0]
+        if t > 17:
+            t -= 17
+            ip = 1
+            out[op:op + t] = data[ip:ip + t]
+            op += t
+            ip += t
+            state = 1 if t >= 4 else 2
+            if state == 2:
+                t = data[ip]
+                ip += 1
+
+        while True:
+            if state == 0:
+                t = data[ip]
+                ip += 1
+                if t < 16:
+                    # Literal run of t + 3 bytes
+                    if t == 0:
+                        while data[ip] == 0:
+                            t += 255
+                            ip += 1
+                        t += 15 + data[ip]
+                        ip += 1
+                    t += 3
+                    if ip + t > len(data):
+                        raise ValueError("LZO: truncated input")
+                    out[op:op + t] = data[ip:ip + t]
+                    op += t
+                    ip += t
+                    state = 1
+                    continue
+            elif state == 1:
+                t = data[ip]
+                ip += 1
+                if t < 16:
+                    # 3-byte match, distance 2049..3072
+                    dist = 0x801 + (t >> 2) + (data[ip] << 2)
+                    ip += 1
+                    length = 3
+                    t = -1
+            if t >= 64:
+                # M2: 3-8 bytes, distance 1..2048
+                dist = 1 + ((t >> 2) & 7) + (data[ip] << 3)
+                ip += 1
+                length = (t >> 5) + 1
+            elif t >= 32:
+                # M3: distance 1..16384
+                length = t & 31
+                if length == 0:
+                    while data[ip] == 0:
+                        length += 255
+                        ip += 1
+                    length += 31 + data[ip]
+                    ip += 1
+                length += 2
+                dist = 1 + ((data[ip] | (data[ip + 1] << 8)) >> 2)
+                ip += 2
+            elif t >= 16:
+                # M4: distance 16385..49151, or end of stream
+                length = t & 7
+                if length == 0:
+                    while data[ip] == 0:
+                        length += 255
+                        ip += 1
+                    length += 7 + data[ip]
+                    ip += 1
+                length += 2
+                dist = ((t & 8) << 11) + ((data[ip] | (data[ip + 1] << 8)) >> 2)
+                ip += 2
+                if dist == 0:
+                    break
+                dist += 0x4000
+            elif t >= 0:
+                # M1 after a match: 2 bytes, distance 1..1024
+                dist = 1 + (t >> 2) + (data[ip] << 2)
+                ip += 1
+                length = 2
+
+            m = op - dist
+            if m < 0:
+                raise ValueError(f"LZO: invalid match distance {dist}")
+            if dist >= length:
+                out[op:op + length] = out[m:m + length]
+            else:
+                out[op:op + length] = (out[m:op] * (length // dist + 1))[:length]
+            op += length
 
-    # Main decode loop
-    while True:
-        if t < 16:
-            # Short literal + end-of-block
+            # Up to 3 literals ride in the low bits of the match's
+            # second-to-last byte
+            t = data[ip - 2] & 3
             if t == 0:
-                cnt = 15
-                while peek() == 0:
-                    cnt += 255; get()
-                cnt += get()
+                state = 0
             else:
-                cnt = t
-            for _ in range(cnt + 3):
-                out.append(get())
-            t = get()
-            if t >= 16:
-                continue
-            # EOS short match
-            dist = 0x801 + (get() << 2) + (t >> 2)
-            copy_match(dist, 3)
-            t &= 3
-            if t:
-                for _ in range(t):
-                    out.append(get())
-                t = get()
-            continue
-
-        if t >= 64:
-            # Short match (2-8 bytes, dist 1-8*256)
-            length = (t >> 5) - 1 + 2
-            dist = ((t >> 2) & 7) * 256 + get() + 1
-            copy_match(dist, length)
-
-        elif t >= 32:
-            # Medium match
-            length = t & 31
-            if length == 0:
-                length = 31
-                while peek() == 0:
-                    length += 255; get()
-                length += get()
-            length += 2
-            b1 = get(); b2 = get()
-            dist = (b1 >> 2) + (b2 << 6) + 1
-            copy_match(dist, length)
-
-        else:  # 16 <= t < 32
-            # Long match
-            length = t & 7
-            if length == 0:
-                length = 7
-                while peek() == 0:
-                    length += 255; get()
-                length += get()
-            length += 2
-            b1 = get(); b2 = get()
-            dist = (b1 >> 2) + (b2 << 6) + 0x4001
-            if t & 8:
-                dist += 0x4000
-            copy_match(dist, length)
+                out[op:op + t] = data[ip:ip + t]
+                op += t
+                ip += t
+                t = data[ip]
+                ip += 1
+                state = 2
+    except IndexError:
+        raise ValueError("LZO: truncated input")
+
+    if op != len(out):
+        del out[op:]
+    return bytes(out)
 
-        # Trailing literal nibble
-        t &= 3
-        if t == 0:
-            t = get()
-            continue
-        for _ in range(t):
-            out.append(get())
-        t = get()
-        if src >= n:
-            break
 
+def _lzo1x_literals(out: bytearray, data: bytes, start: int, count: int): #vers 1
+    """Append a literal run of count bytes of data (from start) to out."""
+    if count <= 3 and out:
+        # Rides in the low bits of the previous match's second-to-last byte
+        out[-2] |= count
+    elif not out and count <= 238:
+        out.append(17 + count)
+    elif count <= 18:
+        out.append(count - 3)
+    else:
+        extra = count - 18
+        zeros = (extra - 1) // 255
+        out.append(0)
+        out += bytes(zeros)
+        out.append(extra - 255 * zeros)
+    out += data[start:start + count]
+
+
+def _lzo1x_compress(data: bytes) -> bytes: #vers 1
+    """Pure-Python LZO1X-1 compressor - output is decoded by
+    _lzo1x_decompress and by lzo1x_decompress_safe.
+
+    The lzo1x_1 algorithm: one hash table of 8192 4-byte sequences, greedy
+    matches, literal runs grow their search step every 32 misses. Input is
+    split into 48 KiB chunks (the longest M4 distance), each with a fresh
+    table. The 4-byte words are unpacked up front in four struct calls.
+    """
+    data = bytes(data)
+    length = len(data)
+    out = bytearray()
+    pending = 0     # literals not yet written, ending at pos
+    pos = 0
+    if length > 20:
+        words = [0] * (length - 3)
+        for k in range(4):
+            count = (length - 3 - k + 3) // 4
+            words[k::4] = struct.unpack_from(f'<{count}I', data, k)
+        while length - pos > 20:
+            end = min(length, pos + 0xC000)
+            pending = _lzo1x_compress_chunk(data, words, pos, end, out, pending)
+            pos = end
+    pending += length - pos
+    if pending:
+        _lzo1x_literals(out, data, length - pending, pending)
+    out += b'\x11\x00\x00'     # M4 with distance 0 - end of stream
     return bytes(out)
 
 
+def _lzo1x_compress_chunk(data: bytes, words: List[int], base: int, end: int,
+                          out: bytearray, pending: int) -> int: #vers 1
+    """Compress data[base:end] onto out, after pending literals that end at
+    base; returns the literals left pending at end."""
+    table = [base] * 8192
+    ip_end = end - 20
+    ii = base - pending             # start of the current literal run
+    ip = base + max(0, 4 - pending)
+    ip += 1 + ((ip - ii) >> 5)
+    while ip < ip_end:
+        word = words[ip]
+        slot = ((word * 0x1824429D) & 0xFFFFFFFF) >> 19
+        m_pos = table[slot]
+        table[slot] = ip
+        if words[m_pos] != word:
+            ip += 1 + ((ip - ii) >> 5)
+            continue
+
+        if ip > ii:
+            _lzo1x_literals(out, data, ii, ip - ii)
+        m_len = 4
+        limit = ip_end - ip
+        if m_len < limit and data[ip + 4] == data[m_pos + 4]:
+            while (m_len + 32 <= limit and
+                   data[ip + m_len:ip + m_len + 32] == data[m_pos + m_len:m_pos + m_len + 32]):
+                m_len += 32
+            while m_len < limit and data[ip + m_len] == data[m_pos + m_len]:
+                m_len += 1
+        m_off = ip - m_pos
+        ip += m_len
+        ii = ip
+
+        if m_len <= 8 and m_off <= 0x800:
+            # M2
+            m_off -= 1
+            out.append(((m_len - 1) << 5) | ((m_off & 7) << 2))
+            out.append(m_off >> 3)
+            continue
+        if m_off <= 0x4000:
+            # M3
+            m_off -= 1
+            marker, short_len = 32, 33
+        else:
+            # M4
+            m_off -= 0x4000
+            marker, short_len = 16 | ((m_off >> 11) & 8), 9
+        if m_len <= short_len:
+            out.append(marker | (m_len - 2))
+        else:
+            m_len -= short_len
+            zeros = (m_len - 1) // 255
+            out.append(marker)
+            out += bytes(zeros)
+            out.append(m_len - 255 * zeros)
+        out.append((m_off << 2) & 0xFF)
+        out.append((m_off >> 6) & 0xFF)
+    return end - ii
+
 def _xbox_lzo_peek_header(data: bytes, want: int = 64) -> bytes:
     """Fast extraction of the RW chunk header from an Xbox LZO stream.
 
@@ -462,7 +633,7 @@ def _xbox_lzo_peek_header(data: bytes, want: int = 64) -> bytes:
         return bytes(out)
 
 
-def _xbox_lzo_decompress_entry(data: bytes) -> bytes:
+def _xbox_lzo_decompress_entry(data: bytes) -> bytes: #vers 2
     """Decompress an Xbox LZO-compressed entry (GTA III/VC Xbox).
 
     Stream layout:
@@ -493,7 +664,7 @@ def _xbox_lzo_decompress_entry(data: bytes) -> bytes:
         _has_lzo = False
 
     pos = 12  # skip master header
-    out = bytearray()
+    parts = []
     while pos + 12 <= len(data):
         _always, decomp_sz, comp_sz = struct.unpack_from('<III', data, pos)
         pos += 12
@@ -505,16 +676,67 @@ def _xbox_lzo_decompress_entry(data: bytes) -> bytes:
         # Always LZO compressed (comp_sz == decomp_sz is normal for GTA Xbox)
         if _has_lzo:
             try:
-                out.extend(_lzo.decompress(block, False, decomp_sz))
+                parts.append(_lzo.decompress(block, False, decomp_sz))
                 continue
             except Exception:
                 pass
         try:
-            out.extend(_lzo1x_decompress(block, decomp_sz))
+            parts.append(_lzo1x_decompress(block, decomp_sz))
         except Exception:
-            out.extend(block)  # best-effort on decompressor failure
-
-    return bytes(out)
+            parts.append(bytes(block))  # best-effort on decompressor failure
+
+    # Most entries are a single block - hand that back without another copy
+    return parts[0] if len(parts) == 1 else b''.join(parts)
+
+
+def _xbox_lzo_compress_entry(data: bytes, block_size: int = _XBOX_LZO_BLOCK_SIZE) -> bytes: #vers 1
+    """LZO-compress an entry into the Xbox stream layout that
+    _xbox_lzo_decompress_entry reads: master header, one block per
+    block_size bytes (each an independent LZO1X-1 stream), then an empty
+    block as the end marker. The master header checksum is written as 0 -
+    nothing reading these streams checks it."""
+    blocks = [data[pos:pos + block_size] for pos in range(0, len(data), block_size)]
+    return _xbox_lzo_frame([len(block) for block in blocks],
+                           [_lzo1x_compress(block) for block in blocks])
+
+
+def _xbox_lzo_frame(sizes: List[int], packed: List[bytes]) -> bytes: #vers 1
+    """Master header + block headers around already compressed blocks."""
+    body = bytearray()
+    for size, block in zip(sizes, packed):
+        body += struct.pack('<III', 4, size, len(block))
+        body += block
+    body += struct.pack('<III', 4, 0, 0)
+    return struct.pack('<III', _XBOX_LZO_MAGIC, 0, len(body)) + bytes(body)
+
+
+def _xbox_lzo_compress_all(payloads: List[bytes], parallel: bool = True) -> List[bytes]: #vers 1
+    """_xbox_lzo_compress_entry over several entries. With parallel and at
+    least _LZO_POOL_MIN_BYTES of input, the blocks of all entries are
+    compressed on a process pool; otherwise (or if the pool can't start)
+    inline."""
+    size = _XBOX_LZO_BLOCK_SIZE
+    blocks = [bytes(data[pos:pos + size]) for data in payloads for pos in range(0, len(data), size)]
+    workers = min(os.cpu_count() or 1, len(blocks))
+    packed = None
+    if parallel and workers > 1 and sum(map(len, payloads)) >= _LZO_POOL_MIN_BYTES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as pool:
+                packed = list(pool.map(_lzo1x_compress, blocks, chunksize=4))
+        except (OSError, RuntimeError) as e:
+            img_debugger.warning(f"LZO process pool unavailable, compressing inline: {e}")
+    if packed is None:
+        packed = [_lzo1x_compress(block) for block in blocks]
+
+    results = []
+    first = 0
+    for data in payloads:
+        count = -(-len(data) // size)
+        results.append(_xbox_lzo_frame([len(block) for block in blocks[first:first + count]],
+                                       packed[first:first + count]))
+        first += count
+    return results
 
 
 def _is_xbox_lzo(data: bytes) -> bool:
@@ -566,7 +788,7 @@ def _scan_rw_version(data: bytes):
 class IMGEntry:
     """Represents a single file entry within an IMG archive - FIXED WITH RW VERSION DETECTION"""
     
-    def __init__(self): #vers 4
+    def __init__(self): #vers 6
         self.name: str = ""
         self.extension: str = ""
         self.offset: int = 0          # Offset in bytes
@@ -583,20 +805,24 @@ class IMGEntry:
         self.is_readonly: bool = False
         self.flags: int = 0
         self.compression_level = 0
+        self.content_hash: int = 0    # IMGFile.hash_entries(), 0 = not computed
 
         # Internal data cache
         self._cached_data: Optional[bytes] = None
         self._img_file: Optional['IMGFile'] = None
         self._version_detected: bool = False # ADDED: Track if version was detected
+        self._rw_scanned: bool = False       # header read attempted (found or not)
     
     def set_img_file(self, img_file: 'IMGFile'): #vers 1
         """Set reference to parent IMG file"""
         self._img_file = img_file
 
-    def detect_file_type_and_version(self): #vers 4
+    def detect_file_type_and_version(self, detect_rw: bool = True): #vers 5
         """Detect file type and RW version. Robust against garbage bytes after the null
         terminator or after the extension in DIR entry name fields.
 
+        detect_rw=False sets the type only; IMGFile.detect_rw_versions() then
+        reads the headers of many entries in one offset-ordered sweep.
         """
         try:
             self.name = _parse_entry_name(self.name.encode('ascii', errors='replace'))
@@ -630,17 +856,18 @@ class IMGEntry:
                 self.file_type = FileType.UNKNOWN
 
             # RW version detection — skipped during bulk load (expensive: disk I/O + LZO)
-            if self.extension in ['DFF', 'TXD'] and not self._version_detected:
+            if detect_rw and self.extension in ['DFF', 'TXD'] and not self._version_detected:
                 self._detect_rw_version()
 
         except Exception as e:
             img_debugger.error(f"Error detecting file type for {self.name}: {e}")
 
-    def _detect_rw_version(self): #vers 2
+    def _detect_rw_version(self): #vers 3
         """Detect RenderWare version from file header - scans for valid version across known offsets"""
         try:
             if not self._img_file or not self._img_file.file_path:
                 return
+            self._rw_scanned = True
 
             # Read enough bytes to cover standard + prefixed layouts
             file_data = self._read_header_data(64)
@@ -687,9 +914,12 @@ class IMGEntry:
                 img_debugger.error(f"Error detecting RW version for {self.name}: {e}")
             return False
 
-    def _read_header_data(self, bytes_to_read: int) -> Optional[bytes]: #vers 4
+    def _read_header_data(self, bytes_to_read: int) -> Optional[bytes]: #vers 5
         """Read file header data from the data portion of the IMG archive.
 
+        Goes through the archive's mapped files (IMGFile._read_raw), so a
+        scan over every entry does not open the archive once per entry.
+
         For Xbox LZO entries only the first ~512 bytes of the compressed stream
         are read.  The RW chunk header (12 bytes) is always encoded as a literal
         run in the first LZO instruction, so we only need to decompress the very
@@ -699,33 +929,18 @@ class IMGEntry:
             if not self._img_file or not self._img_file.file_path:
                 return None
 
-            file_path = self._img_file.file_path
-
-            # V1-family opened via .dir: data lives in the companion .img file
-            if (self._img_file.version in (IMGVersion.VERSION_1,
-                                           IMGVersion.VERSION_1_5,
-                                           IMGVersion.VERSION_SOL)
-                    and file_path.lower().endswith('.dir')):
-                img_path = _find_companion(file_path, '.img')
-                if not img_path:
-                    return None
-                file_path = img_path
-
             is_xbox = (getattr(self._img_file, 'platform', None) == IMGPlatform.XBOX)
 
             # For Xbox: only read 512 bytes — the RW header is always in the first
             # LZO literal run (~30-50 compressed bytes).  No need to read 64 KB.
-            read_size = min(self.size, 512) if is_xbox else min(self.size, bytes_to_read + 256)
-
-            with open(file_path, 'rb') as f:
-                f.seek(self.offset)
-                raw = f.read(read_size)
+            read_size = 512 if is_xbox else bytes_to_read + 256
+            raw = self._img_file._read_raw(self, read_size)
 
             # Decompress just enough of the LZO stream to extract the RW header
             if is_xbox and _is_xbox_lzo(raw):
                 raw = _xbox_lzo_peek_header(raw, bytes_to_read)
 
-            return raw[:bytes_to_read]
+            return bytes(raw[:bytes_to_read])
 
         except Exception as e:
             img_debugger.error(f"Error reading header data for {self.name}: {e}")
@@ -1024,12 +1239,11 @@ def _parse_entry_name(raw_name_bytes: bytes) -> str:
     dot_pos = s.rfind('.')
     if dot_pos > 0:
         after_dot = s[dot_pos + 1:dot_pos + 5].lower()
-        for ext in sorted(_KNOWN_GTA_EXTENSIONS, key=len, reverse=True):
-            if after_dot.startswith(ext):
-                return s[:dot_pos + 1 + len(ext)]
+        for length in _KNOWN_EXTENSION_LENGTHS:  # longest known extension first
+            if after_dot[:length] in _KNOWN_GTA_EXTENSIONS:
+                return s[:dot_pos + 1 + length]
     # No known extension: keep only filename-safe characters
-    import re as _re
-    m = _re.match(r'^[A-Za-z0-9_\-@+.]+', s)
+    m = _SAFE_NAME_RE.match(s)
     return m.group(0) if m else s
 
 
@@ -1038,15 +1252,278 @@ def _is_valid_rw_version(v: int) -> bool:
     from apps.methods.rw_versions import is_valid_rw_version as _canonical
     return _canonical(v)
 
+
+class _MappedFile: #vers 1
+    """One backing file of an IMGFile, opened once and mapped read-only.
+
+    view() returns zero-copy memoryview slices of the mapping. Files that
+    cannot be mapped (empty, or too large for the address space) are read
+    through the same persistent handle instead. stale() is True once the file
+    size changed underneath us (e.g. another tool rewrote the archive) -
+    touching pages past a truncated end would fault, so callers re-map.
+    """
+
+    def __init__(self, path: str): #vers 1
+        self.path = path
+        self._file = open(path, 'rb')
+        self._lock = threading.Lock()
+        self._map = None
+        self._view = None
+        self.size = os.fstat(self._file.fileno()).st_size
+        if self.size:
+            try:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._map)
+            except (OSError, ValueError, OverflowError):
+                self._map = None
+
+    def stale(self) -> bool: #vers 1
+        try:
+            return os.fstat(self._file.fileno()).st_size != self.size
+        except (OSError, ValueError):
+            return True
+
+    def view(self, offset: int, size: int) -> memoryview: #vers 1
+        if self._view is not None:
+            return self._view[offset:offset + size]
+        with self._lock:
+            self._file.seek(offset)
+            return memoryview(self._file.read(size))
+
+    def close(self): #vers 1
+        """Unmap and close. Views still held by callers keep the mapping
+        alive until they are released; only the handle is closed then."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+            self._map = None
+        self._file.close()
+
+
+def _thread_alive(thread: QThread) -> bool: #vers 1
+    """isRunning() of a QThread that may already have been deleted."""
+    try:
+        return thread.isRunning()
+    except RuntimeError:
+        return False
+
+
+def _copy_range(src: BinaryIO, dst: BinaryIO, offset: int, count: int) -> int: #vers 1
+    """Copy count bytes at offset of src to the current position of dst
+    without passing them through Python where the OS allows it
+    (os.copy_file_range, then os.sendfile, then 1 MB chunks). Leaves dst
+    positioned after the copied bytes; returns how many were copied (fewer
+    if src ends early)."""
+    dst.flush()
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    start = dst.tell()
+    copied = 0
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    sendfile = getattr(os, 'sendfile', None)
+    while copied < count:
+        try:
+            if copy_file_range is not None:
+                n = copy_file_range(src_fd, dst_fd, count - copied, offset + copied, start + copied)
+            elif sendfile is not None:
+                os.lseek(dst_fd, start + copied, os.SEEK_SET)
+                n = sendfile(dst_fd, src_fd, offset + copied, count - copied)
+            else:
+                src.seek(offset + copied)
+                chunk = src.read(min(_COPY_CHUNK, count - copied))
+                dst.seek(start + copied)
+                dst.write(chunk)
+                dst.flush()
+                n = len(chunk)
+        except OSError:
+            # Not supported for this pair of files - drop to the next method
+            if copy_file_range is not None:
+                copy_file_range = None
+            elif sendfile is not None:
+                sendfile = None
+            else:
+                raise
+            continue
+        if n <= 0:
+            break
+        copied += n
+    dst.seek(start + copied)
+    return copied
+
+
+def _journal_path(img_path: str) -> str: #vers 1
+    """Save journal of an archive's data file (see _write_journal)."""
+    return img_path + '.journal'
+
+
+def _write_journal(journal_path: str, files: List[tuple]): #vers 1
+    """Record what an in-place save is about to overwrite.
+
+    files is [(path, runs)], runs a list of (offset, length) or None for
+    the whole file. The current size of each file and the bytes of every
+    run (clipped to that size) are written and synced before the caller
+    touches the files; _rollback_journal puts them back. Raises OSError.
+    """
+    meta = []
+    blobs = []
+    for path, runs in files:
+        size = os.path.getsize(path) if os.path.exists(path) else -1
+        if runs is None:
+            runs = [(0, max(size, 0))]
+        kept = []
+        if size > 0:
+            with open(path, 'rb') as f:
+                for offset, length in runs:
+                    length = min(length, size - offset)
+                    if length > 0:
+                        f.seek(offset)
+                        blobs.append(f.read(length))
+                        kept.append([offset, length])
+        meta.append({'path': os.path.abspath(path), 'size': size, 'runs': kept})
+    header = json.dumps(meta).encode('utf-8')
+    with open(journal_path, 'wb') as f:
+        f.write(_JOURNAL_MAGIC + struct.pack('<I', len(header)) + header)
+        for blob in blobs:
+            f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _rollback_journal(journal_path: str) -> bool: #vers 1
+    """Restore the files recorded by _write_journal (an in-place save that
+    did not finish) and delete the journal. False if there is none or it
+    is incomplete - an incomplete journal means nothing was written yet."""
+    try:
+        with open(journal_path, 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return False
+    try:
+        if blob[:4] != _JOURNAL_MAGIC:
+            raise ValueError("bad journal")
+        header_size = struct.unpack_from('<I', blob, 4)[0]
+        meta = json.loads(blob[8:8 + header_size].decode('utf-8'))
+        pos = 8 + header_size
+        if len(blob) != pos + sum(length for item in meta for _, length in item['runs']):
+            raise ValueError("incomplete journal")
+    except (ValueError, struct.error):
+        os.remove(journal_path)
+        return False
+
+    for item in meta:
+        if item['size'] < 0:
+            if os.path.exists(item['path']):
+                os.remove(item['path'])
+            continue
+        with open(item['path'], 'r+b' if os.path.exists(item['path']) else 'w+b') as f:
+            for offset, length in item['runs']:
+                f.seek(offset)
+                f.write(blob[pos:pos + length])
+                pos += length
+            f.truncate(item['size'])
+            f.flush()
+            os.fsync(f.fileno())
+    os.remove(journal_path)
+    img_debugger.warning(f"Rolled back an unfinished save from {journal_path}")
+    return True
+
+
+class SectorAllocator: #vers 1
+    """Free list of sector runs in an IMG data file.
+
+    Built from the runs in use (start, count); the gaps between them, and
+    between the last one and end, are the holes - kept sorted and merged.
+    allocate() takes the first hole that fits, else grows the file end;
+    free() hands a run back.
+    """
+
+    def __init__(self, used, end: int = 0): #vers 1
+        self.holes = []
+        pos = 0
+        for start, count in sorted(run for run in used if run[1] > 0):
+            if start > pos:
+                self.holes.append([pos, start - pos])
+            pos = max(pos, start + count)
+        if end > pos:
+            self.holes.append([pos, end - pos])
+        self.end = max(pos, end)
+
+    @property
+    def free_sectors(self) -> int: #vers 1
+        return sum(count for _, count in self.holes)
+
+    def allocate(self, count: int) -> int: #vers 1
+        """Start sector of a new run of count sectors."""
+        for i, hole in enumerate(self.holes):
+            if hole[1] >= count:
+                start = hole[0]
+                if hole[1] == count:
+                    del self.holes[i]
+                else:
+                    hole[0] += count
+                    hole[1] -= count
+                return start
+        # Nothing fits - grow the file, reusing a hole that ends it
+        holes = self.holes
+        if holes and holes[-1][0] + holes[-1][1] == self.end:
+            start = holes.pop()[0]
+        else:
+            start = self.end
+        self.end = start + count
+        return start
+
+    def free(self, start: int, count: int): #vers 1
+        """Return a run to the free list, merging it with adjacent holes."""
+        if count <= 0:
+            return
+        holes = self.holes
+        i = bisect.bisect_left(holes, [start, 0])
+        if i > 0 and holes[i - 1][0] + holes[i - 1][1] == start:
+            i -= 1
+            holes[i][1] += count
+        else:
+            holes.insert(i, [start, count])
+        if i + 1 < len(holes) and holes[i][0] + holes[i][1] == holes[i + 1][0]:
+            holes[i][1] += holes.pop(i + 1)[1]
+
+
+class RWVersionScanner(QThread): #vers 1
+    """Background RW version detection for one IMGFile.
+
+    Runs IMGFile.detect_rw_versions() over the given entries and emits
+    versions_ready(list_of_entries) per batch; the IMGEntry objects are
+    already updated when the signal arrives.
+    """
+
+    versions_ready = pyqtSignal(list)
+
+    def __init__(self, img_file: 'IMGFile', entries: List['IMGEntry']): #vers 1
+        super().__init__()
+        self.img_file = img_file
+        self.entries = entries
+
+    def run(self): #vers 1
+        try:
+            self.img_file.detect_rw_versions(self.entries,
+                                             on_batch=self.versions_ready.emit,
+                                             should_stop=self.isInterruptionRequested)
+        except Exception as e:
+            img_debugger.error(f"Background RW version scan failed: {e}")
+
+
 class IMGFile:
     """Main IMG archive file handler - FIXED WITH PLATFORM SUPPORT"""
     
-    def __init__(self, file_path: str = ""): #vers 5
+    def __init__(self, file_path: str = ""): #vers 14
         self.file_path: str = file_path
         self.version: IMGVersion = IMGVersion.UNKNOWN
         self.platform: IMGPlatform = IMGPlatform.UNKNOWN  # ADDED: Platform detection
         self.platform_specs: Dict[str, Any] = {}  # ADDED: Platform-specific specs
-        self.entries: List[IMGEntry] = []
+        self.entries: List[IMGEntry] = []  # property - see entries below
         self.is_open: bool = False
         self.total_size: int = 0
         self.creation_time: Optional[float] = None
@@ -1055,7 +1532,213 @@ class IMGFile:
         # File handles
         self._img_handle: Optional[BinaryIO] = None
         self._dir_handle: Optional[BinaryIO] = None
-    
+
+        # Mapped reads: each backing file opened + mmapped once (see
+        # _mapped_file), companion paths resolved once. Dropped on rebuild.
+        self.mmap_reads: bool = True
+        self._mapped: Dict[str, _MappedFile] = {}
+        self._data_paths: Dict[str, str] = {}
+        self._map_lock = threading.Lock()
+
+        # RW version detection: in the type pass (default) or, when set before
+        # the entries are first read, by start_rw_detection() on a QThread, or
+        # only for the table rows scrolled into view (lazy_rw_detection)
+        self.background_rw_detection: bool = False
+        self.lazy_rw_detection: bool = False
+        self.rw_scanner: Optional['RWVersionScanner'] = None
+
+        # Other QThreads reading entries (add_background_reader) - stopped
+        # with the RW scan before the archive is rewritten or closed
+        self._background_readers: List[QThread] = []
+
+        # Sidecar index: open() restores directory, types and RW versions
+        # from it while the archive is unchanged (see save_index)
+        self.use_index: bool = True
+        self._indexed_count: int = -1
+
+        # Lower-case name -> entry map behind get_entry / add_entry & co,
+        # plus the end of the last entry's data (see _name_index)
+        self._names: Optional[Dict[str, IMGEntry]] = None
+        self._names_source = (None, 0)
+        self._names_dups: bool = False
+        self._data_end: int = 0
+
+        # save_img_file() writes changed entries into the existing archive
+        # (see _save_in_place) and only falls back to a full rebuild
+        self.in_place_save: bool = True
+
+        # Saving to an Xbox archive LZO-compresses pending entries
+        # (_pending_data) - on a process pool when there is enough of it
+        self.parallel_compress: bool = True
+
+        # Decompressed Xbox LZO entries are kept in the process-wide
+        # LRU (apps/methods/lzo_entry_cache.py)
+        self.cache_lzo_entries: bool = True
+
+    @property
+    def entries(self) -> List[IMGEntry]: #vers 2
+        """Entry list, built on first access after open().
+
+        The openers only read the directory table (one read) and keep it
+        raw; the IMGEntry objects are decoded from it here, and the per-entry
+        type / RW version pass (_parse_all_entries) runs on this first access
+        too. Opening an archive therefore costs one directory read. When
+        open() found a valid sidecar index the entries are built from its
+        records instead and need no pass at all.
+        """
+        if self._index_records is not None:
+            records, self._index_records = self._index_records, None
+            self._entries.extend(self._entries_from_index(records))
+            self._indexed_count = len(self._entries)
+            # An index saved before a background / lazy scan finished
+            if (not (self.background_rw_detection or self.lazy_rw_detection)
+                    and self.pending_rw_entries(self._entries)):
+                self.detect_rw_versions(self._entries)
+                self.save_index()
+        if self._directory_table is not None:
+            table, sector_size = self._directory_table
+            self._directory_table = None
+            self._entries.extend(self._entries_from_table(table, sector_size))
+        if self._entries_pending:
+            self._entries_pending = False
+            self._parse_all_entries()
+        return self._entries
+
+    @entries.setter
+    def entries(self, value: List[IMGEntry]): #vers 2
+        self._entries = value
+        self._directory_table = None
+        self._index_records = None
+        self._entries_pending = False
+
+    def _entries_from_table(self, table: bytes, sector_size: int = 2048) -> List[IMGEntry]: #vers 1
+        """IMGEntry objects for a raw V1 / VER2 directory table (32-byte rows)."""
+        entries = []
+        table = memoryview(table)[:len(table) // _DIR_ENTRY.size * _DIR_ENTRY.size]
+        for entry_offset, entry_size, raw_name in _DIR_ENTRY.iter_unpack(table):
+            entry_name = _parse_entry_name(raw_name)
+            if entry_name:
+                entry = IMGEntry()
+                entry.name = entry_name
+                entry.offset = entry_offset * sector_size  # Convert sectors to bytes
+                entry.size = entry_size * sector_size
+                entry.set_img_file(self)
+                entries.append(entry)
+        return entries
+
+    def _entries_from_index(self, records: list) -> List[IMGEntry]: #vers 1
+        """IMGEntry objects for sidecar index records, types and RW versions
+        already filled in."""
+        entries = []
+        lzo = CompressionType.LZO
+        # Few distinct suffixes / types / versions per archive - resolve each once
+        extensions, file_types, version_names = {}, {}, {}
+        for name, offset, size, file_type, rw_version, flags, content_hash in records:
+            entry = IMGEntry()
+            entry.name = name
+            suffix = name.rsplit('.', 1)[-1] if '.' in name else None
+            extension = extensions.get(suffix)
+            if extension is None:
+                extension = extensions[suffix] = (
+                    ''.join(c for c in suffix.upper() if c.isalpha()) if suffix is not None else "NO_EXT")
+            entry.extension = extension
+            entry.file_type = file_types.get(file_type) or file_types.setdefault(file_type, FileType(file_type))
+            entry.offset = offset
+            entry.size = size
+            if flags & img_index.FLAG_LZO:
+                entry.compression_type = lzo
+            entry._rw_scanned = bool(flags & img_index.FLAG_RW_SCANNED)
+            if flags & img_index.FLAG_RW_DETECTED:
+                entry.rw_version = rw_version
+                version_name = version_names.get(rw_version)
+                if version_name is None:
+                    version_name = version_names[rw_version] = get_rw_version_name(rw_version)
+                entry.rw_version_name = version_name
+                entry._version_detected = True
+            entry.content_hash = content_hash
+            entry._img_file = self
+            entries.append(entry)
+        return entries
+
+    def _index_files(self) -> List[str]: #vers 1
+        """Every file the entries are read from: the archive and, for a
+        DIR/IMG pair, its companion."""
+        files = [self.file_path]
+        if self.version in (IMGVersion.VERSION_1, IMGVersion.VERSION_1_5,
+                            IMGVersion.VERSION_SOL, IMGVersion.VERSION_XBOX):
+            for ext in ('.dir', '.img'):
+                companion = _find_companion(self.file_path, ext)
+                if companion and os.path.abspath(companion) != os.path.abspath(self.file_path):
+                    files.append(companion)
+        return files
+
+    def _load_index(self) -> bool: #vers 1
+        """Restore version, platform and entries from the sidecar index if
+        one matches the archive's current size / mtime. Entries are built on
+        first access to self.entries."""
+        loaded = img_index.load_index(self.file_path)
+        if loaded is None:
+            return False
+        meta, records = loaded
+        try:
+            version = IMGVersion[meta['version']]
+            platform = IMGPlatform(meta['platform'])
+        except (KeyError, ValueError):
+            return False
+        if version not in _INDEXED_VERSIONS:
+            return False
+        self.version = version
+        self.platform = platform
+        self.platform_specs = meta.get('platform_specs') or get_platform_specific_specs(platform)
+        self.entries = []
+        self._index_records = records
+        return True
+
+    def save_index(self) -> bool: #vers 1
+        """Write the sidecar index of the archive as opened: directory,
+        platform, per-entry type, RW version and content hash. Skipped for
+        formats that aren't table based and while the entry list holds
+        changes that are not on disk yet."""
+        if not (self.use_index and self.is_open and self.version in _INDEXED_VERSIONS):
+            return False
+        if self._index_records is not None or self._directory_table is not None or self._entries_pending:
+            return False
+        entries = self._entries
+        if len(entries) != self._indexed_count or any(
+                e.is_new_entry or e.is_replaced or e._cached_data is not None for e in entries):
+            return False
+        records = []
+        for e in entries:
+            flags = 0
+            if e._rw_scanned:
+                flags |= img_index.FLAG_RW_SCANNED
+            if e._version_detected:
+                flags |= img_index.FLAG_RW_DETECTED
+            if e.compression_type == CompressionType.LZO:
+                flags |= img_index.FLAG_LZO
+            file_type = e.file_type.value if isinstance(e.file_type, FileType) else FileType.UNKNOWN.value
+            records.append((e.name, e.offset, e.size, file_type,
+                            e.rw_version if e._version_detected else 0, flags, e.content_hash))
+        meta = {'version': self.version.name, 'platform': self.platform.value,
+                'platform_specs': self.platform_specs}
+        return img_index.save_index(self.file_path, self._index_files(), meta, records)
+
+    def hash_entries(self, entries: Optional[List[IMGEntry]] = None) -> int: #vers 1
+        """Fill content_hash (64-bit BLAKE2b of the stored bytes) of entries
+        not hashed yet, then update the sidecar index. Returns the number of
+        entries hashed."""
+        done = 0
+        for entry in (self.entries if entries is None else entries):
+            if entry.content_hash:
+                continue
+            data = self._read_raw(entry)
+            digest = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+            entry.content_hash = digest or 1
+            done += 1
+        if done:
+            self.save_index()
+        return done
+
     def create_new(self, output_path: str, version: IMGVersion, **options) -> bool: #vers 2
         """Create new IMG file with specified parameters"""
         try:
@@ -1096,12 +1779,16 @@ class IMGFile:
             print(f"Error creating IMG file: {e}")
             return False
 
-    def save_img_file(self) -> bool: #vers 2
+    def save_img_file(self) -> bool: #vers 3
         """Save IMG file with current entries"""
         try:
             if not self.file_path or not self.entries:
                 return False
 
+            # Changed entries only + directory, when the format allows it
+            if self.in_place_save and self._save_in_place():
+                return True
+
             # Create backup first
             import shutil
             backup_path = self.file_path + '.backup'
@@ -1113,18 +1800,201 @@ class IMGFile:
         except Exception as e:
             return False
 
-    def save(self, file_path=None): #vers 1
+    def _stored_runs(self, dir_path: str, is_v2: bool) -> Optional[tuple]: #vers 2
+        """({start sector: sector count}, {(start sector, lower-case name)})
+        of every entry in the directory as it is on disk, or None if it
+        can't be read. The second set tells which entry owns a run."""
+        try:
+            with open(dir_path, 'rb') as f:
+                if is_v2:
+                    header = f.read(8)
+                    if len(header) < 8 or header[:4] != b'VER2':
+                        return None
+                    table = f.read(struct.unpack_from('<I', header, 4)[0] * _DIR_ENTRY.size)
+                else:
+                    table = f.read()
+        except OSError:
+            return None
+        runs = {}
+        owners = set()
+        table = memoryview(table)[:len(table) // _DIR_ENTRY.size * _DIR_ENTRY.size]
+        for start, count, name in _DIR_ENTRY.iter_unpack(table):
+            if count > runs.get(start, -1):
+                runs[start] = count
+            owners.add((start, name.split(b'\0', 1)[0].decode('ascii', 'replace').lower()))
+        return runs, owners
+
+    def _dir_img_paths(self) -> tuple: #vers 2
+        """(directory file, data file) of a V1 DIR+IMG pair - either may be
+        '' if missing - or (file_path, file_path) for VER2."""
+        if self.version in _VER2_LAYOUT_VERSIONS:
+            return self.file_path, self.file_path
+        if self.file_path.lower().endswith('.dir'):
+            return self.file_path, _find_companion(self.file_path, '.img')
+        return _find_companion(self.file_path, '.dir'), self.file_path
+
+    def _directory_rows(self) -> List[bytes]: #vers 1
+        """Packed 32-byte directory rows of the current entries, sanitizing
+        names as they go."""
+        rows = []
+        for entry in self.entries:
+            clean_name = self._sanitize_filename(entry.name)
+            if clean_name != entry.name:
+                print(f"[CORRUPTION FIX] '{entry.name}' -> '{clean_name}'")
+                entry.name = clean_name
+                self._names = None
+            rows.append(_DIR_ENTRY.pack(entry.offset // _SECTOR_SIZE, -(-entry.size // _SECTOR_SIZE),
+                                        clean_name.encode('ascii', errors='replace')[:24]))
+        return rows
+
+    def _pending_data(self, entries: List[IMGEntry]) -> Dict[int, bytes]: #vers 1
+        """{id(entry): bytes to store} of the entries with pending data
+        (_cached_data). On Xbox these are LZO compressed first
+        (_xbox_lzo_compress_all, parallel when parallel_compress) unless
+        they already are an LZO stream."""
+        pending = {id(entry): entry._cached_data for entry in entries
+                   if entry._cached_data is not None}
+        if self.platform == IMGPlatform.XBOX:
+            raw = [entry for entry in entries
+                   if entry._cached_data is not None and not _is_xbox_lzo(entry._cached_data)]
+            packed = _xbox_lzo_compress_all([entry._cached_data for entry in raw],
+                                            self.parallel_compress)
+            for entry, data in zip(raw, packed):
+                pending[id(entry)] = data
+                entry.compression_type = CompressionType.LZO
+        return pending
+
+    def _save_in_place(self) -> bool: #vers 5
+        """Save by updating the existing archive instead of rebuilding it.
+
+        Entries with pending data (_cached_data) that still fit their own
+        run on disk (same name at the same start sector in the stored
+        directory; never for is_new_entry) are overwritten there; grown and
+        new entries go to a free hole or the end of the file
+        (SectorAllocator). VER2 entries in the way of a grown directory are
+        moved the same way. Xbox entries are stored LZO compressed
+        (_pending_data). Everything about to be overwritten - those runs,
+        the directory and the file size - goes to a journal first
+        (_write_journal); an interrupted save is rolled back by the next
+        open(). Returns False without writing anything when the archive
+        can't be updated in place (standalone V1, unaligned entries, other
+        formats).
+        """
+        if self.version not in _IN_PLACE_VERSIONS:
+            return False
+        is_v2 = self.version in _VER2_LAYOUT_VERSIONS
+        dir_path, img_path = self._dir_img_paths()
+        if not dir_path or not img_path or not os.path.isfile(img_path):
+            return False
+        stored = self._stored_runs(dir_path, is_v2)
+        if stored is None:
+            return False
+        stored, owners = stored
+
+        entries = self.entries
+        pending = self._pending_data(entries)
+        sector = _SECTOR_SIZE
+        dir_sectors = -(-(8 + len(entries) * _DIR_ENTRY.size) // sector) if is_v2 else 0
+        used = [(0, dir_sectors)]
+        writes = []     # (entry, start sector, data)
+        moves = []      # (entry, data or None to copy the stored run, sectors)
+        for entry in entries:
+            start, unaligned = divmod(entry.offset, sector)
+            data = pending.get(id(entry))
+            if data is None:
+                if unaligned:
+                    return False
+                count = stored.get(start, -(-entry.size // sector))
+                if start < dir_sectors:
+                    moves.append((entry, None, count))
+                else:
+                    used.append((start, count))
+            else:
+                count = -(-len(data) // sector)
+                own_run = (not unaligned and not entry.is_new_entry and start >= dir_sectors and
+                           (start, entry.name.lower()) in owners)
+                if own_run and count <= stored[start]:
+                    used.append((start, count))
+                    writes.append((entry, start, data))
+                else:
+                    moves.append((entry, data, count))
+
+        self.invalidate_mappings()
+        journal = _journal_path(img_path)
+        previous = [(entry.offset, entry.size) for entry in entries]
+        with open(img_path, 'r+b') as f:
+            allocator = SectorAllocator(used, -(-os.fstat(f.fileno()).st_size // sector))
+            # Runs being moved are read before anything is written
+            for entry, data, count in moves:
+                if data is None:
+                    f.seek(entry.offset)
+                    data = f.read(count * sector)
+                writes.append((entry, allocator.allocate(count), data))
+
+            runs = [(start * sector, -(-len(data) // sector) * sector) for _, start, data in writes]
+            if is_v2:
+                runs.append((0, 8 + len(entries) * _DIR_ENTRY.size))
+            try:
+                _write_journal(journal, [(img_path, runs)] + ([] if is_v2 else [(dir_path, None)]))
+            except OSError as e:
+                # No safety net - leave it to the (atomic) rebuild
+                img_debugger.warning(f"Can't write save journal, rebuilding instead: {e}")
+                return False
+            try:
+                for entry, start, data in writes:
+                    f.seek(start * sector)
+                    f.write(data)
+                    pad = -len(data) % sector
+                    if pad:
+                        f.write(b'\x00' * pad)
+                    entry.offset = start * sector
+                    if id(entry) in pending:
+                        entry.size = len(data)
+
+                rows = self._directory_rows()
+                if is_v2:
+                    f.seek(0)
+                    f.write(b'VER2' + struct.pack('<I', len(rows)) + b''.join(rows))
+                f.flush()
+                os.fsync(f.fileno())
+                if not is_v2:
+                    with open(dir_path, 'wb') as d:
+                        d.write(b''.join(rows))
+                        d.flush()
+                        os.fsync(d.fileno())
+            except Exception:
+                f.close()
+                _rollback_journal(journal)
+                for entry, (offset, size) in zip(entries, previous):
+                    entry.offset, entry.size = offset, size
+                raise
+        os.remove(journal)
+
+        for entry in entries:
+            entry._cached_data = None
+        if moves:
+            # Offsets changed - _data_end (next add_entry offset) is stale
+            self._names = None
+        return True
+
+    def save(self, file_path=None): #vers 2
         """Save IMG file - wrapper for save_img_file()"""
-        if file_path:
+        if file_path and os.path.abspath(file_path) != os.path.abspath(self.file_path or ''):
+            # Saving as another file - always a full rebuild
             self.file_path = file_path
+            in_place, self.in_place_save = self.in_place_save, False
+            try:
+                return self.save_img_file()
+            finally:
+                self.in_place_save = in_place
         return self.save_img_file()
 
-    def rebuild_img_file(self) -> bool: #vers 1
+    def rebuild_img_file(self) -> bool: #vers 3
         """Rebuild IMG file based on version"""
         try:
-            if self.version == IMGVersion.VERSION_1:
+            if self.version in (IMGVersion.VERSION_1, IMGVersion.VERSION_1_5, IMGVersion.VERSION_XBOX):
                 return self._rebuild_version1()
-            elif self.version == IMGVersion.VERSION_2:
+            elif self.version in (IMGVersion.VERSION_2, IMGVersion.VERSION_SA_ANDROID):
                 return self._rebuild_version2()
             else:
                 return False
@@ -1154,144 +2024,236 @@ class IMGFile:
             return f"file_{len(self.entries):04d}.dat"
 
 
-    def _rebuild_version2(self) -> bool: #vers 1
+    def _rebuild_version2(self) -> bool: #vers 4
         """Rebuild Version 2 IMG file (SA format)"""
-        try:
-            import struct
-            import os
-
-            # Calculate sizes
-            entry_count = len(self.entries)
-            directory_size = entry_count * 32  # 32 bytes per entry
-            data_start = directory_size
+        return self._rebuild_streamed()
 
-            # Collect entry data
-            entry_data_list = []
-            current_offset = data_start
-
-            for entry in self.entries:
-                # Get entry data
-                if hasattr(entry, '_cached_data') and entry._cached_data:
-                    data = entry._cached_data
-                else:
-                    data = self.read_entry_data(entry)
-
-                entry_data_list.append(data)
-
-                # Update entry with new offset/size
-                entry.offset = current_offset
-                entry.size = len(data)
-
-                # Align to sector boundary (2048 bytes)
-                aligned_size = ((len(data) + 2047) // 2048) * 2048
-                current_offset += aligned_size
-
-            # Write new IMG file
-            with open(self.file_path, 'wb') as f:
-                # Write directory
-                for i, entry in enumerate(self.entries):
-                    # Convert to sectors
-                    offset_sectors = entry.offset // 2048
-                    size_sectors = ((entry.size + 2047) // 2048)
-
-                    # Pack entry: offset(4), size(4), name(24)
-                    entry_data = struct.pack('<II', offset_sectors, size_sectors)
-
-                    #name_bytes = entry.name.encode('ascii')[:24].ljust(24, b'\x00')
-                    # CORRUPTION FIX: Sanitize before encoding
-                    clean_name = self._sanitize_filename(entry.name)
-                    if clean_name != entry.name:
-                        print(f"[CORRUPTION FIX] '{entry.name}' Ã¢ÂÂ '{clean_name}'")
-                        entry.name = clean_name
-
-                    name_bytes = clean_name.encode('ascii', errors='replace')[:24]
-                    name_bytes = name_bytes.ljust(24, b'\x00')
-
-                    entry_data += name_bytes
-
-                    f.write(entry_data)
-
-                # Write file data
-                for i, data in enumerate(entry_data_list):
-                    f.seek(self.entries[i].offset)
-                    f.write(data)
-
-                    # Pad to sector boundary
-                    current_pos = f.tell()
-                    sector_end = ((current_pos + 2047) // 2048) * 2048
-                    if current_pos < sector_end:
-                        f.write(b'\x00' * (sector_end - current_pos))
+    def _rebuild_version1(self) -> bool: #vers 3
+        """Rebuild Version 1 IMG file (DIR/IMG pair)"""
+        return self._rebuild_streamed()
+
+    def _rebuild_streamed(self, order: Optional[List[IMGEntry]] = None) -> bool: #vers 3
+        """Rebuild V1 / VER2 into a temp file next to the archive and rename
+        it into place.
+
+        Entries are packed back to back in directory order, or in the data
+        order given by order (the same entries; the directory keeps its
+        order). Pending data
+        (_cached_data) is written from memory; everything else is copied
+        straight from the old archive with _copy_range, so memory use does
+        not grow with the archive. Xbox entries are stored LZO compressed
+        (_pending_data). The old files stay untouched until the new ones
+        are complete.
+        """
+        is_v2 = self.version in _VER2_LAYOUT_VERSIONS
+        dir_path, img_path = self._dir_img_paths()
+        if not img_path:
+            return False
+        if not dir_path:
+            dir_path = img_path[:-4] + '.dir'
+        entries = self.entries
+        if order is None:
+            order = entries
+        elif len(order) != len(entries) or {id(e) for e in order} != {id(e) for e in entries}:
+            return False
+        sector = _SECTOR_SIZE
+        temp_paths = []
+        previous = [(entry.offset, entry.size) for entry in entries]
+
+        def temp_beside(path): #vers 1
+            fd, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.',
+                                             suffix='.tmp', dir=os.path.dirname(os.path.abspath(path)))
+            temp_paths.append(temp_path)
+            if os.path.exists(path):
+                shutil.copymode(path, temp_path)
+            return os.fdopen(fd, 'w+b')
 
-            print(f"Rebuilt IMG file: {entry_count} entries")
+        try:
+            pending = self._pending_data(entries)
+            self.invalidate_mappings()
+            layout = []
+            start = -(-(8 + len(entries) * _DIR_ENTRY.size) // sector) if is_v2 else 0
+            with temp_beside(img_path) as out:
+                with open(img_path, 'rb') as src:
+                    out.seek(start * sector)
+                    for entry in order:
+                        data = pending.get(id(entry))
+                        if data is not None:
+                            out.write(data)
+                            size = len(data)
+                        else:
+                            size = entry.size
+                            _copy_range(src, out, entry.offset, size)
+                        pad = start * sector + size - out.tell() + (-size % sector)
+                        if pad > 0:
+                            out.write(b'\x00' * pad)
+                        layout.append((entry, start * sector, size))
+                        start += -(-size // sector)
+
+                # Directory from the new layout
+                for entry, offset, size in layout:
+                    entry.offset, entry.size = offset, size
+                rows = self._directory_rows()
+                if is_v2:
+                    out.seek(0)
+                    out.write(b'VER2' + struct.pack('<I', len(rows)) + b''.join(rows))
+                out.flush()
+                os.fsync(out.fileno())
+            if not is_v2:
+                with temp_beside(dir_path) as out:
+                    out.write(b''.join(rows))
+                    out.flush()
+                    os.fsync(out.fileno())
+
+            os.replace(temp_paths[0], img_path)
+            if not is_v2:
+                os.replace(temp_paths[1], dir_path)
+            temp_paths.clear()
+            for entry in entries:
+                entry._cached_data = None
+
+            print(f"Rebuilt IMG file: {len(entries)} entries")
             return True
 
         except Exception as e:
+            img_debugger.error(f"IMG rebuild failed: {e}")
+            # Old files are still in place - so is the old layout
+            for entry, (offset, size) in zip(entries, previous):
+                entry.offset, entry.size = offset, size
             return False
+        finally:
+            for temp_path in temp_paths:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
 
-    def _rebuild_version1(self) -> bool: #vers 1
-        """Rebuild Version 1 IMG file (DIR/IMG pair)"""
+    def analyze_fragmentation(self, measure_slack: bool = True) -> Dict[str, Any]: #vers 1
+        """Wasted-space report of the archive's data file.
+
+        holes           - [(offset, size)] byte runs between entries no entry uses
+        tail_bytes      - bytes after the end of the last entry
+        orphaned_bytes  - holes + tail: space compact() gives back
+        slack_bytes     - unused bytes at the end of entries' last sector, for
+                          the DFF / TXD entries whose length the RW header
+                          gives (slack_entries of them); measure_slack=False
+                          skips those header reads
+        overlaps        - entries starting inside another (or the directory)
+        compacted_size  - file size after compact()
+        Empty for formats that aren't a plain directory table.
+        """
+        if self.version not in _INDEXED_VERSIONS:
+            return {}
+        sector = _SECTOR_SIZE
+        entries = self.entries
+        dir_path, img_path = self._dir_img_paths()
         try:
-            import struct
-            import os
-
-            # Get DIR and IMG paths
-            dir_path = self.file_path
-            img_path = self.file_path.replace('.dir', '.img')
-
-            entry_count = len(self.entries)
-
-            # Collect entry data and calculate offsets
-            entry_data_list = []
-            current_offset = 0
-
-            for entry in self.entries:
-                # Get entry data
-                if hasattr(entry, '_cached_data') and entry._cached_data:
-                    data = entry._cached_data
-                else:
-                    data = self.read_entry_data(entry)
-
-                entry_data_list.append(data)
-
-                # Update entry with new offset/size
-                entry.offset = current_offset
-                entry.size = len(data)
-
-                # Align to sector boundary
-                aligned_size = ((len(data) + 2047) // 2048) * 2048
-                current_offset += aligned_size
-
-            # Write DIR file
-            with open(dir_path, 'wb') as f:
-                for entry in self.entries:
-                    # Convert to sectors
-                    offset_sectors = entry.offset // 2048
-                    size_sectors = ((entry.size + 2047) // 2048)
-
-                    # Pack entry: offset(4), size(4), name(24)
-                    entry_data = struct.pack('<II', offset_sectors, size_sectors)
-                    name_bytes = entry.name.encode('ascii')[:24].ljust(24, b'\x00')
-                    entry_data += name_bytes
-
-                    f.write(entry_data)
-
-            # Write IMG file
-            with open(img_path, 'wb') as f:
-                for i, data in enumerate(entry_data_list):
-                    f.seek(self.entries[i].offset)
-                    f.write(data)
-
-                    # Pad to sector boundary
-                    current_pos = f.tell()
-                    sector_end = ((current_pos + 2047) // 2048) * 2048
-                    if current_pos < sector_end:
-                        f.write(b'\x00' * (sector_end - current_pos))
+            file_size = os.path.getsize(img_path)
+        except (OSError, TypeError):
+            file_size = 0
+        dir_sectors = (-(-(8 + len(entries) * _DIR_ENTRY.size) // sector)
+                       if self.version in _VER2_LAYOUT_VERSIONS else 0)
+
+        runs = sorted((e.offset // sector, -(-e.size // sector)) for e in entries if e.size)
+        overlaps = 0
+        end = dir_sectors
+        for start, count in runs:
+            if start < end:
+                overlaps += 1
+            end = max(end, start + count)
+        holes = [(start * sector, count * sector)
+                 for start, count in SectorAllocator([(0, dir_sectors)] + runs, end).holes]
+        hole_bytes = sum(size for _, size in holes)
+        tail_bytes = max(0, file_size - end * sector)
+
+        slack_bytes = slack_entries = 0
+        if measure_slack:
+            for e in entries:
+                if (e.extension not in ('DFF', 'TXD') or e.size < 12 or e._cached_data is not None
+                        or e.compression_type == CompressionType.LZO):
+                    continue
+                header = self._read_raw(e, 12)
+                if len(header) < 12:
+                    continue
+                content = struct.unpack_from('<I', header, 4)[0] + 12
+                span = -(-e.size // sector) * sector
+                if content <= span:
+                    slack_bytes += span - content
+                    slack_entries += 1
+
+        entry_bytes = sum(count for _, count in runs) * sector
+        compacted_size = dir_sectors * sector + entry_bytes
+        return {
+            'file_size': file_size,
+            'directory_bytes': dir_sectors * sector,
+            'entry_bytes': entry_bytes,
+            'holes': holes,
+            'hole_bytes': hole_bytes,
+            'tail_bytes': tail_bytes,
+            'orphaned_bytes': hole_bytes + tail_bytes,
+            'slack_bytes': slack_bytes,
+            'slack_entries': slack_entries,
+            'overlaps': overlaps,
+            'compacted_size': compacted_size,
+            'reclaimable_bytes': max(0, file_size - compacted_size),
+            'fragmentation': (hole_bytes + tail_bytes) / file_size if file_size else 0.0,
+        }
 
-            print(f"Rebuilt DIR/IMG pair: {entry_count} entries")
-            return True
+    def locality_order(self, xref=None) -> List[IMGEntry]: #vers 2
+        """Entries in a data order that keeps related files together.
 
-        except Exception as e:
+        With xref (the DAT cross-reference behind apply_xref_status:
+        model_map stem -> IDE object with txd_name, plus col_stems) models
+        are taken IDE file by IDE file (the object's ide_file, if it has
+        one) in IDE order, each as its TXD (at its first use), DFF and
+        same-named COL; entries no IDE refers to follow in their current
+        data order. Without xref: by name stem, DFF first.
+        """
+        if xref is None or not getattr(xref, 'model_map', None):
+            rank = {'DFF': 0, 'TXD': 1, 'COL': 2, 'IFP': 3}
+            return sorted(self.entries, key=lambda e: (e.name.rsplit('.', 1)[0].lower(),
+                                                       rank.get(e.extension, 4), e.name.lower()))
+
+        col_stems = getattr(xref, 'col_stems', set())
+        groups = {}
+        for stem, obj in xref.model_map.items():
+            groups.setdefault(getattr(obj, 'ide_file', '') or '', []).append((stem.lower(), obj))
+
+        order = []
+        placed = set()
+
+        def place(name): #vers 1
+            entry = self.get_entry(name)
+            if entry is not None and id(entry) not in placed:
+                placed.add(id(entry))
+                order.append(entry)
+
+        for models in groups.values():
+            for stem, obj in models:
+                txd = getattr(obj, 'txd_name', '') or ''
+                if txd and txd.lower() != 'null':
+                    place(txd + '.txd')
+                place(stem + '.dff')
+                if stem in col_stems:
+                    place(stem + '.col')
+
+        rest = [e for e in self.entries if id(e) not in placed]
+        rest.sort(key=lambda e: e.offset)
+        return order + rest
+
+    def compact(self, reorder: bool = False, order: Optional[List[IMGEntry]] = None,
+                xref=None) -> bool: #vers 3
+        """Rewrite the archive tightly packed - no holes and nothing after
+        the last entry - streaming the entries into a new file
+        (_rebuild_streamed). reorder=True lays the data out in
+        locality_order(xref) - grouped per model and IDE file when xref is
+        given; order= gives the data order explicitly. The directory keeps
+        its order either way."""
+        if self.version not in _IN_PLACE_VERSIONS:
             return False
+        if order is None and reorder:
+            order = self.locality_order(xref)
+        return self._rebuild_streamed(order)
 
     def import_file(self, file_path: str) -> bool: #vers 1
         """Import file into IMG"""
@@ -1310,7 +2272,7 @@ class IMGFile:
             return False
 
 
-    def add_entry(self, filename: str, data: bytes, auto_save: bool = True) -> bool: #vers 3
+    def add_entry(self, filename: str, data: bytes, auto_save: bool = True) -> bool: #vers 4
         """Add new entry to IMG file - FIXED VERSION with enhanced debugging"""
         try:
             # CRITICAL: Sanitize filename to prevent corruption
@@ -1320,11 +2282,7 @@ class IMGFile:
 
 
             # Check for duplicate entries (replace if exists)
-            existing_entry = None
-            for i, entry in enumerate(self.entries):
-                if entry.name == filename:
-                    existing_entry = entry
-                    break
+            existing_entry = self.get_entry(filename)
 
             # Skip if existing entry is pinned
             if existing_entry and getattr(existing_entry, 'is_pinned', False):
@@ -1332,11 +2290,9 @@ class IMGFile:
 
             # Calculate proper offset for new entry
             if self.entries and not existing_entry:
-                # Find the end of the last entry
-                last_entry = max(self.entries, key=lambda e: e.offset + e.size)
-                # Align to sector boundary (2048 bytes for IMG files)
-                last_end = last_entry.offset + last_entry.size
-                new_offset = ((last_end + 2047) // 2048) * 2048
+                # End of the last entry, aligned to sector boundary (2048 bytes for IMG files)
+                self._name_index()
+                new_offset = ((self._data_end + 2047) // 2048) * 2048
             else:
                 # First entry or replacing existing
                 if self.version == IMGVersion.VERSION_1:
@@ -1353,6 +2309,7 @@ class IMGFile:
                 new_entry._cached_data = data
                 new_entry.size = len(data)
                 # Keep existing offset for replacement
+                self._data_end = max(self._data_end, new_entry.offset + new_entry.size)
             else:
                 # Create brand new entry
                 new_entry = IMGEntry()
@@ -1367,6 +2324,7 @@ class IMGFile:
 
                 # Add to entries list
                 self.entries.append(new_entry)
+                self._index_entry(new_entry)
 
             new_entry.is_new_entry = True
             # Stamp creation date
@@ -1424,33 +2382,99 @@ class IMGFile:
         except Exception as e:
             return 0
 
-    def remove_entry(self, filename: str) -> bool: #vers 1
-        """Remove entry by filename - HELPER METHOD"""
-        try:
-            for i, entry in enumerate(self.entries):
-                if entry.name == filename:
-                    removed_entry = self.entries.pop(i)
-                    return True
+    def _name_index(self) -> Dict[str, IMGEntry]: #vers 1
+        """Lower-case name -> entry map (first entry wins for duplicates).
 
-            return False
+        Built on first use and kept current by add_entry / remove_entry /
+        rename_entry; rebuilt when the entry list was replaced or changed
+        length behind their back (code appending to self.entries directly).
+        Renames should go through rename_entry: a name assigned directly is
+        only noticed when the old name is looked up again. Also tracks
+        _data_end, the end of the last entry's data.
+        """
+        entries = self.entries
+        source, length = self._names_source
+        if self._names is None or source is not entries or length != len(entries):
+            names = {}
+            data_end = 0
+            for entry in entries:
+                names.setdefault(entry.name.lower(), entry)
+                end = entry.offset + entry.size
+                if end > data_end:
+                    data_end = end
+            self._names = names
+            self._names_source = (entries, len(entries))
+            self._names_dups = len(names) != len(entries)
+            self._data_end = data_end
+        return self._names
+
+    def _index_entry(self, entry: IMGEntry): #vers 1
+        """Record an entry just appended to self.entries in the name index."""
+        entries = self._entries
+        if self._names is not None and self._names_source == (entries, len(entries) - 1):
+            if self._names.setdefault(entry.name.lower(), entry) is not entry:
+                self._names_dups = True
+            self._names_source = (entries, len(entries))
+            self._data_end = max(self._data_end, entry.offset + entry.size)
+
+    def remove_entry(self, filename: str) -> bool: #vers 2
+        """Remove entry by filename (case-insensitive) - HELPER METHOD"""
+        try:
+            entry = self.get_entry(filename)
+            if entry is None:
+                return False
+            entries = self.entries
+            entries.remove(entry)
+            if self._names_dups:
+                # Another entry of the same name takes over - rebuild on next lookup
+                self._names = None
+            else:
+                del self._names[entry.name.lower()]
+                self._names_source = (entries, len(entries))
+            return True
 
         except Exception as e:
             return False
 
-    def has_entry(self, filename: str) -> bool: #vers 1
-        """Check if entry exists by filename - HELPER METHOD"""
+    def rename_entry(self, entry: Union[IMGEntry, str], new_name: str) -> bool: #vers 1
+        """Rename an entry (given as IMGEntry or name), keeping the name index
+        current. Fails if another entry already has new_name."""
         try:
-            return any(entry.name == filename for entry in self.entries)
-        except Exception:
+            if isinstance(entry, str):
+                entry = self.get_entry(entry)
+            new_name = self._sanitize_filename(new_name)
+            if entry is None or not new_name:
+                return False
+            other = self.get_entry(new_name)
+            if other is not None and other is not entry:
+                return False
+            old_key = entry.name.lower()
+            entry.name = new_name
+            entry.detect_file_type_and_version(detect_rw=False)
+            if self._names_dups:
+                self._names = None
+            elif self._names is not None:
+                self._names.pop(old_key, None)
+                self._names[entry.name.lower()] = entry
+            return True
+
+        except Exception as e:
             return False
 
-    def get_entry(self, filename: str) -> Optional['IMGEntry']: #vers 1
-        """Get entry by filename - HELPER METHOD"""
+    def has_entry(self, filename: str) -> bool: #vers 2
+        """Check if entry exists by filename (case-insensitive) - HELPER METHOD"""
+        return self.get_entry(filename) is not None
+
+    def get_entry(self, filename: str) -> Optional['IMGEntry']: #vers 2
+        """Get entry by filename (case-insensitive) - HELPER METHOD"""
         try:
-            for entry in self.entries:
-                if entry.name == filename:
-                    return entry
-            return None
+            key = filename.lower()
+            entry = self._name_index().get(key)
+            if entry is not None and entry.name.lower() != key:
+                # Renamed without rename_entry - rebuild and look again
+                self._names = None
+                entry = self._name_index().get(key)
+            return entry
         except Exception:
             return None
 
@@ -1702,18 +2726,31 @@ class IMGFile:
         self.version = IMGVersion.UNKNOWN
         return IMGVersion.UNKNOWN
 
-    def open(self) -> bool: #vers 5
+    def open(self) -> bool: #vers 8
         """Open and parse IMG file - FIXED WITH PROPER ENTRY PARSING"""
         try:
             if self.is_open:
                 return True
 
+            # A save that was interrupted halfway is undone first
+            data_path = self.file_path
+            if data_path.lower().endswith('.dir'):
+                data_path = _find_companion(data_path, '.img') or data_path
+            if os.path.exists(_journal_path(data_path)):
+                _rollback_journal(_journal_path(data_path))
+
+            # Unchanged since it was last parsed: version, platform and
+            # entries come from the sidecar index in one read
+            if self.version == IMGVersion.UNKNOWN and self.use_index and self._load_index():
+                self.is_open = True
+                return True
+
             # Detect version first
             if self.version == IMGVersion.UNKNOWN:
                 self.detect_version()
 
             # Clear existing entries
-            self.entries.clear()
+            self.entries = []
 
             # Open based on version
             success = False
@@ -1781,8 +2818,9 @@ class IMGFile:
 
             if success:
                 self.is_open = True
-                # FIXED: Parse file types and versions for all entries
-                self._parse_all_entries()
+                # Parse file types and versions for all entries - deferred
+                # to the first access of self.entries
+                self._entries_pending = True
             
             return success
 
@@ -1792,29 +2830,120 @@ class IMGFile:
             traceback.print_exc()
             return False
 
-    def _parse_all_entries(self): #vers 2
-        """ADDED: Parse file types and versions for all entries + UNKNOWN RW DETECTION"""
+    def _parse_all_entries(self): #vers 5
+        """ADDED: Parse file types and versions for all entries + UNKNOWN RW DETECTION
+
+        Types come from the names (no I/O); RW versions are then read in one
+        offset-ordered sweep, unless background_rw_detection leaves that to
+        start_rw_detection() or lazy_rw_detection to the table viewport.
+        The result is saved to the sidecar index.
+        """
         try:
-            
-            for i, entry in enumerate(self.entries):
+            for entry in self.entries:
                 try:
-                    # Detect file type and RW version
-                    entry.detect_file_type_and_version()
-                    
-                    # Log progress for large files
-                    if i > 0 and i % 100 == 0:
-                        pass
-                        
+                    entry.detect_file_type_and_version(detect_rw=False)
                 except Exception as e:
                     pass
-                    
-            
-            # ADDED: Trigger unknown RW file detection after parsing
-            self._trigger_unknown_rw_detection()
-            
+
+            if not (self.background_rw_detection or self.lazy_rw_detection):
+                self.detect_rw_versions()
+
+                # ADDED: Trigger unknown RW file detection after parsing
+                self._trigger_unknown_rw_detection()
+
+            self._indexed_count = len(self._entries)
+            self.save_index()
+
         except Exception as e:
             pass
 
+    def detect_rw_versions(self, entries: Optional[List[IMGEntry]] = None, on_batch=None,
+                           should_stop=None, batch_seconds: float = 0.1) -> int: #vers 1
+        """Read the RW headers of DFF / TXD entries not scanned yet, sorted by
+        offset so the archive is read front to back (through the mapping)
+        instead of hopping around in directory order.
+
+        on_batch(list_of_entries) is called with the entries scanned so far
+        every batch_seconds and at the end; should_stop() is polled between
+        entries. Returns the number of entries scanned.
+        """
+        pending = self.pending_rw_entries(self.entries if entries is None else entries)
+        pending.sort(key=lambda e: (getattr(e, '_source_img', None) or '', e.offset))
+
+        batch = []
+        last = time.monotonic()
+        for entry in pending:
+            if should_stop is not None and should_stop():
+                break
+            entry._detect_rw_version()
+            entry._rw_scanned = True
+            batch.append(entry)
+            if on_batch is not None and time.monotonic() - last >= batch_seconds:
+                on_batch(batch)
+                batch = []
+                last = time.monotonic()
+        if on_batch is not None and batch:
+            on_batch(batch)
+        return len(pending)
+
+    @staticmethod
+    def pending_rw_entries(entries: List[IMGEntry]) -> List[IMGEntry]: #vers 1
+        """DFF / TXD entries whose header has not been read yet."""
+        return [e for e in entries
+                if e.extension in ('DFF', 'TXD') and not e._rw_scanned and not e._version_detected]
+
+    def start_rw_detection(self, on_batch=None) -> Optional['RWVersionScanner']: #vers 3
+        """Run detect_rw_versions() on a RWVersionScanner thread. on_batch is
+        connected to versions_ready (delivered on the caller's thread) before
+        the scan starts. Returns the running scanner, or None if nothing is
+        left to scan."""
+        if self.rw_scanner is not None and self.rw_scanner.isRunning():
+            if on_batch is not None:
+                self.rw_scanner.versions_ready.connect(on_batch)
+            return self.rw_scanner
+        entries = self.pending_rw_entries(self.entries)
+        if not entries:
+            return None
+        scanner = RWVersionScanner(self, entries)
+        if on_batch is not None:
+            scanner.versions_ready.connect(on_batch)
+        scanner.finished.connect(self.finish_rw_detection)
+        scanner.finished.connect(self.save_index)
+        self.rw_scanner = scanner
+        scanner.start()
+        return scanner
+
+    def stop_rw_detection(self): #vers 1
+        """Stop a running background scan and wait for it to exit."""
+        scanner = self.rw_scanner
+        if scanner is not None and scanner.isRunning():
+            scanner.requestInterruption()
+            scanner.wait()
+
+    def add_background_reader(self, thread: QThread): #vers 1
+        """Register a QThread that reads entries of this archive. It must
+        check isInterruptionRequested() between reads; invalidate_mappings()
+        interrupts it and waits for it to exit."""
+        self._background_readers = [t for t in self._background_readers
+                                    if _thread_alive(t)] + [thread]
+
+    def stop_background_readers(self): #vers 1
+        """Interrupt every registered reader and wait for it to exit."""
+        readers, self._background_readers = self._background_readers, []
+        for thread in readers:
+            if _thread_alive(thread):
+                thread.requestInterruption()
+                thread.wait()
+
+    def finish_rw_detection(self) -> bool: #vers 1
+        """End of a background scan or lazy (viewport) detection pass: once
+        no DFF / TXD header is left unread, run the unknown RW capture that
+        the type pass runs. Returns True if it ran."""
+        if self.pending_rw_entries(self.entries):
+            return False
+        self._trigger_unknown_rw_detection()
+        return True
+
     def _trigger_unknown_rw_detection(self): #vers 1
         """ADDED: Trigger unknown RW file detection and snapshotting"""
         try:
@@ -1838,78 +2967,38 @@ class IMGFile:
         """ADDED: Set main window reference for unknown RW detection"""
         self._main_window_ref = main_window
 
-    def _open_version_2(self) -> bool: #vers 5
+    def _open_version_2(self) -> bool: #vers 6
         """Open IMG version 2 (single file) - ENHANCED WITH PLATFORM SUPPORT"""
         try:
-            # Use platform-specific specifications
-            sector_size = self.platform_specs.get('sector_size', 2048)
-            
             with open(self.file_path, 'rb') as f:
-                # Skip VER2 header (4 bytes)
-                f.seek(4)
-                # Read entry count
-                entry_count = struct.unpack('<I', f.read(4))[0]
-                
+                # Skip VER2 header (4 bytes), read entry count
+                header = f.read(8)
+                entry_count = struct.unpack_from('<I', header, 4)[0]
+
                 # Platform-specific entry count validation
                 max_entries = self.platform_specs.get('max_entries', 65535)
                 if entry_count > max_entries:
                     pass
 
-                for i in range(entry_count):
-                    # Read entry: offset(4), size(4), name(24)
-                    entry_data = f.read(32)
-                    if len(entry_data) < 32:
-                        break
-
-                    entry_offset, entry_size = struct.unpack('<II', entry_data[:8])
-                    entry_name = _parse_entry_name(entry_data[8:32])
-
-                    if entry_name:
-                        entry = IMGEntry()
-                        entry.name = entry_name
-                        entry.offset = entry_offset * 2048  # Convert sectors to bytes
-                        entry.size = entry_size * 2048
-                        entry.set_img_file(self)
-                        self.entries.append(entry)
+                # Whole directory in one read: offset(4), size(4), name(24) per entry
+                table = f.read(entry_count * _DIR_ENTRY.size)
 
+            self._directory_table = (table, 2048)
             return True
         except Exception as e:
             return False
 
-    def _open_version_1(self) -> bool: #vers 6
+    def _open_version_1(self) -> bool: #vers 7
         """Open IMG version 1/1.5/1_MOBILE (DIR/IMG pair, or standalone embedded directory)"""
         dir_path = _find_companion(self.file_path, '.dir')
         if not dir_path:
             # Standalone IMG - try reading embedded directory from start of file
             return self._open_version_1_standalone()
 
-        sector_size = 2048
-
         try:
+            # Directory entries are 32 bytes each: offset(4), size(4), name(24)
             with open(dir_path, 'rb') as dir_file:
-                dir_data = dir_file.read()
-
-            # Parse directory entries (32 bytes each)
-            entry_count = len(dir_data) // 32
-            for i in range(entry_count):
-                offset = i * 32
-                entry_data = dir_data[offset:offset+32]
-
-                if len(entry_data) < 32:
-                    break
-
-                # Parse entry: offset(4), size(4), name(24)
-                entry_offset, entry_size = struct.unpack('<II', entry_data[:8])
-                entry_name = _parse_entry_name(entry_data[8:32])
-
-                if entry_name:
-                    entry = IMGEntry()
-                    entry.name = entry_name
-                    entry.offset = entry_offset * sector_size
-                    entry.size = entry_size * sector_size
-                    entry.set_img_file(self)
-                    self.entries.append(entry)
-
+                self._directory_table = (dir_file.read(), 2048)
             return True
         except Exception as e:
             return False
@@ -2151,7 +3240,7 @@ class IMGFile:
             traceback.print_exc()
             return False
 
-    def _open_version_1_standalone(self) -> bool: #vers 1
+    def _open_version_1_standalone(self) -> bool: #vers 2
         """Open standalone V1/V1.5 IMG with embedded directory at start of file."""
         try:
             with open(self.file_path, 'rb') as f:
@@ -2159,115 +3248,152 @@ class IMGFile:
                 first = f.read(32)
                 if len(first) < 32:
                     return False
-                first_offset, first_size = struct.unpack('<II', first[:8])
-                first_name = _parse_entry_name(first[8:32])
-                if not first_name:
+                first_offset, first_size, first_raw = _DIR_ENTRY.unpack(first)
+                if not _parse_entry_name(first_raw):
                     return False
                 # Directory occupies sectors 0..(first_offset-1)
-                dir_sector_count = first_offset
-                dir_bytes = dir_sector_count * 2048
+                dir_bytes = first_offset * 2048
                 f.seek(0)
                 dir_data = f.read(dir_bytes)
 
-            entry_count = len(dir_data) // 32
-            for i in range(entry_count):
-                entry_data = dir_data[i*32:(i+1)*32]
-                if len(entry_data) < 32:
-                    break
-                entry_offset, entry_size = struct.unpack('<II', entry_data[:8])
-                entry_name = _parse_entry_name(entry_data[8:32])
-                if not entry_name:
-                    continue
-                entry = IMGEntry()
-                entry.name = entry_name
-                entry.offset = entry_offset * 2048
-                entry.size = entry_size * 2048
-                entry.set_img_file(self)
-                self.entries.append(entry)
-
+            self._directory_table = (dir_data, 2048)
             return len(self.entries) > 0
         except Exception:
             return False
 
-    def read_entry_data(self, entry: IMGEntry) -> bytes: #vers 3
-        """Read data for a specific entry, transparently decompressing Xbox LZO if needed."""
-        try:
-            # DIR+IMG pair formats: V1, V1_5, SOL, Xbox all use .dir + .img
-            if self.version in (IMGVersion.VERSION_1,
-                                IMGVersion.VERSION_1_5,
-                                IMGVersion.VERSION_SOL,
-                                IMGVersion.VERSION_XBOX):
-                # Resolve .img path from whatever we were opened with (.dir or .img)
-                fp = self.file_path
-                if fp.lower().endswith('.dir'):
-                    img_path = _find_companion(fp, '.img')
-                    if not img_path:
-                        img_path = fp  # fallback (will likely fail)
-                else:
-                    img_path = fp
-                with open(img_path, 'rb') as f:
-                    f.seek(entry.offset)
-                    data = f.read(entry.size)
-            elif self.version in (IMGVersion.VERSION_PS2_LVZ,
-                                    IMGVersion.VERSION_IOS_LVZ,
-                                    IMGVersion.VERSION_DTZ_VCS,
-                                    IMGVersion.VERSION_DTZ_LCS):
-                # LVZ/DTZ entries: offset is a byte position in the companion .img
-                # Use _source_img attr if set, otherwise find the companion
-                img_path = getattr(entry, '_source_img', None)
-                if not img_path:
+    def _entry_data_path(self, entry: IMGEntry) -> str: #vers 1
+        """File holding an entry's bytes. Companion lookups are memoized."""
+        # DIR+IMG pair formats: V1, V1_5, SOL, Xbox all use .dir + .img
+        if self.version in (IMGVersion.VERSION_1,
+                            IMGVersion.VERSION_1_5,
+                            IMGVersion.VERSION_SOL,
+                            IMGVersion.VERSION_XBOX):
+            # Resolve .img path from whatever we were opened with (.dir or .img)
+            fp = self.file_path
+            if not fp.lower().endswith('.dir'):
+                return fp
+            img_path = self._data_paths.get(fp)
+            if img_path is None:
+                img_path = _find_companion(fp, '.img') or fp  # fallback (will likely fail)
+                self._data_paths[fp] = img_path
+            return img_path
+        if self.version in (IMGVersion.VERSION_PS2_LVZ,
+                            IMGVersion.VERSION_IOS_LVZ,
+                            IMGVersion.VERSION_DTZ_VCS,
+                            IMGVersion.VERSION_DTZ_LCS):
+            # LVZ/DTZ entries: offset is a byte position in the companion .img
+            # Use _source_img attr if set, otherwise find the companion
+            img_path = getattr(entry, '_source_img', None)
+            if not img_path:
+                img_path = self._data_paths.get(self.file_path)
+                if img_path is None:
                     img_path = _find_companion(self.file_path, '.img')
-                if not img_path:
-                    raise RuntimeError("No companion .img found for LVZ/DTZ entry")
-                with open(img_path, 'rb') as f:
-                    f.seek(entry.offset)
-                    data = f.read(entry.size)
-            else:
-                with open(self.file_path, 'rb') as f:
-                    f.seek(entry.offset)
-                    data = f.read(entry.size)
+                    self._data_paths[self.file_path] = img_path
+            if not img_path:
+                raise RuntimeError("No companion .img found for LVZ/DTZ entry")
+            return img_path
+        return self.file_path
+
+    def _mapped_file(self, path: str) -> _MappedFile: #vers 1
+        """Open + map path on first use; re-map if its size changed."""
+        mapped = self._mapped.get(path)
+        if mapped is not None and not mapped.stale():
+            return mapped
+        with self._map_lock:
+            mapped = self._mapped.get(path)
+            if mapped is None or mapped.stale():
+                if mapped is not None:
+                    mapped.close()
+                mapped = _MappedFile(path)
+                self._mapped[path] = mapped
+            return mapped
+
+    def _read_raw(self, entry: IMGEntry, size: Optional[int] = None): #vers 1
+        """Stored (not decompressed) bytes of an entry, or the first size
+        of them: a memoryview of the mapping when mmap_reads is on."""
+        path = self._entry_data_path(entry)
+        size = entry.size if size is None else min(size, entry.size)
+        if self.mmap_reads:
+            return self._mapped_file(path).view(entry.offset, size)
+        with open(path, 'rb') as f:
+            f.seek(entry.offset)
+            return f.read(size)
+
+    def read_entry_view(self, entry: IMGEntry) -> memoryview: #vers 2
+        """Entry data without copying: a memoryview into the mapped archive
+        (Xbox LZO entries are decompressed into a new buffer, kept in the
+        LZO entry cache when cache_lzo_entries is on). The view is only
+        valid until the archive is rebuilt or closed - call bytes() on
+        anything that must outlive that."""
+        try:
+            is_xbox = self.platform == IMGPlatform.XBOX
+            if is_xbox and self.cache_lzo_entries:
+                cached = get_lzo_entry_cache().get(self._entry_data_path(entry), entry.offset, entry.size)
+                if cached is not None:
+                    entry.compression_type = CompressionType.LZO
+                    return memoryview(cached)
+
+            data = self._read_raw(entry)
 
             # Transparent Xbox LZO decompression
-            if self.platform == IMGPlatform.XBOX and _is_xbox_lzo(data):
+            if is_xbox and _is_xbox_lzo(data):
                 try:
-                    data = _xbox_lzo_decompress_entry(data)
+                    data = _xbox_lzo_decompress_entry(bytes(data))
                     entry.compression_type = CompressionType.LZO
+                    if self.cache_lzo_entries:
+                        get_lzo_entry_cache().put(self._entry_data_path(entry), entry.offset,
+                                                  entry.size, data)
                 except Exception:
                     pass  # return raw on failure
 
-            return data
+            return memoryview(data)
         except Exception as e:
             raise RuntimeError(f"Failed to read entry data: {e}")
 
-    def write_entry_data(self, entry: IMGEntry, data: bytes): #vers 2
-        """Write data for a specific entry"""
+    def read_entry_data(self, entry: IMGEntry) -> bytes: #vers 4
+        """Read data for a specific entry, transparently decompressing Xbox LZO if needed."""
+        view = self.read_entry_view(entry)
+        # Decompressed / unmapped data already is a bytes object - no second copy
+        if type(view.obj) is bytes and view.nbytes == len(view.obj):
+            return view.obj
+        return view.tobytes()
+
+    def invalidate_mappings(self, drop_cached: bool = True): #vers 4
+        """Unmap and close every backing file and forget resolved companion
+        paths. Called before the archive is rewritten; the next read maps
+        the new file. A background RW scan and the registered background
+        readers are stopped first, and with drop_cached the archive's cached
+        Xbox LZO payloads are dropped."""
+        self.stop_rw_detection()
+        self.stop_background_readers()
+        if drop_cached and self.platform == IMGPlatform.XBOX and self.file_path:
+            get_lzo_entry_cache().drop_archive(self._dir_img_paths()[1] or self.file_path)
+        with self._map_lock:
+            for mapped in self._mapped.values():
+                mapped.close()
+            self._mapped.clear()
+            self._data_paths.clear()
+
+    def write_entry_data(self, entry: IMGEntry, data: bytes): #vers 4
+        """Write data for a specific entry (LZO compressed on Xbox)"""
         try:
-            if self.version in (IMGVersion.VERSION_1,
-                                IMGVersion.VERSION_1_5,
-                                IMGVersion.VERSION_SOL,
-                                IMGVersion.VERSION_XBOX):
-                fp = self.file_path
-                if fp.lower().endswith('.dir'):
-                    img_path = _find_companion(fp, '.img')
-                    if not img_path:
-                        img_path = fp  # fallback (will likely fail)
-                else:
-                    img_path = fp
-                with open(img_path, 'r+b') as f:
-                    f.seek(entry.offset)
-                    f.write(data)
-            else:
-                # Write to single .img file
-                with open(self.file_path, 'r+b') as f:
-                    f.seek(entry.offset)
-                    f.write(data)
+            if self.platform == IMGPlatform.XBOX and not _is_xbox_lzo(data):
+                data = _xbox_lzo_compress_entry(data)
+                entry.compression_type = CompressionType.LZO
+            img_path = self._entry_data_path(entry)
+            self.invalidate_mappings()
+            with open(img_path, 'r+b') as f:
+                f.seek(entry.offset)
+                f.write(data)
         except Exception as e:
             raise RuntimeError(f"Failed to write entry data: {e}")
 
-    def close(self): #vers 1
-        """Close IMG file"""
+    def close(self): #vers 5
+        """Close IMG file - its cached LZO payloads stay for a re-open of
+        the unchanged archive (they are keyed by its size and mtime)"""
+        self.invalidate_mappings(drop_cached=False)
         self.is_open = False
-        self.entries.clear()
+        self.entries = []
 
     def get_creation_info(self) -> Dict[str, Any]: #vers 1
         """Get information about the IMG file"""
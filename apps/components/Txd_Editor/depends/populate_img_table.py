@@ -1,4 +1,4 @@
-#this belongs in methods/populate_img_table.py - Version: 10
+#this belongs in methods/populate_img_table.py - Version: 13
 # X-Seti - November18 2025 - IMG Factory 1.5
 """
 IMG Table Population
@@ -6,7 +6,7 @@ IMG Table Population
 import os
 from typing import Any, List, Optional
 from PyQt6.QtWidgets import QTableWidgetItem, QTableWidget, QHeaderView, QAbstractItemView
-from PyQt6.QtCore import Qt, QItemSelectionModel
+from PyQt6.QtCore import Qt, QItemSelectionModel, QObject, QTimer
 from PyQt6.QtGui import QMouseEvent
 from apps.debug.debug_functions import img_debugger
 
@@ -91,12 +91,27 @@ class DragSelectTableWidget(QTableWidget): #vers 1
 # setup_table_structure
 ##Methods list -
 # create_img_table_item
+# detach_rw_viewport_loader
 # format_img_entry_size
 # get_img_entry_type
 # populate_table_row_minimal
 # populate_table_with_img_data_minimal
 # refresh_img_table
+# set_rw_cells
+# start_rw_column_fill
+# start_rw_viewport_fill
 # update_img_table_selection_info
+# update_rw_columns
+# update_rw_rows
+#
+##class RWViewportLoader: -
+# __init__
+# _load_rows
+# _load_visible
+# _on_scroll
+# _prefetch
+# _visible_rows
+# detach
 
 def reset_table_styling(main_window): #vers 2
     """Completely reset table styling to default using IMG debug system"""
@@ -198,7 +213,7 @@ class IMGTablePopulator:
             return pal.color(pal.ColorRole.Mid)
         return pal.color(pal.ColorRole.WindowText)
 
-    def populate_table_with_img_data(self, img_file: Any) -> bool: #vers 9
+    def populate_table_with_img_data(self, img_file: Any) -> bool: #vers 11
         """Populate table with IMG entry data - MINIMAL VERSION to prevent freezing"""
         try:
             if not img_file or not hasattr(img_file, 'entries'):
@@ -232,12 +247,20 @@ class IMGTablePopulator:
             if not entries:
                 img_debugger.info("No entries found in IMG file")
                 return True
+            detach_rw_viewport_loader(table)
             table.setRowCount(len(entries))
             img_debugger.debug(f"Populating table with {len(entries)} entries")
             for row, entry in enumerate(entries):
                 self.populate_table_row_minimal(table, row, entry)
             img_debugger.info(f"Table populated with {len(entries)} entries")
 
+            # Background RW scan: RW Address / RW Version cells fill in as it goes;
+            # lazy mode: only rows scrolled into view are detected
+            if getattr(img_file, 'background_rw_detection', False) and hasattr(img_file, 'start_rw_detection'):
+                self.start_rw_column_fill(table, img_file)
+            elif getattr(img_file, 'lazy_rw_detection', False) and hasattr(img_file, 'detect_rw_versions'):
+                self.start_rw_viewport_fill(table, img_file)
+
             # Apply DAT cross-reference tooltips — pick xref matching this IMG's game root
             try:
                 mw = self.main_window
@@ -279,7 +302,7 @@ class IMGTablePopulator:
             img_debugger.error(f"Error populating IMG table: {str(e)}")
             return False
 
-    def populate_table_row_minimal(self, table: Any, row: int, entry: Any): #vers 4
+    def populate_table_row_minimal(self, table: Any, row: int, entry: Any): #vers 5
         """Populate single table row with MINIMAL processing - keep all 8 columns"""
         try:
             # Check if this entry should be highlighted - OPTIMIZED
@@ -295,6 +318,7 @@ class IMGTablePopulator:
             # Create items with minimal processing
             name_text = str(entry.name) if hasattr(entry, 'name') else f"Entry_{row}"
             name_item = self.create_img_table_item(name_text, is_highlighted, highlight_type)
+            name_item.setData(Qt.ItemDataRole.UserRole, row)  # entry index, survives sorting
             table.setItem(row, 0, name_item)
             
             entry_type = self.get_img_entry_type_simple(entry)
@@ -328,6 +352,59 @@ class IMGTablePopulator:
             img_debugger.error(f"Error populating table row {row}: {str(e)}")
             table.setItem(row, 0, self.create_img_table_item(f"Error_{row}"))
 
+    def start_rw_column_fill(self, table: Any, img_file: Any): #vers 1
+        """Start img_file's background RW version scan, updating the RW
+        Address / RW Version cells of each batch as it arrives."""
+        try:
+            index_of = {id(entry): i for i, entry in enumerate(img_file.entries)}
+            img_file.start_rw_detection(
+                on_batch=lambda batch: self.update_rw_columns(table, batch, index_of))
+        except Exception as e:
+            img_debugger.error(f"Error starting RW version scan: {e}")
+
+    def start_rw_viewport_fill(self, table: Any, img_file: Any): #vers 1
+        """Detect RW versions only for rows scrolled into view (plus a
+        prefetch window ahead of the scroll) - see RWViewportLoader."""
+        try:
+            table._rw_viewport_loader = RWViewportLoader(self, table, img_file)
+        except Exception as e:
+            img_debugger.error(f"Error starting RW viewport detection: {e}")
+
+    def update_rw_columns(self, table: Any, entries: List[Any], index_of: dict): #vers 2
+        """Refresh RW Address / RW Version of the rows showing entries.
+        Rows are found by the entry index stored on the Name item, so this
+        works on a sorted table."""
+        try:
+            wanted = {index_of[id(e)]: e for e in entries if id(e) in index_of}
+            if not wanted:
+                return
+            rows = []
+            for row in range(table.rowCount()):
+                item = table.item(row, 0)
+                entry = wanted.get(item.data(Qt.ItemDataRole.UserRole)) if item else None
+                if entry is not None:
+                    rows.append((row, entry))
+            self.update_rw_rows(table, rows)
+        except Exception as e:
+            img_debugger.error(f"Error updating RW columns: {e}")
+
+    def update_rw_rows(self, table: Any, rows: List[tuple]): #vers 1
+        """set_rw_cells for (row, entry) pairs, with sorting held off so the
+        rows don't move while they are written."""
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        try:
+            for row, entry in rows:
+                self.set_rw_cells(table, row, entry)
+        finally:
+            table.setSortingEnabled(sorting)
+
+    def set_rw_cells(self, table: Any, row: int, entry: Any): #vers 1
+        """RW Address, RW Version and Encoding cells of one row."""
+        table.setItem(row, 4, self.create_img_table_item(self.get_rw_address_light(entry)))
+        table.setItem(row, 5, self.create_img_table_item(self.get_rw_version_light(entry)))
+        table.setItem(row, 6, self.create_img_table_item(self.get_compression_info(entry)))
+
     def get_img_entry_type_simple(self, entry: Any) -> str: #vers 2
         """Get entry type - SIMPLE extension extraction, no heavy processing"""
         try:
@@ -374,7 +451,7 @@ class IMGTablePopulator:
         except Exception:
             return "N/A"
 
-    def get_rw_version_light(self, entry: Any) -> str: #vers 6
+    def get_rw_version_light(self, entry: Any) -> str: #vers 8
         """Get RW version - validates version is in known RW range before accepting"""
         try:
             from apps.methods.rw_versions import get_rw_version_name, is_valid_rw_version, parse_rw_version
@@ -388,6 +465,12 @@ class IMGTablePopulator:
                 if hasattr(entry, 'rw_version_name') and entry.rw_version_name not in ["Unknown", "", "N/A", "Error"]:
                     return entry.rw_version_name
                 return get_rw_version_name(entry.rw_version)
+            # Background scan / viewport hasn't reached this entry yet - no I/O here
+            img_file = getattr(entry, '_img_file', None)
+            deferred = (getattr(img_file, 'background_rw_detection', False)
+                        or getattr(img_file, 'lazy_rw_detection', False))
+            if entry_type in ['DFF', 'TXD'] and deferred and not getattr(entry, '_rw_scanned', True):
+                return "Detecting..."
             # Try to detect from cached data or read first 16 bytes from IMG
             if entry_type in ['DFF', 'TXD']:
                 data = getattr(entry, '_cached_data', None)
@@ -524,6 +607,111 @@ class IMGTablePopulator:
             img_debugger.error(f"Error getting table reference: {str(e)}")
             return None
 
+class RWViewportLoader(QObject): #vers 1
+    """Viewport-driven RW version detection for one table / IMGFile.
+
+    Rows scrolled into view get their headers read (IMGFile.detect_rw_versions;
+    results are kept on the IMGEntry, so each header is read once) and their
+    RW cells filled. Once scrolling pauses, PREFETCH_PAGES screens ahead in
+    the scroll direction are read as well. When the last unread header
+    has been read, IMGFile.finish_rw_detection() runs the unknown RW capture.
+    """
+
+    DEBOUNCE_MS = 15
+    PREFETCH_MS = 120
+    PREFETCH_PAGES = 2
+
+    def __init__(self, populator: 'IMGTablePopulator', table: Any, img_file: Any): #vers 2
+        super().__init__(table)
+        self.populator = populator
+        self.table = table
+        self.img_file = img_file
+        self.entries = img_file.entries
+        self._remaining = len(img_file.pending_rw_entries(self.entries))
+        self._direction = 1
+        self._last_value = table.verticalScrollBar().value()
+
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(self.DEBOUNCE_MS)
+        self._visible_timer.timeout.connect(self._load_visible)
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(self.PREFETCH_MS)
+        self._prefetch_timer.timeout.connect(self._prefetch)
+
+        table.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        table.horizontalHeader().sortIndicatorChanged.connect(self._visible_timer.start)
+        self._visible_timer.start()
+
+    def detach(self): #vers 1
+        """Stop reacting to the table (a new archive was loaded)."""
+        self._visible_timer.stop()
+        self._prefetch_timer.stop()
+        try:
+            self.table.verticalScrollBar().valueChanged.disconnect(self._on_scroll)
+            self.table.horizontalHeader().sortIndicatorChanged.disconnect(self._visible_timer.start)
+        except (TypeError, RuntimeError):
+            pass
+
+    def _on_scroll(self, value: int): #vers 1
+        if value != self._last_value:
+            self._direction = 1 if value > self._last_value else -1
+            self._last_value = value
+        self._prefetch_timer.stop()
+        self._visible_timer.start()
+
+    def _visible_rows(self) -> range: #vers 1
+        table = self.table
+        count = table.rowCount()
+        if not count:
+            return range(0)
+        first = table.rowAt(0)
+        last = table.rowAt(table.viewport().height() - 1)
+        return range(max(first, 0), (last if last >= 0 else count - 1) + 1)
+
+    def _load_rows(self, rows: range): #vers 2
+        """Detect the not yet scanned entries shown in rows and fill their cells."""
+        shown = []
+        for row in rows:
+            item = self.table.item(row, 0)
+            index = item.data(Qt.ItemDataRole.UserRole) if item else None
+            if index is not None and 0 <= index < len(self.entries):
+                shown.append((row, self.entries[index]))
+        pending = self.img_file.pending_rw_entries([entry for _, entry in shown])
+        if pending:
+            self.img_file.detect_rw_versions(pending)
+            self._remaining -= len(pending)
+            pending = {id(entry) for entry in pending}
+            self.populator.update_rw_rows(self.table, [(row, entry) for row, entry in shown
+                                                       if id(entry) in pending])
+            if self._remaining <= 0 and hasattr(self.img_file, 'finish_rw_detection'):
+                self._remaining = len(self.img_file.pending_rw_entries(self.entries))
+                if not self._remaining and self.img_file.finish_rw_detection():
+                    self.img_file.save_index()
+
+    def _load_visible(self): #vers 1
+        self._load_rows(self._visible_rows())
+        self._prefetch_timer.start()
+
+    def _prefetch(self): #vers 1
+        visible = self._visible_rows()
+        window = max(len(visible), 1) * self.PREFETCH_PAGES
+        if self._direction > 0:
+            self._load_rows(range(visible.stop, min(visible.stop + window, self.table.rowCount())))
+        else:
+            self._load_rows(range(max(visible.start - window, 0), visible.start))
+
+
+def detach_rw_viewport_loader(table) -> None: #vers 1
+    """Drop the RWViewportLoader of a previous population, if any."""
+    loader = getattr(table, '_rw_viewport_loader', None)
+    if loader is not None:
+        loader.detach()
+        loader.deleteLater()
+        table._rw_viewport_loader = None
+
+
 # Standalone functions for compatibility
 def populate_img_table(table, img_file) -> bool: #vers 3
     """Standalone function for IMG table population - MINIMAL VERSION"""
@@ -540,12 +728,13 @@ def populate_img_table(table, img_file) -> bool: #vers 3
             table.setRowCount(0)
         return False
 
-def clear_img_table(main_window) -> bool: #vers 2
+def clear_img_table(main_window) -> bool: #vers 3
     """Clear IMG table contents"""
     try:
         populator = IMGTablePopulator(main_window)
         table = populator.get_table_reference()
         if table:
+            detach_rw_viewport_loader(table)
             table.setRowCount(0)
             table.clearContents()
             return True
@@ -1,4 +1,4 @@
-#this belongs in apps/methods/txd_ps2_parser.py - Version: 2
+#this belongs in apps/methods/txd_ps2_parser.py - Version: 3
 # X-Seti - Apr 2026 - IMG Factory 1.6 - GTA PS2 TXD Parser
 """
 GTA PS2 TXD parser — rewritten using DragonFF's NativePS2Texture approach.
@@ -38,12 +38,14 @@ Both route to this parser when platform_id == "PS2\\0".
 import struct
 from typing import List, Optional, Dict
 
+from apps.methods.rw_chunks import HEADER, as_view, read_cstring
+
 
 #    RW chunk reader                                                             
 
-def _read_chunk(data: bytes, pos: int):
-    """Read a 12-byte RW chunk header → (type, size, lib, payload_start)."""
-    ct, sz, lib = struct.unpack('<III', data[pos:pos+12])
+def _read_chunk(data, pos: int):
+    """Read a 12-byte RW chunk header in place → (type, size, lib, payload_start)."""
+    ct, sz, lib = HEADER.unpack_from(data, pos)
     return ct, sz, lib, pos + 12
 
 
@@ -90,9 +92,9 @@ def _unswizzle_palette(data: bytes) -> bytes:
     return bytes(palette)
 
 
-def _read_palette(data: bytes, pos: int, size: int) -> bytes:
+def _read_palette(data, pos: int, size: int) -> bytes:
     """Read palette bytes and expand PS2 alpha 0-128 → 0-255."""
-    raw = data[pos:pos + size]
+    raw = bytes(data[pos:pos + size])
     out = bytearray(size)
     for i in range(0, size, 4):
         r, g, b, a = raw[i:i+4]
@@ -106,10 +108,10 @@ def detect_ps2_txd(data: bytes) -> bool:
     """Return True if data starts with a TextureDict containing PS2\\0 textures."""
     if len(data) < 32:
         return False
-    ct = struct.unpack('<I', data[:4])[0]
+    ct = struct.unpack_from('<I', data, 0)[0]
     if ct != 0x16:   # not TextureDict
         return False
-    return b'PS2\x00' in data[12:min(200, len(data))]
+    return b'PS2\x00' in bytes(data[12:min(200, len(data))])
 
 
 def parse_ps2_txd(data: bytes) -> List[Dict]:
@@ -124,6 +126,7 @@ def parse_ps2_txd(data: bytes) -> List[Dict]:
     results = []
     if len(data) < 28:
         return results
+    data = as_view(data)   # headers read in place; only pixel / palette data is copied
 
     ct, sz, lib, pos = _read_chunk(data, 0)
     if ct != 0x16:
@@ -134,7 +137,7 @@ def parse_ps2_txd(data: bytes) -> List[Dict]:
     ct2, sz2, lib2, p2 = _read_chunk(data, pos)
     if ct2 != 0x01 or sz2 < 4:
         return results
-    tex_count, device_id = struct.unpack('<HH', data[p2:p2+4])
+    tex_count, device_id = struct.unpack_from('<HH', data, p2)
     pos = p2 + sz2
 
     for _ in range(tex_count):
@@ -159,7 +162,7 @@ def parse_ps2_txd(data: bytes) -> List[Dict]:
         if pos < nt_end - 12:
             ct4, sz4, _, p4 = _read_chunk(data, pos)
             if ct4 == 0x01 and sz4 == 8:
-                tex['platform_id'] = struct.unpack('<I', data[p4:p4+4])[0]
+                tex['platform_id'] = struct.unpack_from('<I', data, p4)[0]
             pos = p4 + sz4
 
         #    String chunks: name, mask                                      
@@ -167,7 +170,7 @@ def parse_ps2_txd(data: bytes) -> List[Dict]:
             if pos >= nt_end - 12: break
             ct4, sz4, _, p4 = _read_chunk(data, pos)
             if ct4 == 0x02:
-                tex[key] = data[p4:p4+sz4].split(b'\x00')[0].decode('ascii', 'replace')
+                tex[key] = read_cstring(data, p4, sz4)
             pos = p4 + sz4
 
         #    Native chunk (outer wrapper) — step INTO                       
@@ -217,7 +220,7 @@ def parse_ps2_txd(data: bytes) -> List[Dict]:
             pos += 80                                     # skip pixel GIF header
             # pix_sz may include GIF alignment padding; clamp to actual pixel count
             expected_pix_bytes = w * h * depth // 8
-            raw_pixels = data[pos:pos + min(pix_sz, expected_pix_bytes)]
+            raw_pixels = bytes(data[pos:pos + min(pix_sz, expected_pix_bytes)])
             pos += pix_sz                                 # advance past full block
 
             pos += 80                                     # skip palette GIF header
@@ -252,7 +255,7 @@ def parse_ps2_txd(data: bytes) -> List[Dict]:
 
         elif raster_type == 5 and depth == 32:
             # Unpalettised PSMCT32 — raw RGBA32
-            tex['pixels'] = data[pos:pos + pix_sz]
+            tex['pixels'] = bytes(data[pos:pos + pix_sz])
 
         results.append(tex)
         pos = nt_end
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in methods/ txd_serializer.py - Version: 4
+#this belongs in methods/ txd_serializer.py - Version: 6
 # X-Seti - October11 2025 - Img Factory 1.5 - TXD Serializer
 
 """
@@ -12,6 +12,9 @@ REVERTED: Names go INSIDE struct (88-byte header format), not separate STRING se
 import struct
 from typing import List, Dict, Optional
 
+from apps.methods.dxt_codec import encode_dxt
+from apps.methods.rw_chunks import as_view, read_chunk_header
+
 ##Methods list -
 # __init__
 # _build_texture_dictionary
@@ -42,8 +45,9 @@ class TXDSerializer: #vers 1
     # RenderWare version
     RW_VERSION = 0x1803FFFF  # 3.6.0.3
     
-    def __init__(self): #vers 1
+    def __init__(self): #vers 2
         self.output = bytearray()
+        self.dxt_quality = 'normal'  # fast / normal / high
     
     def serialize_txd(self, textures: List[Dict], target_version: int = None, 
                      target_device: int = None) -> bytes: #vers 1
@@ -55,7 +59,7 @@ class TXDSerializer: #vers 1
         return bytes(txd_data)
     
 
-    def _build_texture_native(self, texture: Dict) -> bytearray: #vers 6
+    def _build_texture_native(self, texture: Dict) -> bytearray: #vers 7
         """
         Build texture native section - FIXED: Alpha preservation
 
@@ -187,7 +191,8 @@ class TXDSerializer: #vers 1
                     texture_data.extend(compressed)
                 else:
                     # Only re-compress if no original exists
-                    compressed = self._compress_to_dxt(rgba_data, width, height, format_str)
+                    compressed = self._compress_to_dxt(rgba_data, width, height, format_str,
+                                                       bool(texture.get('has_alpha')))
                     if compressed:
                         texture_data.extend(compressed)
             else:
@@ -303,7 +308,7 @@ class TXDSerializer: #vers 1
     
 
 
-    def _parse_single_texture(self, txd_data, offset, index, rw_version=0x1803FFFF): #vers 6
+    def _parse_single_texture(self, txd_data, offset, index, rw_version=0x1803FFFF): #vers 7
         """
         Parse single texture from TXD - FIXED: Preserves original binary data to prevent corruption
 
@@ -340,34 +345,34 @@ class TXDSerializer: #vers 1
         }
 
         try:
-            # TextureNative structure (0x15)
-            parent_type, parent_size, parent_version = struct.unpack('<III', txd_data[offset:offset+12])
+            # Headers are read in place; payloads are copied once, when stored
+            raster = as_view(txd_data)
 
-            if parent_type != 0x15:
+            # TextureNative structure (0x15)
+            native = read_chunk_header(raster, offset)
+            if native is None or native.type != self.SECTION_TEXTURE_NATIVE:
                 return tex
 
             # Struct section (0x01)
-            struct_offset = offset + 12
-            struct_type, struct_size, struct_version = struct.unpack('<III', txd_data[struct_offset:struct_offset+12])
-
-            if struct_type != 0x01:
+            body = read_chunk_header(raster, native.data_offset)
+            if body is None or body.type != self.SECTION_STRUCT:
                 return tex
 
-            pos = struct_offset + 12
+            pos = body.data_offset
 
             # === 88-byte header ===
             # Platform ID (4 bytes) + Filter flags (4 bytes)
-            platform_id, filter_flags = struct.unpack('<II', txd_data[pos:pos+8])
+            platform_id, filter_flags = struct.unpack_from('<II', raster, pos)
             tex['filter_flags'] = filter_flags
             pos += 8
 
             # Texture name (32 bytes, null-terminated)
-            name_bytes = txd_data[pos:pos+32]
+            name_bytes = bytes(raster[pos:pos+32])
             tex['name'] = name_bytes.rstrip(b'\x00').decode('ascii', errors='ignore') or f'texture_{index}'
             pos += 32
 
             # Alpha/mask name (32 bytes, null-terminated)
-            mask_bytes = txd_data[pos:pos+32]
+            mask_bytes = bytes(raster[pos:pos+32])
             alpha_name = mask_bytes.rstrip(b'\x00').decode('ascii', errors='ignore')
             if alpha_name:
                 tex['alpha_name'] = alpha_name
@@ -375,8 +380,8 @@ class TXDSerializer: #vers 1
             pos += 32
 
             # Raster format (4 bytes) + D3D format (4 bytes) + Width/Height (2+2) + Depth/Levels/Type (1+1+1)
-            raster_format_flags, d3d_format, width, height, depth, num_levels, raster_type = struct.unpack(
-                '<IIHHBBB', txd_data[pos:pos+15]
+            raster_format_flags, d3d_format, width, height, depth, num_levels, raster_type = struct.unpack_from(
+                '<IIHHBBB', raster, pos
             )
 
             tex['width'] = width
@@ -465,7 +470,7 @@ class TXDSerializer: #vers 1
 
             # Compression byte (1 byte)
             # For D3D8 GTA3/VC: 0=raw, 1=DXT1, 3=DXT3, 5=DXT5
-            compression = struct.unpack('<B', txd_data[pos:pos+1])[0]
+            compression = raster[pos]
             pos += 1
 
             # Data size field (4 bytes):
@@ -475,7 +480,7 @@ class TXDSerializer: #vers 1
             is_sa_plus = (rw_version >= 0x1803FFFF)
             has_data_size_field = is_dxt or is_sa_plus
             if has_data_size_field:
-                data_size = struct.unpack('<I', txd_data[pos:pos+4])[0]
+                data_size = struct.unpack_from('<I', raster, pos)[0]
                 pos += 4
             else:
                 # Calculate expected size for GTA3/VC raw formats
@@ -497,7 +502,7 @@ class TXDSerializer: #vers 1
 
             # CRITICAL FIX: Store original binary data before any conversion
             if data_offset + data_size <= len(txd_data):
-                original_data = txd_data[data_offset:data_offset+data_size]
+                original_data = bytes(raster[data_offset:data_offset+data_size])
 
                 if 'DXT' in tex['format']:
                     # DXT compressed texture
@@ -565,7 +570,7 @@ class TXDSerializer: #vers 1
                         level_size = level_width * level_height * 4
 
                     if mipmap_offset + level_size <= data_offset + data_size:
-                        level_original_data = txd_data[mipmap_offset:mipmap_offset+level_size]
+                        level_original_data = bytes(raster[mipmap_offset:mipmap_offset+level_size])
 
                         mipmap = {
                             'level': level,
@@ -585,17 +590,17 @@ class TXDSerializer: #vers 1
 
             try:
                 if pos + 4 <= len(txd_data):
-                    bumpmap_size = struct.unpack('<I', txd_data[pos:pos+4])[0]
+                    bumpmap_size = struct.unpack_from('<I', raster, pos)[0]
 
                     # Validate bumpmap size
                     max_bumpmap_size = width * height * 4
 
                     if 0 < bumpmap_size <= max_bumpmap_size and pos + 5 + bumpmap_size <= len(txd_data):
                         pos += 4
-                        bumpmap_type = struct.unpack('<B', txd_data[pos:pos+1])[0]
+                        bumpmap_type = raster[pos]
                         pos += 1
 
-                        tex['bumpmap_data'] = txd_data[pos:pos+bumpmap_size]
+                        tex['bumpmap_data'] = bytes(raster[pos:pos+bumpmap_size])
                         tex['bumpmap_type'] = bumpmap_type
                         tex['has_bumpmap'] = True
                         pos += bumpmap_size
@@ -612,23 +617,23 @@ class TXDSerializer: #vers 1
             # === REFLECTION MAPS ===
             try:
                 if pos + 4 <= len(txd_data):
-                    reflection_size = struct.unpack('<I', txd_data[pos:pos+4])[0]
+                    reflection_size = struct.unpack_from('<I', raster, pos)[0]
                     expected_reflection_size = width * height * 3  # RGB
 
                     if reflection_size == expected_reflection_size and pos + 4 + reflection_size <= len(txd_data):
                         pos += 4
-                        tex['reflection_map'] = txd_data[pos:pos+reflection_size]
+                        tex['reflection_map'] = bytes(raster[pos:pos+reflection_size])
                         tex['has_reflection'] = True
                         pos += reflection_size
 
                         # Fresnel map
                         if pos + 4 <= len(txd_data):
-                            fresnel_size = struct.unpack('<I', txd_data[pos:pos+4])[0]
+                            fresnel_size = struct.unpack_from('<I', raster, pos)[0]
                             pos += 4
 
                             expected_fresnel_size = width * height  # Grayscale
                             if fresnel_size == expected_fresnel_size and pos + fresnel_size <= len(txd_data):
-                                tex['fresnel_map'] = txd_data[pos:pos+fresnel_size]
+                                tex['fresnel_map'] = bytes(raster[pos:pos+fresnel_size])
                                 pos += fresnel_size
 
                                 if self.main_window and hasattr(self.main_window, 'log_message'):
@@ -717,16 +722,20 @@ class TXDSerializer: #vers 1
         
         return total
     
-    def _compress_to_dxt(self, rgba_data: bytes, width: int, height: int, format_str: str) -> bytes: #vers 1
-        """Compress RGBA data to DXT format (placeholder)"""
-        if not rgba_data:
+    def _compress_to_dxt(self, rgba_data: bytes, width: int, height: int, format_str: str,
+                         punchthrough: bool = False) -> bytes: #vers 2
+        """Compress RGBA data to DXT format (apps/methods/dxt_codec.py)"""
+        encoded = None
+        if rgba_data:
+            encoded = encode_dxt(rgba_data, width, height, format_str,
+                                 self.dxt_quality, punchthrough=punchthrough)
+        if encoded is None:
             if 'DXT1' in format_str:
                 size = max(1, (width + 3) // 4) * max(1, (height + 3) // 4) * 8
             else:
                 size = max(1, (width + 3) // 4) * max(1, (height + 3) // 4) * 16
             return b'\x00' * size
-        
-        return rgba_data[:self._calculate_texture_size(width, height, format_str, 1)]
+        return encoded
 
     def _build_texture_dictionary_from_sections(self, texture_sections, texture_count): #vers 1
         """Build texture dictionary from pre-built texture sections"""
@@ -19,6 +19,9 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 from pathlib import Path
 
+from apps.methods.dxt_codec import decode_bc4, decode_bc5, decode_dxt1, decode_dxt3, decode_dxt5
+from apps.methods.texture_decode import decode_texture
+
 #    D3D / DXGI format identifiers                                              
 _D3D_FMT = {
     0x31545844: "DXT1",
@@ -467,207 +470,35 @@ def _decode_pixels(pdata: bytes, off: int, w: int, h: int, fmt: str) -> Tuple[by
         return b'', b''
 
 
-#    DXT1 decoder                                                                
-
-def _565_to_rgb(c: int):
-    r = ((c >> 11) & 0x1F) * 255 // 31
-    g = ((c >> 5)  & 0x3F) * 255 // 63
-    b = ((c >> 0)  & 0x1F) * 255 // 31
-    return r, g, b
-
+#    BCn decoders (shared NumPy codec, XTD palette rounding)                   
+# Partial edge blocks of sizes that are not a multiple of 4 (6x6, 10x12)
+# are decoded; the per-pixel loops these replaced left those pixels black.
 
 def _dxt1_decode(data: bytes, w: int, h: int) -> bytes:
-    out = bytearray(w * h * 4)
-    bw = max(1, w // 4)
-    bh = max(1, h // 4)
-    pos = 0
-    for by in range(bh):
-        for bx in range(bw):
-            if pos + 8 > len(data):
-                break
-            c0, c1 = struct.unpack_from("<HH", data, pos)
-            idx_bits = struct.unpack_from("<I", data, pos + 4)[0]
-            pos += 8
-
-            r0,g0,b0 = _565_to_rgb(c0)
-            r1,g1,b1 = _565_to_rgb(c1)
-            if c0 > c1:
-                pal = [(r0,g0,b0,255),(r1,g1,b1,255),
-                       ((2*r0+r1)//3,(2*g0+g1)//3,(2*b0+b1)//3,255),
-                       ((r0+2*r1)//3,(g0+2*g1)//3,(b0+2*b1)//3,255)]
-            else:
-                pal = [(r0,g0,b0,255),(r1,g1,b1,255),
-                       ((r0+r1)//2,(g0+g1)//2,(b0+b1)//2,255),
-                       (0,0,0,0)]
-
-            for py in range(4):
-                for px in range(4):
-                    ix = bx*4+px; iy = by*4+py
-                    if ix < w and iy < h:
-                        ci = (idx_bits >> (2*(py*4+px))) & 3
-                        r,g,b,a = pal[ci]
-                        p = (iy*w+ix)*4
-                        out[p:p+4] = bytes([r,g,b,a])
-    return bytes(out)
+    return decode_dxt1(data, w, h, expand='scale')
 
 
 def _dxt3_decode(data: bytes, w: int, h: int) -> bytes:
-    out = bytearray(w * h * 4)
-    bw = max(1, w // 4)
-    bh = max(1, h // 4)
-    pos = 0
-    for by in range(bh):
-        for bx in range(bw):
-            if pos + 16 > len(data):
-                break
-            alpha_block = data[pos:pos+8]
-            c0, c1 = struct.unpack_from("<HH", data, pos+8)
-            idx_bits = struct.unpack_from("<I", data, pos+12)[0]
-            pos += 16
-
-            r0,g0,b0 = _565_to_rgb(c0)
-            r1,g1,b1 = _565_to_rgb(c1)
-            pal = [(r0,g0,b0),(r1,g1,b1),
-                   ((2*r0+r1)//3,(2*g0+g1)//3,(2*b0+b1)//3),
-                   ((r0+2*r1)//3,(g0+2*g1)//3,(b0+2*b1)//3)]
-
-            for py in range(4):
-                ab = struct.unpack_from("<H", alpha_block, py*2)[0]
-                for px in range(4):
-                    ix = bx*4+px; iy = by*4+py
-                    if ix < w and iy < h:
-                        a = ((ab >> (px*4)) & 0xF) * 17
-                        ci = (idx_bits >> (2*(py*4+px))) & 3
-                        r,g,b = pal[ci]
-                        p = (iy*w+ix)*4
-                        out[p:p+4] = bytes([r,g,b,a])
-    return bytes(out)
+    return decode_dxt3(data, w, h, expand='scale')
 
 
 def _dxt5_decode(data: bytes, w: int, h: int) -> bytes:
-    out = bytearray(w * h * 4)
-    bw = max(1, w // 4)
-    bh = max(1, h // 4)
-    pos = 0
-    for by in range(bh):
-        for bx in range(bw):
-            if pos + 16 > len(data):
-                break
-            a0 = data[pos]; a1 = data[pos+1]
-            abits = int.from_bytes(data[pos+2:pos+8], 'little')
-            c0, c1 = struct.unpack_from("<HH", data, pos+8)
-            idx_bits = struct.unpack_from("<I", data, pos+12)[0]
-            pos += 16
-
-            if a0 > a1:
-                apal = [a0, a1,
-                        (6*a0+1*a1)//7,(5*a0+2*a1)//7,
-                        (4*a0+3*a1)//7,(3*a0+4*a1)//7,
-                        (2*a0+5*a1)//7,(1*a0+6*a1)//7]
-            else:
-                apal = [a0,a1,
-                        (4*a0+1*a1)//5,(3*a0+2*a1)//5,
-                        (2*a0+3*a1)//5,(1*a0+4*a1)//5,
-                        0, 255]
-
-            r0,g0,b0 = _565_to_rgb(c0)
-            r1,g1,b1 = _565_to_rgb(c1)
-            pal = [(r0,g0,b0),(r1,g1,b1),
-                   ((2*r0+r1)//3,(2*g0+g1)//3,(2*b0+b1)//3),
-                   ((r0+2*r1)//3,(g0+2*g1)//3,(b0+2*b1)//3)]
-
-            for py in range(4):
-                for px in range(4):
-                    ix = bx*4+px; iy = by*4+py
-                    if ix < w and iy < h:
-                        ai  = (abits >> (3*(py*4+px))) & 7
-                        a   = apal[ai]
-                        ci  = (idx_bits >> (2*(py*4+px))) & 3
-                        r,g,b = pal[ci]
-                        p = (iy*w+ix)*4
-                        out[p:p+4] = bytes([r,g,b,a])
-    return bytes(out)
+    return decode_dxt5(data, w, h, expand='scale', alpha_interp='floor')
 
 
 def _bc4_decode(data: bytes, w: int, h: int) -> bytes:
     """BC4 = single channel (R), expand to RGBA greyscale."""
-    grey = bytearray(w * h)
-    bw = max(1, w // 4); bh = max(1, h // 4)
-    pos = 0
-    for by in range(bh):
-        for bx in range(bw):
-            if pos + 8 > len(data): break
-            r0 = data[pos]; r1 = data[pos+1]
-            rbits = int.from_bytes(data[pos+2:pos+8], 'little')
-            pos += 8
-            if r0 > r1:
-                rpal = [r0,r1,(6*r0+r1)//7,(5*r0+2*r1)//7,
-                        (4*r0+3*r1)//7,(3*r0+4*r1)//7,(2*r0+5*r1)//7,(r0+6*r1)//7]
-            else:
-                rpal = [r0,r1,(4*r0+r1)//5,(3*r0+2*r1)//5,
-                        (2*r0+3*r1)//5,(r0+4*r1)//5,0,255]
-            for py in range(4):
-                for px in range(4):
-                    ix = bx*4+px; iy = by*4+py
-                    if ix < w and iy < h:
-                        ri = (rbits >> (3*(py*4+px))) & 7
-                        grey[iy*w+ix] = rpal[ri]
-    out = bytearray(w*h*4)
-    for i in range(w*h):
-        v = grey[i]
-        out[i*4:i*4+4] = bytes([v,v,v,255])
-    return bytes(out)
+    return decode_bc4(data, w, h)
 
 
 def _bc5_decode(data: bytes, w: int, h: int) -> bytes:
     """BC5 = RG normal map, reconstruct B=sqrt(1-R²-G²)."""
-    bw = max(1, w // 4); bh = max(1, h // 4)
-    out = bytearray(w*h*4)
-    pos = 0
-    for by in range(bh):
-        for bx in range(bw):
-            if pos + 16 > len(data): break
-            r0=data[pos]; r1=data[pos+1]
-            rbits = int.from_bytes(data[pos+2:pos+8],'little')
-            g0=data[pos+8]; g1=data[pos+9]
-            gbits = int.from_bytes(data[pos+10:pos+16],'little')
-            pos += 16
-            def _pal(v0,v1):
-                if v0>v1:
-                    return [v0,v1,(6*v0+v1)//7,(5*v0+2*v1)//7,
-                            (4*v0+3*v1)//7,(3*v0+4*v1)//7,(2*v0+5*v1)//7,(v0+6*v1)//7]
-                return [v0,v1,(4*v0+v1)//5,(3*v0+2*v1)//5,
-                        (2*v0+3*v1)//5,(v0+4*v1)//5,0,255]
-            rpal=_pal(r0,r1); gpal=_pal(g0,g1)
-            for py in range(4):
-                for px in range(4):
-                    ix=bx*4+px; iy=by*4+py
-                    if ix<w and iy<h:
-                        ri=(rbits>>(3*(py*4+px)))&7
-                        gi=(gbits>>(3*(py*4+px)))&7
-                        r=rpal[ri]; g=gpal[gi]
-                        # Reconstruct B from normal
-                        import math
-                        nx=(r/127.5)-1.0; ny=(g/127.5)-1.0
-                        nz2=max(0.0,1.0-nx*nx-ny*ny)
-                        b=int((math.sqrt(nz2)*0.5+0.5)*255)
-                        p=(iy*w+ix)*4
-                        out[p:p+4]=bytes([r,g,b,255])
-    return bytes(out)
+    return decode_bc5(data, w, h)
 
 
 def _bc7_decode_fallback(data: bytes, w: int, h: int) -> bytes:
-    """BC7 decode placeholder — returns magenta checkerboard to signal unsupported."""
-    out = bytearray(w * h * 4)
-    for y in range(h):
-        for x in range(w):
-            if (x // 8 + y // 8) % 2 == 0:
-                c = bytes([255, 0, 255, 255])
-            else:
-                c = bytes([180, 0, 180, 255])
-            p = (y * w + x) * 4
-            out[p:p+4] = c
-    return bytes(out)
+    """BC7 via PIL when installed, else magenta checkerboard to signal unsupported."""
+    return decode_texture(data, w, h, 'BC7')
 
 
 #    Detection helper                                                            
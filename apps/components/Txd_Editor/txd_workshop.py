@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/components/Txd_Editor/txd_workshop.py - Version: 29
+#this belongs in apps/components/Txd_Editor/txd_workshop.py - Version: 45
 # X-Seti - October10 2025 - Img Factory 1.5 - TXD Workshop Header Update
 
 """
@@ -19,13 +19,15 @@ import shutil
 import struct
 import sys
 import io
+import threading
 import numpy as np
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from PyQt6.QtWidgets import (QApplication, QSlider, QCheckBox,
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QListWidget, QDialog, QFormLayout, QSpinBox,  QListWidgetItem, QLabel, QPushButton, QFrame, QFileDialog, QLineEdit, QTextEdit, QMessageBox, QScrollArea, QGroupBox, QTableWidget, QTableWidgetItem, QColorDialog, QHeaderView, QAbstractItemView, QMenu, QComboBox, QInputDialog, QTabWidget, QDoubleSpinBox, QRadioButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, QRect, QByteArray
+from PyQt6.QtCore import (Qt, pyqtSignal, QSize, QPoint, QRect, QByteArray, QTimer, QThread,
+    QObject, QRunnable, QThreadPool)
 from PyQt6.QtGui import QFont, QIcon, QPixmap, QImage, QPainter, QPen, QBrush, QColor, QCursor
 from PyQt6.QtSvg import QSvgRenderer
 
@@ -34,6 +36,18 @@ from apps.methods.txd_versions import ( detect_txd_version, get_platform_name, g
 from apps.methods.txd_versions import (detect_txd_version, get_version_string, get_platform_name, get_platform_capabilities, TXDPlatform, TXDVersion)
 
 from apps.methods.imgfactory_svg_icons import SVGIconFactory
+from apps.methods.dxt_codec import decode_dxt1, decode_dxt3, decode_dxt5, QUALITY_TIERS
+from apps.methods.dxt_scheduler import CompressJob, get_compress_scheduler
+from apps.methods.texture_decode import decode_texture, get_decoder
+from apps.methods.texture_cache import DEFAULT_BUDGET_MB, get_decoded_cache
+from apps.methods.lzo_entry_cache import DEFAULT_BUDGET_MB as LZO_CACHE_MB, get_lzo_entry_cache
+from apps.methods.lazy_texture import LazyTexture, decode_pending
+from apps.methods.txd_native import decompress_dxt, parse_texture_native, thumbnail_source
+from apps.methods.thumbnail_cache import (DEFAULT_MAX_MB, THUMB_SIZE, ThumbnailCache,
+    downscale_rgba, encode_png, get_thumbnail_cache)
+from apps.methods.ring_log import DEFAULT_FPS as LOG_FPS, FrameLimiter, RingLog
+from apps.methods.rw_chunks import (RW_STRUCT, RW_TEXTURE_DICTIONARY, RW_TEXTURE_NATIVE,
+    iter_chunks, read_chunk_header)
 from apps.gui.txd_context_menu import setup_txd_context_menu
 
 
@@ -56,13 +70,11 @@ except ImportError:
 DEBUG_STANDALONE = False
 
 ##Methods list -
-# _565_to_rgb
-# _best_color_index
+# _build_txd_thumbnails
 # _call_external_upscaler
-# _encode_alpha_block
-# _encode_dxt1
-# _encode_dxt5
-# _rgb_to_565
+# _iter_txd_textures
+# _run_compress_jobs
+# _txd_texture_count
 # open_txd_workshop
 #
 ##class TXDConversionConfig: -
@@ -100,6 +112,7 @@ DEBUG_STANDALONE = False
 # _add_texture_to_table
 # _add_txd_tab
 # _add_warning_badge
+# _alpha_channel_error
 # _apply_always_on_top
 # _apply_button_font
 # _apply_button_mode
@@ -115,6 +128,7 @@ DEBUG_STANDALONE = False
 # _apply_theme
 # _apply_title_font
 # _apply_window_flags
+# _ask_alpha_error
 # _auto_generate_mipmaps
 # _auto_generate_mipmaps_to_level
 # _batch_export_dialog
@@ -124,12 +138,14 @@ DEBUG_STANDALONE = False
 # _build_toolbars
 # _build_txd_from_dff
 # _calculate_new_txd_size
+# _cancel_txd_load
 # _change_bit_depth
 # _change_format
 # _check_alpha_validity
 # _check_txd_vs_dff
 # _clear_texture_search
 # _close_txd_tab
+# _compress_all_textures
 # _compress_texture
 # _connect_texture_table_signals
 # _convert_bgra_to_rgba
@@ -215,6 +231,7 @@ DEBUG_STANDALONE = False
 # _create_zoom_in_icon
 # _create_zoom_out_icon
 # _decode_bumpmap
+# _decode_texture_levels
 # _decompress_dxt1
 # _decompress_dxt3
 # _decompress_dxt5
@@ -235,6 +252,7 @@ DEBUG_STANDALONE = False
 # _enable_move_mode
 # _enable_name_edit
 # _enable_txd_features_after_load
+# _encode_textures_dxt
 # _ensure_depends_structure
 # _export_all_textures
 # _export_alpha_only
@@ -243,6 +261,7 @@ DEBUG_STANDALONE = False
 # _extract_alpha_channel
 # _extract_alpha_for_display
 # _extract_txd_from_img
+# _fill_visible_thumbnails
 # _filter_txd_list
 # _find_txd_via_db
 # _flip_horizontal
@@ -277,10 +296,12 @@ DEBUG_STANDALONE = False
 # _load_settings
 # _load_texture_with_pil
 # _load_txd_textures
+# _load_txd_textures_background
 # _log
 # _manage_bumpmaps
 # _mark_as_modified
 # _mipmap_io_menu
+# _new_img_file
 # _normal_map    # Normal map bumpmap method
 # _normal_to_bump    # NEW - Normal to bump conversion
 # _normal_to_reflection    # NEW - Normal to reflection/Fresnel
@@ -289,7 +310,12 @@ DEBUG_STANDALONE = False
 # _on_splitter_moved
 # _on_texture_selected
 # _on_texture_table_double_click
+# _on_txd_load_failed
+# _on_txd_load_finished
+# _on_txd_load_progress
 # _on_txd_selected
+# _on_txd_textures_ready
+# _on_txd_thumbnails_ready
 # _open_alpha_coverage
 # _open_chk_file
 # _open_colour_adjust
@@ -320,6 +346,7 @@ DEBUG_STANDALONE = False
 # _rebuild_txd_data_with_texture_progress
 # _rebuild_txd_with_size_management
 # _refresh_icons
+# _refresh_load_log
 # _refresh_main_window
 # _reload_texture_table
 # _remove_mipmaps
@@ -353,16 +380,19 @@ DEBUG_STANDALONE = False
 # _scan_available_locales
 # _set_checkerboard_bg
 # _set_current_rgba
+# _set_row_thumbnail
 # _set_selection_buttons_enabled
 # _set_status
 # _set_tiled_preview
 # _set_transform_buttons_enabled
+# _set_txd_item_preview
 # _setup_hotkeys
 # _setup_settings_button
 # _setup_status_indicators
 # _show_alpha_view
 # _show_amiga_locale_error
 # _show_detailed_info
+# _show_load_log
 # _show_mobile_texture
 # _show_name_context_menu
 # _show_normal_view
@@ -381,10 +411,14 @@ DEBUG_STANDALONE = False
 # _show_window_context_menu
 # _show_workshop_settings
 # _sobel_filter    # Sobel edge detection for bumpmap
+# _start_thumbnail_worker
+# _stop_thumbnail_worker
 # _strip_unsupported_features_for_version
 # _svg_to_icon
 # _switch_txd_tab
 # _texture_statistics
+# _thumbnail_archive_key
+# _thumbnail_source
 # _toggle_alpha_invert
 # _toggle_checkerboard
 # _toggle_maximize
@@ -408,9 +442,11 @@ DEBUG_STANDALONE = False
 # _update_transform_text_panel_visibility
 # _upscale_texture
 # _upscale_texture_advanced
+# _validate_loaded_alpha
 # _validate_texture_dimensions
 # _verify_alpha_exists
 # _view_bumpmap    # Opens bumpmap manager
+# _wait_for_txd_load
 # copy_texture
 # delete_texture
 # duplicate_texture
@@ -491,9 +527,6 @@ DEBUG_STANDALONE = False
 # _apply_changes
 # _auto_generate_mipmaps
 # _clear_all_levels
-# _compress_to_dxt1
-# _compress_to_dxt3
-# _compress_to_dxt5
 # _create_action_section
 # _create_bottom_bar
 # _create_info_section
@@ -556,6 +589,19 @@ DEBUG_STANDALONE = False
 # zoom_in
 # zoom_out
 #
+##class TXDLoadSignals: -
+#
+##class TXDLoadTask: -
+# __init__
+# _flush
+# cancel
+# run
+# wait
+#
+##class TXDThumbnailWorker: -
+# __init__
+# run
+#
 # Build information
 App_name = "Txd Workshop"
 App_build = "13"
@@ -1077,7 +1123,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         return pal.color(pal.ColorRole.WindowText)
 
 
-    def __init__(self, parent=None, main_window=None): #vers 10
+    def __init__(self, parent=None, main_window=None): #vers 11
         """Initialize TXD Workshop"""
         if DEBUG_STANDALONE and main_window is None:
             print(App_name + " Initializing ...")
@@ -1107,6 +1153,24 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         self.current_txd_path = None
         self.save_to_source_location = True
         self.last_save_directory = None
+        self.dxt_quality = 'normal'  # DXT encoder tier: fast / normal / high
+        self.decode_cache_mb = DEFAULT_BUDGET_MB  # decoded RGBA cache budget
+        self.lazy_decode = True  # decode textures when first viewed, not on load
+        self.thumbnail_cache_mb = DEFAULT_MAX_MB  # on-disk TXD preview cache cap
+        self.lzo_cache_mb = LZO_CACHE_MB  # decompressed Xbox IMG entry cache budget
+        self.lzo_cache_spill = False  # spill evicted Xbox entries to the disk cache
+        self.background_rw_detection = False  # IMGs opened here: RW versions on a QThread
+        self.lazy_rw_detection = False  # IMGs opened here: RW versions of viewed rows only
+        self._thumbnail_worker = None
+        self._txd_items_by_name = {}
+        self.background_load = True  # parse TXDs on the thread pool, fill table progressively
+        self._load_task = None
+        self._load_task_name = None
+        self._load_id = 0
+        self._txd_load_partial = False  # background load was cancelled part way
+        self.fast_load = False  # skip the structural log dialog on the dialog load path
+        self.load_log = RingLog()  # load diagnostics, View > Load Log
+        self._load_log_dialog = None
         self.texture_view_states = {}
         self._current_view_state = 0
 
@@ -1233,7 +1297,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         """Return menu label for imgfactory menu bar."""
         return "TXD"
 
-    def _build_menus_into_qmenu(self, parent_menu): #vers 1
+    def _build_menus_into_qmenu(self, parent_menu): #vers 3
         """Populate parent_menu with TXD Workshop actions for imgfactory injection."""
         from PyQt6.QtGui import QAction
 
@@ -1254,6 +1318,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         tm.addAction("Export All…",          self.export_all_textures)
         tm.addSeparator()
         tm.addAction("Convert Format…",      self._show_convert_dialog if hasattr(self, '_show_convert_dialog') else lambda: None)
+        tm.addAction("Compress All to DXT…", self._compress_all_textures)
 
         # Tools
         tools = parent_menu.addMenu("Tools")
@@ -1270,6 +1335,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         # View
         vm = parent_menu.addMenu("View")
         vm.addAction("TXD Info",             self._show_txd_info)
+        vm.addAction("Load Log…",            self._show_load_log)
 
     def setup_ui(self): #vers 9
         """Setup the main UI layout"""
@@ -2977,7 +3043,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         return self.toolbar
 
 
-    def _create_left_panel(self): #vers 5
+    def _create_left_panel(self): #vers 6
         """Create left panel - TXD file list (only in IMG Factory mode)"""
         # In standalone mode, don't create this panel
         if self.standalone_mode:
@@ -3017,13 +3083,14 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 
         self.txd_list_widget = QListWidget()
         self.txd_list_widget.setAlternatingRowColors(True)
+        self.txd_list_widget.setIconSize(QSize(32, 32))
         self.txd_list_widget.itemClicked.connect(self._on_txd_selected)
         layout.addWidget(self.txd_list_widget)
 
         return panel
 
 
-    def _create_middle_panel(self): #vers 5
+    def _create_middle_panel(self): #vers 7
         """Create middle panel - Texture list with mini toolbar shown in docked mode."""
         panel = QFrame()
         panel.setFrameStyle(QFrame.Shape.StyledPanel)
@@ -3038,6 +3105,23 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         self._textures_header.setFont(QFont("Arial", 10, QFont.Weight.Bold))
         layout.addWidget(self._textures_header)
 
+        # Background load progress - shown while a TXD streams in
+        from PyQt6.QtWidgets import QProgressBar
+        self._load_progress_row = QFrame()
+        load_layout = QHBoxLayout(self._load_progress_row)
+        load_layout.setContentsMargins(0, 0, 0, 0)
+        load_layout.setSpacing(3)
+        self._load_progress_bar = QProgressBar()
+        self._load_progress_bar.setRange(0, 100)
+        self._load_progress_bar.setMaximumHeight(16)
+        load_layout.addWidget(self._load_progress_bar)
+        self._load_cancel_btn = QPushButton("Cancel")
+        self._load_cancel_btn.setToolTip("Stop loading this TXD")
+        self._load_cancel_btn.clicked.connect(self._cancel_txd_load)
+        load_layout.addWidget(self._load_cancel_btn)
+        self._load_progress_row.setVisible(False)
+        layout.addWidget(self._load_progress_row)
+
         #    Mini toolbar: 4 icon buttons — only shown when docked          
         # (toolbar has these too; in docked mode the toolbar is hidden)
         icon_color = self._get_icon_color()
@@ -3098,6 +3182,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             QAbstractItemView.SelectionMode.SingleSelection)
         self.texture_table.setAlternatingRowColors(True)
         self.texture_table.itemSelectionChanged.connect(self._on_texture_selected)
+        self.texture_table.verticalScrollBar().valueChanged.connect(self._fill_visible_thumbnails)
         self.texture_table.setIconSize(QSize(64, 64))
         self.texture_table.setContextMenuPolicy(
             Qt.ContextMenuPolicy.CustomContextMenu)
@@ -5877,7 +5962,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         menu.exec(self.mipmap_io_btn.mapToGlobal(self.mipmap_io_btn.rect().bottomLeft()))
 
 
-    def _auto_generate_mipmaps_to_level(self, num_levels): #vers 1
+    def _auto_generate_mipmaps_to_level(self, num_levels): #vers 2
         """Generate mipmaps down to specified level count"""
         if not self.selected_texture:
             return
@@ -5967,6 +6052,11 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             # Update mipmap count
             self.selected_texture['mipmaps'] = len(self.selected_texture['mipmap_levels'])
 
+            # DXT textures need the new levels compressed before saving
+            fmt = self.selected_texture.get('format', '')
+            if 'DXT' in fmt:
+                self._encode_textures_dxt([self.selected_texture], fmt, only_missing=True)
+
             # Update display
             self._update_texture_info(self.selected_texture)
             self._mark_as_modified()
@@ -5975,7 +6065,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                 self.main_window.log_message(f"Generated {level_num} mipmap levels")
 
             actual_levels = len(self.selected_texture['mipmap_levels'])
-            min_dim = min(current_width * 2, currentQFormLayout_height * 2)
+            min_dim = min(current_width * 2, current_height * 2)
             QMessageBox.information(self, "Success",
                 f"Generated {actual_levels} mipmap levels\n"
                 f"From {width}x{height} down to {min_dim}x{min_dim}")
@@ -6410,19 +6500,26 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 
 #------ TXD functions
 
-    def _load_img_txd_list(self): #vers 2
-        """Load TXD files from IMG archive"""
+    def _load_img_txd_list(self): #vers 3
+        """Load TXD files from IMG archive. Previews come from the on-disk
+        thumbnail cache; TXDs not cached yet are previewed in the background"""
         try:
             # Safety check for standalone mode
             if self.standalone_mode or not hasattr(self, 'txd_list_widget') or self.txd_list_widget is None:
                 return
 
+            self._stop_thumbnail_worker()
             self.txd_list_widget.clear()
             self.txd_list = []
+            self._txd_items_by_name = {}
 
             if not self.current_img:
                 return
 
+            img_path, mtime = self._thumbnail_archive_key()
+            cached = get_thumbnail_cache().get_archive(img_path, mtime) if img_path else {}
+            uncached = []
+
             for entry in self.current_img.entries:
                 if entry.name.lower().endswith('.txd'):
                     self.txd_list.append(entry)
@@ -6431,17 +6528,83 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                     size_kb = entry.size / 1024
                     item.setToolTip(f"{entry.name}\nSize: {size_kb:.1f} KB")
                     self.txd_list_widget.addItem(item)
+                    self._txd_items_by_name[entry.name] = item
+                    thumbs = cached.get(ThumbnailCache.entry_key(entry))
+                    if thumbs is None:
+                        uncached.append(entry)
+                    else:
+                        self._set_txd_item_preview(item, entry, thumbs)
 
             hdr = getattr(self, '_txd_list_header', None)
             if hdr:
                 hdr.setText(f"TXD Files  ({len(self.txd_list)})")
             if self.main_window and hasattr(self.main_window, 'log_message'):
-                self.main_window.log_message(f"📋 Found {len(self.txd_list)} TXD files")
+                self.main_window.log_message(f"📋 Found {len(self.txd_list)} TXD files "
+                                             f"({len(self.txd_list) - len(uncached)} previews cached)")
+            if img_path and uncached:
+                self._start_thumbnail_worker(img_path, mtime, uncached)
         except Exception as e:
             if self.main_window and hasattr(self.main_window, 'log_message'):
                 self.main_window.log_message(f"Error loading TXD list: {str(e)}")
 
 
+    def _thumbnail_archive_key(self): #vers 1
+        """(absolute path, mtime_ns) identifying the current IMG state for the
+        thumbnail cache, or (None, 0) if the archive is not on disk"""
+        try:
+            img_path = os.path.abspath(self.current_img.file_path)
+            return img_path, os.stat(img_path).st_mtime_ns
+        except (AttributeError, TypeError, OSError):
+            return None, 0
+
+
+    def _set_txd_item_preview(self, item, entry, thumbs): #vers 1
+        """Show cached previews on a TXD list item - first texture as icon,
+        texture names in the tooltip"""
+        if thumbs:
+            pixmap = QPixmap()
+            if pixmap.loadFromData(thumbs[0]['image'], 'PNG'):
+                item.setIcon(QIcon(pixmap))
+        names = ", ".join(t['name'] for t in thumbs[:8]) + (" ..." if len(thumbs) > 8 else "")
+        item.setToolTip(f"{entry.name}\nSize: {entry.size / 1024:.1f} KB\n"
+                        f"{len(thumbs)} textures: {names}" if thumbs else
+                        f"{entry.name}\nSize: {entry.size / 1024:.1f} KB\nNo textures")
+
+
+    def _start_thumbnail_worker(self, img_path, mtime, entries): #vers 2
+        """Build and cache previews of entries on a background thread. The
+        worker is registered with the IMGFile, which stops it before the
+        archive is rewritten (invalidate_mappings)."""
+        worker = TXDThumbnailWorker(self.current_img, img_path, mtime, entries,
+                                    get_thumbnail_cache(), self)
+        worker.thumbnails_ready.connect(self._on_txd_thumbnails_ready)
+        worker.finished.connect(worker.deleteLater)
+        self._thumbnail_worker = worker
+        if hasattr(self.current_img, 'add_background_reader'):
+            self.current_img.add_background_reader(worker)
+        worker.start(QThread.Priority.LowPriority)
+
+
+    def _stop_thumbnail_worker(self): #vers 1
+        """Stop the background preview builder (it finishes its current TXD)"""
+        worker = self._thumbnail_worker
+        self._thumbnail_worker = None
+        if worker is not None:
+            try:
+                worker.thumbnails_ready.disconnect(self._on_txd_thumbnails_ready)
+                worker.requestInterruption()
+                worker.wait(2000)
+            except RuntimeError:
+                pass  # already deleted after finishing
+
+
+    def _on_txd_thumbnails_ready(self, entry, thumbs): #vers 1
+        """Worker finished one TXD - update its list item"""
+        item = self._txd_items_by_name.get(entry.name)
+        if item is not None and item.data(Qt.ItemDataRole.UserRole) is entry:
+            self._set_txd_item_preview(item, entry, thumbs)
+
+
     def _create_blank_texture(self, width, height, with_alpha=False): #vers 2
         """Create blank RGBA texture data with optional alpha"""
         if with_alpha:
@@ -7235,7 +7398,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                     break
 
 
-    def _save_undo_state(self, action_name): #vers 2
+    def _save_undo_state(self, action_name): #vers 3
         """
         Save current state to undo stack - FIXED: Properly preserves binary data
 
@@ -7257,8 +7420,8 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             if 'original_bgra_data' in texture:
                 tex_copy['original_bgra_data'] = texture['original_bgra_data']
 
-            if 'rgba_data' in texture:
-                tex_copy['rgba_data'] = texture['rgba_data']
+            # rgba_data comes across with copy() - reading it here would
+            # force a decode of every lazily loaded texture
 
             if 'bumpmap_data' in texture:
                 tex_copy['bumpmap_data'] = texture['bumpmap_data']
@@ -7281,9 +7444,6 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                     if 'original_bgra_data' in level:
                         level_copy['original_bgra_data'] = level['original_bgra_data']
 
-                    if 'rgba_data' in level:
-                        level_copy['rgba_data'] = level['rgba_data']
-
                     mipmap_copy.append(level_copy)
 
                 tex_copy['mipmap_levels'] = mipmap_copy
@@ -7327,7 +7487,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             QMessageBox.critical(self, "Undo Error", f"Failed to undo: {str(e)}")
 
 
-    def _auto_generate_mipmaps(self): #vers 1
+    def _auto_generate_mipmaps(self): #vers 2
         """Auto-generate all mipmap levels from main texture"""
         if not self.selected_texture:
             QMessageBox.warning(self, "No Selection", "Please select a texture first")
@@ -7418,6 +7578,11 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             # Update mipmap count
             self.selected_texture['mipmaps'] = len(self.selected_texture['mipmap_levels'])
 
+            # DXT textures need the new levels compressed before saving
+            fmt = self.selected_texture.get('format', '')
+            if 'DXT' in fmt:
+                self._encode_textures_dxt([self.selected_texture], fmt, only_missing=True)
+
             # Update display
             self._update_texture_info(self.selected_texture)
             self._mark_as_modified()
@@ -7579,7 +7744,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             self.main_window.log_message(f"Alpha invert {status} ({view_name} view)")
 
 
-    def _show_texture_context_menu(self, position): #vers 2
+    def _show_texture_context_menu(self, position): #vers 3
         """Show context menu for texture operations - simplified"""
         if not self.selected_texture:
             return
@@ -7610,6 +7775,9 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 
         menu.addSeparator()
 
+        compress_all_action = menu.addAction(self._create_compress_icon(), "Compress All to DXT…")
+        compress_all_action.triggered.connect(self._compress_all_textures)
+
         # Delete texture
         delete_action = menu.addAction(self._create_trash_icon(), "Delete Texture")
         delete_action.triggered.connect(self._delete_texture)
@@ -7617,14 +7785,24 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         menu.exec(self.texture_table.viewport().mapToGlobal(position))
 
 
-    def load_from_img_archive(self, img_path): #vers 1
+    def _new_img_file(self, img_path): #vers 1
+        """IMGFile for img_path with the RW detection settings applied (they
+        only take effect before the entries are first read)."""
+        from apps.methods.img_core_classes import IMGFile
+        img = IMGFile(img_path)
+        img.background_rw_detection = self.background_rw_detection
+        img.lazy_rw_detection = self.lazy_rw_detection
+        return img
+
+
+    def load_from_img_archive(self, img_path): #vers 2
         """Load TXD list from IMG archive"""
         try:
             if self.main_window and hasattr(self.main_window, 'current_img'):
                 self.current_img = self.main_window.current_img
             else:
                 from apps.methods.img_core_classes import IMGFile
-                self.current_img = IMGFile(img_path)
+                self.current_img = self._new_img_file(img_path)
                 self.current_img.open()
 
             img_name = os.path.basename(img_path)
@@ -7824,83 +8002,115 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                 self.main_window.log_message(f"Extract error: {str(e)}")
             return None
 
-    def _load_txd_textures(self, txd_data, txd_name): #vers 15
-        """Load textures from TXD data with detailed structural parsing, log output, and granular control"""
+    def _load_txd_textures(self, txd_data, txd_name): #vers 21
+        """Load textures from TXD data with detailed structural parsing, log output, and granular control.
+        With background_load the TXD is parsed off-thread instead - see _load_txd_textures_background.
+        With fast_load the structural log dialog is skipped; the log always goes to
+        self.load_log (ring buffer, View > Load Log) and the dialog repaints at LOG_FPS"""
+        if self.background_load:
+            return self._load_txd_textures_background(txd_data, txd_name)
+        self._cancel_txd_load()
+        self._txd_load_partial = False
+        dialog = None
         try:
             from PyQt6.QtWidgets import (QProgressDialog, QMessageBox, QDialog,
                                         QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QLabel)
             from PyQt6.QtCore import Qt
             import struct
 
-            # Create custom progress dialog with log output
-            dialog = QDialog(self)
-            dialog.setWindowTitle("TXD Structural Parser")
-            dialog.setMinimumWidth(800)
-            dialog.setMinimumHeight(600)
-            dialog.setModal(True)
-
-            layout = QVBoxLayout(dialog)
-
-            # Header
-            header = QLabel(f"Loading: {txd_name}")
-            header.setStyleSheet("font-size: 14px; font-weight: bold; padding: 5px;")
-            layout.addWidget(header)
-
-            # Progress bar
-            from PyQt6.QtWidgets import QProgressBar
-            progress_bar = QProgressBar()
-            progress_bar.setRange(0, 100)
-            progress_bar.setValue(0)
-            layout.addWidget(progress_bar)
-
-            # Log output
-            log_output = QTextEdit()
-            log_output.setReadOnly(True)
-            log_output.setStyleSheet("font-family: 'Courier New', monospace; font-size: 10px;")
-            layout.addWidget(log_output)
-
-            # Button layout
-            button_layout = QHBoxLayout()
-
-            cancel_btn = QPushButton("Cancel Loading")
-            cancel_btn.setStyleSheet("background-color: palette(highlight); color: palette(highlightedText);")
-            button_layout.addWidget(cancel_btn)
-
-            button_layout.addStretch()
-            layout.addLayout(button_layout)
-
-            # Show dialog
-            dialog.show()
-            dialog.raise_()
-            dialog.activateWindow()
-
             # Tracking
             alpha_errors = []
             skip_alpha_textures = False
             ignore_all_errors = False
             skip_all_entries = False
             user_cancelled = False
+            pending_lines = []
+            progress_value = 0
+            frame = FrameLimiter(LOG_FPS)
+            self.load_log.append("")
+            self.load_log.append(f"### {txd_name}")
+
+            def log(message):  #vers 2
+                """Record message in the load log; the dialog (if shown) is
+                refreshed at most LOG_FPS times a second by flush_log"""
+                self.load_log.append(message)
+                if dialog is not None:
+                    pending_lines.append(message)
+                    if frame.due():
+                        flush_log()
+
+            def flush_log():  #vers 1
+                """Push buffered lines and progress to the dialog, then handle events
+                (repaint, Cancel button) - one frame"""
+                if pending_lines:
+                    log_output.append("\n".join(pending_lines))
+                    pending_lines.clear()
+                    log_output.verticalScrollBar().setValue(log_output.verticalScrollBar().maximum())
+                progress_bar.setValue(progress_value)
+                QApplication.processEvents()
 
-            def log(message):  #vers 1
-                """Add message to log output"""
-                log_output.append(message)
-                log_output.verticalScrollBar().setValue(log_output.verticalScrollBar().maximum())
-                dialog.repaint()
-
-            def update_progress(value, message=None):  #vers 1
+            def update_progress(value, message=None):  #vers 2
                 """Update progress bar and optionally log"""
-                progress_bar.setValue(value)
+                nonlocal progress_value
+                progress_value = value
                 if message:
                     log(message)
+                elif dialog is not None and frame.due():
+                    flush_log()
                 if user_cancelled:
                     raise Exception("Loading cancelled by user")
 
-            # Connect cancel button
-            def handle_cancel():  #vers 1
-                nonlocal user_cancelled
-                user_cancelled = True
-
-            cancel_btn.clicked.connect(handle_cancel)
+            if self.fast_load:
+                QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            else:
+                # Create custom progress dialog with log output
+                dialog = QDialog(self)
+                dialog.setWindowTitle("TXD Structural Parser")
+                dialog.setMinimumWidth(800)
+                dialog.setMinimumHeight(600)
+                dialog.setModal(True)
+
+                layout = QVBoxLayout(dialog)
+
+                # Header
+                header = QLabel(f"Loading: {txd_name}")
+                header.setStyleSheet("font-size: 14px; font-weight: bold; padding: 5px;")
+                layout.addWidget(header)
+
+                # Progress bar
+                from PyQt6.QtWidgets import QProgressBar
+                progress_bar = QProgressBar()
+                progress_bar.setRange(0, 100)
+                progress_bar.setValue(0)
+                layout.addWidget(progress_bar)
+
+                # Log output
+                log_output = QTextEdit()
+                log_output.setReadOnly(True)
+                log_output.setStyleSheet("font-family: 'Courier New', monospace; font-size: 10px;")
+                layout.addWidget(log_output)
+
+                # Button layout
+                button_layout = QHBoxLayout()
+
+                cancel_btn = QPushButton("Cancel Loading")
+                cancel_btn.setStyleSheet("background-color: palette(highlight); color: palette(highlightedText);")
+                button_layout.addWidget(cancel_btn)
+
+                button_layout.addStretch()
+                layout.addLayout(button_layout)
+
+                # Show dialog
+                dialog.show()
+                dialog.raise_()
+                dialog.activateWindow()
+
+                # Connect cancel button
+                def handle_cancel():  #vers 1
+                    nonlocal user_cancelled
+                    user_cancelled = True
+
+                cancel_btn.clicked.connect(handle_cancel)
 
             # Reset state
             update_progress(1, "=" * 80)
@@ -7998,6 +8208,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             log(f"PHASE 4: PARSING {texture_count} TEXTURE NATIVE SECTIONS")
             log("=" * 80)
             update_progress(25)
+            parsed = []
 
             for i in range(texture_count):
                 # Check bounds
@@ -8009,7 +8220,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 
                 try:
                     # Progress calculation
-                    texture_progress = 25 + int((i / texture_count) * 60)
+                    texture_progress = 25 + int((i / texture_count) * 45)
 
                     log("")
                     log(f"[TEXTURE {i+1}/{texture_count}]")
@@ -8036,7 +8247,8 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                     # Parse texture structure (88-byte header + data)
                     log(f"  Status       : Parsing 88-byte texture structure...")
 
-                    tex = self._parse_single_texture(txd_data, offset, i, rw_version=self.txd_version_id)
+                    tex = self._parse_single_texture(txd_data, offset, i, rw_version=self.txd_version_id,
+                                                     decode=False)
 
                     if tex:
                         tex_name = tex.get('name', f'texture_{i}')
@@ -8054,135 +8266,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                         if has_alpha:
                             log(f"  Alpha Name   : {alpha_name}")
 
-                        # === ALPHA CHANNEL VALIDATION ===
-                        if has_alpha and not skip_alpha_textures and not skip_all_entries:
-                            log(f"  Validating alpha channel...")
-
-                            rgba_data = tex.get('rgba_data', b'')
-                            if rgba_data and len(rgba_data) >= 4:
-                                has_transparency = False
-                                all_opaque = True
-                                identical_to_rgb = True
-
-                                sample_size = min(1000, len(rgba_data) // 4)
-
-                                for pixel_idx in range(sample_size):
-                                    byte_offset = pixel_idx * 4
-                                    if byte_offset + 3 < len(rgba_data):
-                                        r = rgba_data[byte_offset]
-                                        g = rgba_data[byte_offset + 1]
-                                        b = rgba_data[byte_offset + 2]
-                                        a = rgba_data[byte_offset + 3]
-
-                                        if a < 255:
-                                            all_opaque = False
-                                            has_transparency = True
-
-                                        if a != r and a != g and a != b:
-                                            identical_to_rgb = False
-
-                                # Detect problematic alpha
-                                alpha_error = None
-                                if all_opaque:
-                                    alpha_error = f"Alpha channel is all opaque (255) - no transparency"
-                                    log(f"  ALPHA ERROR  : {alpha_error}")
-                                elif identical_to_rgb:
-                                    alpha_error = f"Alpha channel identical to RGB data - corrupted"
-                                    log(f"  ALPHA ERROR  : {alpha_error}")
-
-                                # Handle alpha errors
-                                if alpha_error and not ignore_all_errors:
-                                    alpha_errors.append((i+1, tex_name, alpha_error))
-
-                                    # Show error dialog with options
-                                    error_dialog = QDialog(dialog)
-                                    error_dialog.setWindowTitle("Alpha Channel Error")
-                                    error_dialog.setModal(True)
-                                    error_dialog.setMinimumWidth(500)
-
-                                    error_layout = QVBoxLayout(error_dialog)
-
-                                    error_label = QLabel(
-                                        f"Corrupted alpha channel detected:\n\n"
-                                        f"Texture {i+1}: {tex_name}\n"
-                                        f"Error: {alpha_error}\n\n"
-                                        f"How would you like to proceed?"
-                                    )
-                                    error_label.setWordWrap(True)
-                                    error_layout.addWidget(error_label)
-
-                                    btn_layout = QHBoxLayout()
-
-                                    ignore_entry_btn = QPushButton("Ignore Entry")
-                                    ignore_entry_btn.setToolTip("Load this texture with alpha as-is")
-
-                                    ignore_all_btn = QPushButton("Ignore All")
-                                    ignore_all_btn.setToolTip("Ignore all alpha errors and continue")
-
-                                    skip_alpha_btn = QPushButton("Strip Alpha")
-                                    skip_alpha_btn.setToolTip("Remove alpha from this texture only")
-
-                                    skip_all_btn = QPushButton("Strip All Alpha")
-                                    skip_all_btn.setToolTip("Remove alpha from all remaining textures")
-                                    skip_all_btn.setStyleSheet("background-color: palette(button); color: palette(buttonText);")
-
-                                    cancel_load_btn = QPushButton("Cancel Loading")
-                                    cancel_load_btn.setStyleSheet("background-color: palette(highlight); color: palette(highlightedText);")
-
-                                    btn_layout.addWidget(ignore_entry_btn)
-                                    btn_layout.addWidget(ignore_all_btn)
-                                    btn_layout.addWidget(skip_alpha_btn)
-                                    btn_layout.addWidget(skip_all_btn)
-                                    btn_layout.addWidget(cancel_load_btn)
-
-                                    error_layout.addLayout(btn_layout)
-
-                                    user_choice = [None]
-
-                                    def set_choice(choice):  #vers 1
-                                        user_choice[0] = choice
-                                        error_dialog.accept()
-
-                                    ignore_entry_btn.clicked.connect(lambda: set_choice('ignore_entry'))
-                                    ignore_all_btn.clicked.connect(lambda: set_choice('ignore_all'))
-                                    skip_alpha_btn.clicked.connect(lambda: set_choice('skip_alpha'))
-                                    skip_all_btn.clicked.connect(lambda: set_choice('skip_all'))
-                                    cancel_load_btn.clicked.connect(lambda: set_choice('cancel'))
-
-                                    error_dialog.exec()
-
-                                    choice = user_choice[0]
-
-                                    if choice == 'cancel':
-                                        log(f"  User Action  : CANCELLED LOADING")
-                                        raise Exception("Loading cancelled due to alpha errors")
-                                    elif choice == 'ignore_entry':
-                                        log(f"  User Action  : Ignored this entry, loading with alpha")
-                                    elif choice == 'ignore_all':
-                                        ignore_all_errors = True
-                                        log(f"  User Action  : Ignoring all future alpha errors")
-                                    elif choice == 'skip_alpha':
-                                        tex['has_alpha'] = False
-                                        if 'alpha_name' in tex:
-                                            del tex['alpha_name']
-                                        log(f"  User Action  : Stripped alpha from this texture")
-                                    elif choice == 'skip_all':
-                                        skip_alpha_textures = True
-                                        tex['has_alpha'] = False
-                                        if 'alpha_name' in tex:
-                                            del tex['alpha_name']
-                                        log(f"  User Action  : Stripping alpha from all remaining textures")
-
-                            else:
-                                log(f"  Alpha Valid  : Channel validated successfully")
-
-                        elif skip_alpha_textures and has_alpha:
-                            tex['has_alpha'] = False
-                            if 'alpha_name' in tex:
-                                del tex['alpha_name']
-                            log(f"  Alpha Action : Stripped (skip all active)")
-
-                        textures.append(tex)
+                        parsed.append((i, tex))
                         log(f"  Result       : SUCCESS - Added to texture list")
                     else:
                         log(f"  Result       : FAILED - Parse returned no data")
@@ -8198,6 +8282,83 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                     offset += 1000
                     continue
 
+            # === DECODE ALL MIPMAP LEVELS IN ONE BATCH ===
+            log("")
+            update_progress(70)
+            if self.lazy_decode:
+                # Textures decode on first view (row selected, thumbnail, export)
+                log(f"PHASE 4b: DECODE DEFERRED - {len(parsed)} TEXTURES DECODE WHEN VIEWED")
+                log("-" * 80)
+            else:
+                log(f"PHASE 4b: DECODING {len(parsed)} TEXTURES")
+                log("-" * 80)
+                import time
+                decode_start = time.perf_counter()
+                self._decode_texture_levels([tex for _, tex in parsed])
+                log(f"Decoded in {(time.perf_counter() - decode_start) * 1000:.0f} ms")
+                cache_stats = get_decoded_cache().stats()
+                log(f"Decode cache   : {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                    f"{cache_stats['size_bytes'] / (1024 * 1024):.1f} / "
+                    f"{cache_stats['budget_bytes'] / (1024 * 1024):.0f} MB")
+
+            if self.lazy_decode:
+                # Alpha validation below needs the pixels of the alpha textures
+                # only - decode those in one batch, the rest stay deferred
+                decode_pending([tex for _, tex in parsed if tex.get('has_alpha')])
+
+            for i, tex in parsed:
+                tex_name = tex.get('name', f'texture_{i}')
+                has_alpha = tex.get('has_alpha', False)
+                update_progress(75 + int((i / texture_count) * 10))
+
+                # === ALPHA CHANNEL VALIDATION ===
+                if has_alpha and not skip_alpha_textures and not skip_all_entries:
+                    log(f"[TEXTURE {i+1}/{texture_count}] {tex_name}")
+                    log(f"  Validating alpha channel...")
+
+                    rgba_data = tex.get('rgba_data', b'')
+                    if rgba_data and len(rgba_data) >= 4:
+                        # Detect problematic alpha
+                        alpha_error = self._alpha_channel_error(rgba_data)
+                        if alpha_error:
+                            log(f"  ALPHA ERROR  : {alpha_error}")
+
+                        # Handle alpha errors
+                        if alpha_error and not ignore_all_errors:
+                            alpha_errors.append((i+1, tex_name, alpha_error))
+                            choice = self._ask_alpha_error(dialog or self, i + 1, tex_name, alpha_error)
+
+                            if choice == 'cancel':
+                                log(f"  User Action  : CANCELLED LOADING")
+                                raise Exception("Loading cancelled due to alpha errors")
+                            elif choice == 'ignore_entry':
+                                log(f"  User Action  : Ignored this entry, loading with alpha")
+                            elif choice == 'ignore_all':
+                                ignore_all_errors = True
+                                log(f"  User Action  : Ignoring all future alpha errors")
+                            elif choice == 'skip_alpha':
+                                tex['has_alpha'] = False
+                                if 'alpha_name' in tex:
+                                    del tex['alpha_name']
+                                log(f"  User Action  : Stripped alpha from this texture")
+                            elif choice == 'skip_all':
+                                skip_alpha_textures = True
+                                tex['has_alpha'] = False
+                                if 'alpha_name' in tex:
+                                    del tex['alpha_name']
+                                log(f"  User Action  : Stripping alpha from all remaining textures")
+
+                    else:
+                        log(f"  Alpha Valid  : Channel validated successfully")
+
+                elif skip_alpha_textures and has_alpha:
+                    tex['has_alpha'] = False
+                    if 'alpha_name' in tex:
+                        del tex['alpha_name']
+                    log(f"  Alpha Action : Stripped (skip all active)")
+
+                textures.append(tex)
+
             # === POPULATE TABLE ===
             log("")
             log("=" * 80)
@@ -8221,6 +8382,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             for row in range(self.texture_table.rowCount()):
                 self.texture_table.setRowHeight(row, 100)
             self.texture_table.setColumnWidth(0, 80)
+            QTimer.singleShot(0, self._fill_visible_thumbnails)
 
             # === COMPLETE ===
             log("")
@@ -8239,14 +8401,18 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 
             update_progress(100)
 
-            # Change button to close
-            cancel_btn.setText("Close")
-            cancel_btn.setStyleSheet("background-color: palette(button); color: palette(buttonText);")
-            try: cancel_btn.clicked.disconnect()
-            except Exception: pass
-            cancel_btn.clicked.connect(dialog.accept)
+            if dialog is not None:
+                flush_log()
+                # Change button to close
+                cancel_btn.setText("Close")
+                cancel_btn.setStyleSheet("background-color: palette(button); color: palette(buttonText);")
+                try: cancel_btn.clicked.disconnect()
+                except Exception: pass
+                cancel_btn.clicked.connect(dialog.accept)
 
-            dialog.exec()
+                dialog.exec()
+            else:
+                QApplication.restoreOverrideCursor()
 
             # Update window title and parent tab
             import re as _re
@@ -8263,8 +8429,11 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                 self.main_window.log_message(f"Loaded {len(textures)} textures from {txd_name}")
 
         except Exception as e:
-            if 'dialog' in locals():
+            if dialog is not None:
                 dialog.close()
+            elif self.fast_load:
+                QApplication.restoreOverrideCursor()
+            self.load_log.append(f"LOAD FAILED: {str(e)}")
 
             if str(e) == "__STUB_TXD__":
                 QMessageBox.warning(self, "Stub TXD",
@@ -8278,6 +8447,330 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                 self.main_window.log_message(f"TXD load error: {str(e)}")
 
 
+    @staticmethod
+    def _alpha_channel_error(rgba_data) -> Optional[str]: #vers 1
+        """Problem seen in the alpha of a texture's first 1000 pixels - all
+        opaque, or identical to RGB - or None."""
+        all_opaque = True
+        identical_to_rgb = True
+        sample_size = min(1000, len(rgba_data) // 4)
+        for pixel_idx in range(sample_size):
+            byte_offset = pixel_idx * 4
+            r = rgba_data[byte_offset]
+            g = rgba_data[byte_offset + 1]
+            b = rgba_data[byte_offset + 2]
+            a = rgba_data[byte_offset + 3]
+            if a < 255:
+                all_opaque = False
+            if a != r and a != g and a != b:
+                identical_to_rgb = False
+
+        if all_opaque:
+            return "Alpha channel is all opaque (255) - no transparency"
+        if identical_to_rgb:
+            return "Alpha channel identical to RGB data - corrupted"
+        return None
+
+
+    def _ask_alpha_error(self, parent, number, tex_name, alpha_error) -> Optional[str]: #vers 1
+        """Alpha Channel Error prompt. Returns 'ignore_entry', 'ignore_all',
+        'skip_alpha', 'skip_all', 'cancel' or None (closed)."""
+        error_dialog = QDialog(parent)
+        error_dialog.setWindowTitle("Alpha Channel Error")
+        error_dialog.setModal(True)
+        error_dialog.setMinimumWidth(500)
+
+        error_layout = QVBoxLayout(error_dialog)
+
+        error_label = QLabel(
+            f"Corrupted alpha channel detected:\n\n"
+            f"Texture {number}: {tex_name}\n"
+            f"Error: {alpha_error}\n\n"
+            f"How would you like to proceed?"
+        )
+        error_label.setWordWrap(True)
+        error_layout.addWidget(error_label)
+
+        btn_layout = QHBoxLayout()
+
+        ignore_entry_btn = QPushButton("Ignore Entry")
+        ignore_entry_btn.setToolTip("Load this texture with alpha as-is")
+
+        ignore_all_btn = QPushButton("Ignore All")
+        ignore_all_btn.setToolTip("Ignore all alpha errors and continue")
+
+        skip_alpha_btn = QPushButton("Strip Alpha")
+        skip_alpha_btn.setToolTip("Remove alpha from this texture only")
+
+        skip_all_btn = QPushButton("Strip All Alpha")
+        skip_all_btn.setToolTip("Remove alpha from all remaining textures")
+        skip_all_btn.setStyleSheet("background-color: palette(button); color: palette(buttonText);")
+
+        cancel_load_btn = QPushButton("Cancel Loading")
+        cancel_load_btn.setStyleSheet("background-color: palette(highlight); color: palette(highlightedText);")
+
+        btn_layout.addWidget(ignore_entry_btn)
+        btn_layout.addWidget(ignore_all_btn)
+        btn_layout.addWidget(skip_alpha_btn)
+        btn_layout.addWidget(skip_all_btn)
+        btn_layout.addWidget(cancel_load_btn)
+
+        error_layout.addLayout(btn_layout)
+
+        user_choice = [None]
+
+        def set_choice(choice):  #vers 1
+            user_choice[0] = choice
+            error_dialog.accept()
+
+        ignore_entry_btn.clicked.connect(lambda: set_choice('ignore_entry'))
+        ignore_all_btn.clicked.connect(lambda: set_choice('ignore_all'))
+        skip_alpha_btn.clicked.connect(lambda: set_choice('skip_alpha'))
+        skip_all_btn.clicked.connect(lambda: set_choice('skip_all'))
+        cancel_load_btn.clicked.connect(lambda: set_choice('cancel'))
+
+        error_dialog.exec()
+
+        return user_choice[0]
+
+
+    def _load_txd_textures_background(self, txd_data, txd_name): #vers 3
+        """Parse a TXD on the global QThreadPool (TXDLoadTask). Textures are
+        added to the table in batches as they are parsed, so the window stays
+        usable; starting another load or Cancel stops the running one.
+        Alpha channels are validated once every batch has arrived."""
+        self._cancel_txd_load()
+        self._txd_load_partial = False
+        if self.txd_version_id == 0:
+            self._detect_txd_info(txd_data)
+
+        self.current_txd_data = txd_data
+        self.current_txd_name = txd_name
+        self.texture_table.setRowCount(0)
+        self.texture_table.setColumnWidth(0, 80)
+        self.texture_list = []
+        self.selected_texture = None
+
+        self._load_id += 1
+        task = TXDLoadTask(self._load_id, txd_data, self.txd_version_id,
+                           decode=not self.lazy_decode)
+        task.signals.textures_ready.connect(self._on_txd_textures_ready)
+        task.signals.progress.connect(self._on_txd_load_progress)
+        task.signals.finished.connect(self._on_txd_load_finished)
+        task.signals.failed.connect(self._on_txd_load_failed)
+        self._load_task = task
+        self._load_task_name = txd_name
+        self.load_log.append("")
+        self.load_log.append(f"### {txd_name} (background)")
+        self.load_log.append(f"File Size      : {len(txd_data):,} bytes")
+        self.load_log.append(f"RW Version     : 0x{self.txd_version_id:08X}")
+        self.load_log.append(f"Device ID      : 0x{self.txd_device_id:08X}")
+        if hasattr(self, '_load_progress_row'):
+            self._load_progress_bar.setValue(0)
+            self._load_progress_row.setVisible(True)
+        QThreadPool.globalInstance().start(task)
+
+
+    def _on_txd_textures_ready(self, load_id, textures): #vers 2
+        """Append a batch of parsed textures to the table"""
+        if load_id != self._load_id:
+            return
+        for tex in textures:
+            self.texture_list.append(tex)
+            self._add_texture_to_table(tex)
+            self.load_log.append(f"[TEXTURE {len(self.texture_list)}] {tex.get('name', '')} "
+                                 f"{tex.get('width', 0)}x{tex.get('height', 0)} {tex.get('format', '')}")
+            self.texture_table.setRowHeight(self.texture_table.rowCount() - 1, 100)
+        self._fill_visible_thumbnails()
+        self._update_status_indicators()
+
+
+    def _on_txd_load_progress(self, load_id, done, total): #vers 1
+        if load_id == self._load_id and hasattr(self, '_load_progress_bar'):
+            self._load_progress_bar.setValue(int(done * 100 / max(1, total)))
+
+
+    def _validate_loaded_alpha(self) -> bool: #vers 2
+        """Alpha validation of the dialog path for a background load, run on
+        the listed textures (alpha ones decoded in one batch). Returns False
+        if the user cancelled - the table is cleared then."""
+        alpha_textures = [tex for tex in self.texture_list if tex.get('has_alpha')]
+        if not alpha_textures:
+            return True
+        if self.lazy_decode:
+            decode_pending(alpha_textures)
+
+        ignore_all_errors = False
+        skip_alpha_textures = False
+        stripped = False
+        for i, tex in enumerate(self.texture_list):
+            if not tex.get('has_alpha'):
+                continue
+            tex_name = tex.get('name', f'texture_{i}')
+            if skip_alpha_textures:
+                choice = 'skip_alpha'
+            else:
+                rgba_data = tex.get('rgba_data')
+                if not rgba_data or len(rgba_data) < 4:
+                    continue  # no pixels to check, as on the dialog path
+                alpha_error = self._alpha_channel_error(rgba_data)
+                if not alpha_error:
+                    continue
+                self.load_log.append(f"ALPHA ERROR {tex_name}: {alpha_error}")
+                if ignore_all_errors:
+                    continue
+                choice = self._ask_alpha_error(self, i + 1, tex_name, alpha_error)
+
+            if choice == 'cancel':
+                self.load_log.append("User Action : CANCELLED LOADING")
+                self.texture_table.setRowCount(0)
+                self.texture_list = []
+                self.selected_texture = None
+                if self.main_window and hasattr(self.main_window, 'log_message'):
+                    self.main_window.log_message(
+                        f"TXD load cancelled due to alpha errors: {self._load_task_name}")
+                return False
+            elif choice == 'ignore_all':
+                ignore_all_errors = True
+            elif choice in ('skip_alpha', 'skip_all'):
+                tex['has_alpha'] = False
+                if 'alpha_name' in tex:
+                    del tex['alpha_name']
+                stripped = True
+                skip_alpha_textures = skip_alpha_textures or choice == 'skip_all'
+                self.load_log.append(f"Alpha Action : Stripped from {tex_name}")
+
+        if stripped:
+            self._reload_texture_table()
+            for row in range(self.texture_table.rowCount()):
+                self.texture_table.setRowHeight(row, 100)
+            self._fill_visible_thumbnails()
+        return True
+
+
+    def _on_txd_load_finished(self, load_id, count): #vers 3
+        """Background load complete - alpha validation, then the same
+        title / log updates as the dialog path"""
+        if load_id != self._load_id:
+            return
+        self._load_task = None
+        if hasattr(self, '_load_progress_row'):
+            self._load_progress_row.setVisible(False)
+        txd_name = self._load_task_name
+        self.load_log.append(f"LOADING COMPLETE - {len(self.texture_list)} of {count} textures listed")
+        if not self.texture_list:
+            QMessageBox.critical(self, "Load Error",
+                "Failed to load TXD:\n\nNo valid textures loaded from TXD")
+            return
+        if not self._validate_loaded_alpha():
+            return
+
+        import re as _re
+        clean_name = _re.sub(r'_[a-z0-9]{6,12}(?=\.txd$|$)', '', txd_name, flags=_re.IGNORECASE)
+        self.setWindowTitle(f"TXD Workshop: {clean_name} ({len(self.texture_list)} textures)")
+        if self.main_window and hasattr(self.main_window, 'main_tab_widget'):
+            tw = self.main_window.main_tab_widget
+            for i in range(tw.count()):
+                if tw.widget(i) and self in tw.widget(i).findChildren(type(self)):
+                    tw.setTabText(i, clean_name)
+                    break
+        if self.main_window and hasattr(self.main_window, 'log_message'):
+            self.main_window.log_message(f"Loaded {len(self.texture_list)} textures from {txd_name}")
+
+
+    def _on_txd_load_failed(self, load_id, message): #vers 2
+        if load_id != self._load_id:
+            return
+        self._load_task = None
+        if hasattr(self, '_load_progress_row'):
+            self._load_progress_row.setVisible(False)
+        self.load_log.append(f"LOAD FAILED: {message}")
+        if message == "__STUB_TXD__":
+            QMessageBox.warning(self, "Stub TXD",
+                "This is a stub/placeholder .txd with no textures.\n\nPlease pick another file.")
+            return
+        QMessageBox.critical(self, "Load Error", f"Failed to load TXD:\n\n{message}")
+        if self.main_window and hasattr(self.main_window, 'log_message'):
+            self.main_window.log_message(f"TXD load error: {message}")
+
+
+    def _cancel_txd_load(self): #vers 2
+        """Stop the running background load; textures already listed stay"""
+        task = self._load_task
+        self._load_task = None
+        self._load_id += 1  # drop batches still queued
+        if hasattr(self, '_load_progress_row'):
+            self._load_progress_row.setVisible(False)
+        if task is not None:
+            task.cancel()
+            self._txd_load_partial = True
+            self.load_log.append(f"LOAD CANCELLED - {len(self.texture_list)} textures listed")
+            if self.main_window and hasattr(self.main_window, 'log_message'):
+                self.main_window.log_message(
+                    f"TXD load cancelled: {self._load_task_name} ({len(self.texture_list)} textures listed)")
+
+
+    def _show_load_log(self): #vers 1
+        """Show the load diagnostics ring buffer (non-modal)"""
+        dialog = self._load_log_dialog
+        if dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("TXD Load Log")
+            dialog.setMinimumWidth(800)
+            dialog.setMinimumHeight(600)
+            layout = QVBoxLayout(dialog)
+            dialog.log_view = QTextEdit()
+            dialog.log_view.setReadOnly(True)
+            dialog.log_view.setStyleSheet("font-family: 'Courier New', monospace; font-size: 10px;")
+            layout.addWidget(dialog.log_view)
+
+            button_layout = QHBoxLayout()
+            refresh_btn = QPushButton("Refresh")
+            refresh_btn.clicked.connect(self._refresh_load_log)
+            button_layout.addWidget(refresh_btn)
+            clear_btn = QPushButton("Clear")
+            clear_btn.clicked.connect(lambda: (self.load_log.clear(), self._refresh_load_log()))
+            button_layout.addWidget(clear_btn)
+            button_layout.addStretch()
+            close_btn = QPushButton("Close")
+            close_btn.clicked.connect(dialog.close)
+            button_layout.addWidget(close_btn)
+            layout.addLayout(button_layout)
+            self._load_log_dialog = dialog
+        self._refresh_load_log()
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
+
+
+    def _refresh_load_log(self): #vers 1
+        """Render the ring buffer into the open Load Log window"""
+        dialog = self._load_log_dialog
+        if dialog is not None:
+            dialog.log_view.setPlainText(self.load_log.text())
+            dialog.log_view.verticalScrollBar().setValue(dialog.log_view.verticalScrollBar().maximum())
+
+
+    def _wait_for_txd_load(self): #vers 1
+        """Block until a running background load has delivered every texture -
+        called before anything rebuilds the TXD from texture_list. Returns
+        False if the load was cancelled part way (texture_list incomplete)"""
+        task = self._load_task
+        if task is not None:
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            try:
+                task.wait()
+                QApplication.processEvents()
+            finally:
+                QApplication.restoreOverrideCursor()
+        if self._txd_load_partial:
+            QMessageBox.warning(self, "Incomplete TXD",
+                f"Loading was cancelled - only {len(self.texture_list)} textures were read.\n\n"
+                "Re-open the TXD before saving.")
+            return False
+        return True
+
+
     def _verify_alpha_exists(self, texture): #vers 1
         """Verify texture actually has alpha data, not just alpha_name field"""
         if not texture.get('has_alpha', False):
@@ -8885,7 +9378,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             self.main_window.log_message(f"Format changed: {old_format} -> {format_name} ({alpha_status})")
 
 
-    def _compress_texture(self): #vers 3
+    def _compress_texture(self): #vers 5
         """Compress selected texture to DXT format"""
         if not self.selected_texture:
             QMessageBox.warning(self, "No Selection", "Please select a texture first")
@@ -8909,6 +9402,8 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 
             if ok and new_format != current_format:
                 self._save_undo_state("Change DXT format")
+                if not self._encode_textures_dxt([self.selected_texture], new_format):
+                    return
                 self.selected_texture['format'] = new_format
 
                 # Update has_alpha based on format
@@ -8971,6 +9466,8 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 
             # Save undo state
             self._save_undo_state("Compress texture")
+            if not self._encode_textures_dxt([self.selected_texture], target_format):
+                return
             self.selected_texture['format'] = target_format
 
             # Update has_alpha if compressing to DXT3/DXT5
@@ -8995,6 +9492,124 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             QMessageBox.critical(self, "Error", f"Failed to compress: {str(e)}")
 
 
+    def _compress_all_textures(self): #vers 1
+        """Compress every texture of the TXD to DXT in one scheduler batch per
+        target format. Auto picks DXT5 for textures with alpha, DXT1 otherwise;
+        textures already in their target format are left as they are."""
+        if not self.texture_list:
+            QMessageBox.warning(self, "No Textures", "No TXD loaded")
+            return
+
+        from PyQt6.QtWidgets import QInputDialog
+
+        choices = ["Auto (DXT5 with alpha, DXT1 without)", "DXT1", "DXT3", "DXT5"]
+        choice, ok = QInputDialog.getItem(
+            self,
+            "Compress All Textures",
+            f"{len(self.texture_list)} textures\n\nSelect DXT format:",
+            choices,
+            0,
+            False
+        )
+        if not ok:
+            return
+
+        groups = {}
+        for texture in self.texture_list:
+            if choice == choices[0]:
+                target_format = 'DXT5' if texture.get('has_alpha') else 'DXT1'
+            else:
+                target_format = choice
+            if texture.get('format') != target_format:
+                groups.setdefault(target_format, []).append(texture)
+
+        if not groups:
+            QMessageBox.information(self, "Compress All Textures",
+                                    "Every texture is already in the selected format")
+            return
+
+        self._save_undo_state("Compress all textures")
+        compressed = 0
+        try:
+            for target_format, textures in groups.items():
+                if not self._encode_textures_dxt(textures, target_format):
+                    break
+                for texture in textures:
+                    texture['format'] = target_format
+                    if target_format in ('DXT3', 'DXT5') and not texture.get('has_alpha'):
+                        texture['has_alpha'] = True
+                        if 'alpha_name' not in texture:
+                            texture['alpha_name'] = texture['name'] + 'a'
+                compressed += len(textures)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to compress: {str(e)}")
+
+        if not compressed:
+            return
+
+        self._reload_texture_table()
+        for row in range(self.texture_table.rowCount()):
+            self.texture_table.setRowHeight(row, 100)
+        self._fill_visible_thumbnails()
+        if self.selected_texture:
+            self._update_texture_info(self.selected_texture)
+        self._mark_as_modified()
+
+        if self.main_window and hasattr(self.main_window, 'log_message'):
+            self.main_window.log_message(f"✅ Compressed {compressed} textures to DXT")
+
+
+    def _encode_textures_dxt(self, textures, target_format, only_missing=False): #vers 3
+        """Re-encode textures and their mipmap levels from rgba_data to target_format
+        on the shared compression scheduler. only_missing skips levels that already
+        hold compressed data. Levels not decoded yet (lazy decode) are decoded first
+        in one batch; a level with no rgba_data keeps its compressed data. Returns
+        False if the user cancelled (nothing changed)."""
+        textures = list(textures)
+        decode_pending(textures)
+        items = []
+        jobs = []
+        for texture in textures:
+            # Fresh level dicts - undo snapshots share the old ones
+            texture['mipmap_levels'] = [lvl.copy() for lvl in texture.get('mipmap_levels', [])]
+            has_alpha = bool(texture.get('has_alpha'))
+            levels = [texture] + [lvl for lvl in texture['mipmap_levels']
+                                  if lvl.get('level', 0) > 0]
+            for item in levels:
+                if only_missing and item.get('compressed_data'):
+                    continue
+                rgba = item.get('rgba_data')
+                w = item.get('width', texture.get('width', 0))
+                h = item.get('height', texture.get('height', 0))
+                items.append(item)
+                if rgba:
+                    jobs.append(CompressJob(len(items) - 1, rgba, w, h, target_format,
+                                            self.dxt_quality, has_alpha))
+
+        results = _run_compress_jobs(self, jobs, f"Compressing to {target_format}...")
+        if results is None:
+            return False
+
+        encoded_keys = {job.key for job in jobs}
+        for key, item in enumerate(items):
+            encoded = results.get(key)
+            if not encoded:
+                if key in encoded_keys:
+                    # Had pixels but no encoding - old data is the wrong format
+                    item.pop('compressed_data', None)
+                continue
+            item['compressed_data'] = encoded
+            item['compressed_size'] = len(encoded)
+
+        # Level 0 entry shares the texture's pixels
+        for texture in textures:
+            for lvl in texture['mipmap_levels']:
+                if lvl.get('level', 0) == 0 and texture.get('compressed_data'):
+                    lvl['compressed_data'] = texture['compressed_data']
+                    lvl['compressed_size'] = len(texture['compressed_data'])
+        return True
+
+
     def _uncompress_texture(self): #vers 3
         """Uncompress selected texture from DXT to ARGB8888"""
         if not self.selected_texture:
@@ -9101,9 +9716,11 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         return estimated_size
 
 
-    def _rebuild_txd_data(self): #vers 3
+    def _rebuild_txd_data(self): #vers 4
         """Rebuild TXD data with modified texture names and properties"""
         try:
+            if not self._wait_for_txd_load():
+                return None
             if not self.current_txd_data:
                 return None
 
@@ -9234,7 +9851,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         return ' | '.join(desc_parts) if desc_parts else "Standard format"
 
 
-    def _update_img_with_txd(self, modified_txd_data): #vers 4
+    def _update_img_with_txd(self, modified_txd_data): #vers 6
         """Update IMG archive using IMG Factory's save system"""
         try:
             if self.main_window and hasattr(self.main_window, 'log_message'):
@@ -9247,12 +9864,12 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             if not self.current_txd_name:
                 raise Exception("No current TXD name available")
 
-            # Find and update the TXD entry
-            txd_entry = None
-            for entry in self.current_img.entries:
-                if entry.name == self.current_txd_name:
-                    txd_entry = entry
-                    break
+            # Find and update the TXD entry (name index lookup when available)
+            if hasattr(self.current_img, 'get_entry'):
+                txd_entry = self.current_img.get_entry(self.current_txd_name)
+            else:
+                txd_entry = next((entry for entry in self.current_img.entries
+                                  if entry.name == self.current_txd_name), None)
 
             if not txd_entry:
                 raise Exception(f"TXD entry '{self.current_txd_name}' not found in IMG")
@@ -9260,6 +9877,8 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             # Update the entry data IN MEMORY
             old_size = txd_entry.size
             txd_entry.data = modified_txd_data
+            txd_entry._cached_data = modified_txd_data  # picked up by the IMG save
+            txd_entry.is_replaced = True
             txd_entry.size = len(modified_txd_data)
 
             # Mark IMG as modified
@@ -9762,11 +10381,13 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 
 
     # Update the main save_txd_file method to use version selector:
-    def _save_txd_file(self): #vers 2
+    def _save_txd_file(self): #vers 3
         """Save TXD file with detailed structural logging"""
         if not self.current_txd_path and not self.current_txd_name:
             QMessageBox.warning(self, "No TXD", "No TXD file loaded")
             return
+        if not self._wait_for_txd_load():
+            return
 
         try:
             from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout,
@@ -10609,9 +11230,11 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
 #------ Rebuild functions
 
 
-    def _rebuild_txd_data_with_texture_progress(self, update_progress): #vers 1
+    def _rebuild_txd_data_with_texture_progress(self, update_progress): #vers 2
         """Rebuild TXD data with per-texture progress updates"""
         try:
+            if not self._wait_for_txd_load():
+                return None
             if not self.texture_list:
                 return None
 
@@ -10839,590 +11462,48 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                 thumb_item.setIcon(QIcon(thumb))
 
 
-    def _parse_single_texture(self, txd_data, offset, index, rw_version=0x1803FFFF): #vers 6
-        """
-        Parse single texture from TXD with bumpmap and reflection support
-        ADDED: Extract separate alpha mask for display switching
-        """
-        import struct
+    def _parse_single_texture(self, txd_data, offset, index, rw_version=0x1803FFFF, decode=True): #vers 10
+        """Parse one Texture Native section - see parse_texture_native in
+        apps/methods/txd_native.py. Bumpmap / reflection details and parse
+        errors go to the main window log."""
+        log = (self.main_window.log_message
+               if self.main_window and hasattr(self.main_window, 'log_message') else None)
+        return parse_texture_native(txd_data, offset, index, rw_version=rw_version,
+                                    decode=decode, log=log)
 
-        tex = {
-            'name': f'texture_{index}',
-            'width': 0,
-            'height': 0,
-            'depth': 32,
-            'format': 'DXT1',
-            'has_alpha': False,
-            'mipmaps': 1,
-            'rgba_data': b'',
-            'alpha_mask': b'',              # NEW: Separate grayscale alpha channel
-            'compressed_data': b'',
-            'original_bgra_data': b'',
-            'mipmap_levels': [],
-            'bumpmap_data': b'',
-            'bumpmap_type': 0,
-            'has_bumpmap': False,
-            'reflection_map': b'',
-            'fresnel_map': b'',
-            'has_reflection': False,
-            'raster_format_flags': 0
-        }
 
-        try:
-            # TextureNative structure
-            parent_type, parent_size, parent_version = struct.unpack('<III', txd_data[offset:offset+12])
-
-            if parent_type != 0x15:
-                return tex
-
-            # Struct section
-            struct_offset = offset + 12
-            struct_type, struct_size, struct_version = struct.unpack('<III', txd_data[struct_offset:struct_offset+12])
-
-            if struct_type != 0x01:
-                return tex
-
-            pos = struct_offset + 12
-
-            # Read 88-byte header
-            platform_id, filter_mode, uv_addressing = struct.unpack('<I2B', txd_data[pos:pos+6])[:3]
+    def _decode_texture_levels(self, textures): #vers 2
+        """Decode the pending mipmap levels of textures in one batch, then fill
+        each texture's rgba_data and alpha_mask from level 0"""
+        decode_pending(textures)
 
-            #    Xbox (platform_id == 5): delegate to Xbox parser               
-            if platform_id == 5:
-                try:
-                    from apps.methods.txd_platform_xbox import parse_xbox_nativetex
-                    xbox_tex = parse_xbox_nativetex(txd_data, offset, index)
-                    if xbox_tex:
-                        # Decode compressed data to RGBA for display
-                        if xbox_tex.get('compressed_data') and not xbox_tex.get('rgba_data'):
-                            fmt = xbox_tex.get('format', 'DXT1')
-                            w   = xbox_tex.get('width', 0)
-                            h   = xbox_tex.get('height', 0)
-                            if w > 0 and h > 0 and 'DXT' in fmt:
-                                xbox_tex['rgba_data'] = self._decompress_texture(
-                                    xbox_tex['compressed_data'], w, h, fmt)
-                        return xbox_tex
-                except Exception as _xe:
-                    print(f"[Xbox TXD] Texture {index}: {_xe}")
-                return tex  # return empty rather than crash
-            #    End Xbox                                                      
-
-            pos += 8  # Skip padding
-
-            name_bytes = txd_data[pos:pos+32]
-            # Use first-null termination (like C strlen) not rstrip — DragonFF does this too
-            _null = name_bytes.find(b'\x00')
-            tex['name'] = (name_bytes[:_null] if _null >= 0 else name_bytes).decode('ascii', errors='ignore') or f'texture_{index}'
-            pos += 32
-
-            mask_bytes = txd_data[pos:pos+32]
-            _null2 = mask_bytes.find(b'\x00')
-            alpha_name = (mask_bytes[:_null2] if _null2 >= 0 else mask_bytes).decode('ascii', errors='ignore')
-            if alpha_name:
-                tex['alpha_name'] = alpha_name
-                tex['has_alpha'] = True
-            pos += 32
-
-            raster_format_flags, d3d_format, width, height, depth, num_levels, raster_type = struct.unpack('<IIHHBBB', txd_data[pos:pos+15])
-            tex['width'] = width
-            tex['height'] = height
-            tex['depth'] = depth
-            tex['mipmaps'] = num_levels
-            tex['raster_format_flags'] = raster_format_flags
-
-            # Check for bumpmap flag (bit 0x10)
-            if raster_format_flags & 0x10:
-                tex['has_bumpmap'] = True
-
-            pos += 15
-
-            platform_prop = struct.unpack('<B', txd_data[pos:pos+1])[0]
-            pos += 1
-
-            # Format detection - version-aware
-            is_pal8     = bool(raster_format_flags & 0x2000)  # FORMAT_EXT_PAL8
-            is_pal4     = bool(raster_format_flags & 0x4000)  # FORMAT_EXT_PAL4
-            pixel_fmt   = raster_format_flags & 0x0F00  # bits 8-11 only, excludes PAL flags
-            is_sa_plus  = (rw_version >= 0x1803FFFF)
-            # GTA3/VC: RGBA palette (no swap); SA: BGRA palette (swap B<->R)
-            tex['palette_is_bgra'] = is_sa_plus
-
-            raster_pixel_map = {
-                0x0100: 'ARGB1555', 0x0200: 'RGB565',
-                0x0300: 'ARGB4444', 0x0400: 'LUM8',
-                0x0500: 'ARGB8888', 0x0600: 'RGB888',
-                0x0A00: 'RGB555',
-            }
-
-            # Xbox (platform_id=5): compression byte 0x0C/0x0E/0x10 = DXT1/3/5
-            # D3D8 GTA3/VC: platform_prop 1/3/5 = DXT1/3/5
-            # SA D3D9: use d3d_format FourCC
-            is_xbox = (platform_id == 5)
-            if is_pal8:
-                tex['format'] = 'PAL8'
-            elif is_pal4:
-                tex['format'] = 'PAL4'
-            elif is_xbox and platform_prop == 0x00:
-                # Raw ARGB8888 - use raster_format pixel bits
-                tex['format'] = {0x0500:'ARGB8888',0x0600:'RGB888'}.get(pixel_fmt, 'ARGB8888')
-            elif is_xbox and platform_prop in (0x0B, 0x0C):
-                # 0x0B = LIN_DXT1 (linear/standard), 0x0C = DXT1 (swizzled)
-                # Both decode identically via PIL DDS
-                tex['format'] = 'DXT1'
-            elif is_xbox and platform_prop in (0x0E, 0x0F):
-                # 0x0E = DXT3 (swizzled), 0x0F = LIN_DXT3 (linear/standard)
-                tex['format'] = 'DXT3'
-                tex['has_alpha'] = True
-            elif is_xbox and platform_prop in (0x10, 0x11):
-                # 0x10 = DXT5 (swizzled), 0x11 = LIN_DXT5 (linear/standard)
-                tex['format'] = 'DXT5'
-                tex['has_alpha'] = True
-            elif d3d_format == 0x31545844:
-                tex['format'] = 'DXT1'
-            elif d3d_format == 0x33545844:
-                tex['format'] = 'DXT3'
-                tex['has_alpha'] = True
-            elif d3d_format == 0x35545844:
-                tex['format'] = 'DXT5'
-                tex['has_alpha'] = True
-            elif not is_xbox and platform_id == 8 and platform_prop == 1:
-                # D3D8 only: platform_prop 1/3/5 = DXT type
-                # D3D9 uses d3d_format field — platform_prop is alpha/cube/mip/compressed flags
-                tex['format'] = 'DXT1'
-            elif not is_xbox and platform_id == 8 and platform_prop == 3:
-                tex['format'] = 'DXT3'
-                tex['has_alpha'] = True
-            elif not is_xbox and platform_id == 8 and platform_prop == 5:
-                tex['format'] = 'DXT5'
-                tex['has_alpha'] = True
-            elif is_sa_plus:
-                d3d_fmt_map = {
-                    # D3D9 format enum -> internal format name
-                    21: 'ARGB8888',  # D3DFMT_A8R8G8B8 - stored BGRA 4bpp
-                    22: 'ARGB8888',  # D3DFMT_X8R8G8B8 - stored BGRX 4bpp, treat as ARGB8888 (alpha=255)
-                    32: 'ARGB8888',  # D3DFMT_A8B8G8R8
-                    20: 'RGB888',    # D3DFMT_R8G8B8   - true 24-bit, rare
-                    23: 'RGB565',    # D3DFMT_R5G6B5
-                    25: 'ARGB1555',  # D3DFMT_A1R5G5B5
-                    26: 'ARGB4444',  # D3DFMT_A4R4G4B4
-                    24: 'RGB555',    # D3DFMT_X1R5G5B5
-                    50: 'LUM8',      # D3DFMT_L8
-                    51: 'A8L8',      # D3DFMT_A8L8
-                    41: 'PAL8',      # D3DFMT_P8
-                }
-                tex['format'] = d3d_fmt_map.get(d3d_format,
-                    raster_pixel_map.get(pixel_fmt, f'UNKNOWN_{raster_format_flags:08X}'))
-            else:
-                tex['format'] = raster_pixel_map.get(pixel_fmt,
-                    f'UNKNOWN_{raster_format_flags:08X}')
-
-            # D3DFMT_X8R8G8B8 (22): stored BGRX, X channel is padding not alpha
-            if d3d_format == 22:
-                tex['force_opaque'] = True  # force alpha=255 when decoding
-
-            if tex['format'] in ('ARGB8888', 'ARGB1555', 'ARGB4444', 'DXT3', 'DXT5', 'PAL8', 'A8L8'):
-                if not tex.get('has_alpha') and not tex.get('force_opaque'):
-                    tex['has_alpha'] = True
-
-            # Read mipmap data
-            # SA (D3D9, RW >= 0x1803FFFF): ALL formats have a 4-byte data_size field PER mipmap level
-            # GTA3/VC (D3D8): ONLY DXT formats have data_size per level; raw/PAL data follows directly
-            # Xbox (platform_id=5): ONE total data_size field covers ALL mipmap levels combined
-            fmt = tex['format']
-            is_dxt = 'DXT' in fmt
-            is_xbox = (platform_id == 5)
-            has_data_size_field = (is_dxt or is_sa_plus) and not is_xbox
-
-            # Xbox: read single total size, then consume all levels from that block
-            if is_xbox and pos + 4 <= len(txd_data):
-                xbox_total_size = struct.unpack('<I', txd_data[pos:pos+4])[0]
-                pos += 4
-                xbox_data_block = txd_data[pos:pos+xbox_total_size]
-                pos += xbox_total_size
-                # Split into per-level chunks using calculated sizes
-                block_pos = 0
-                w, h = width, height
-                for level in range(num_levels):
-                    if 'DXT1' in fmt:
-                        lsize = max(1,(w+3)//4)*max(1,(h+3)//4)*8
-                    elif 'DXT' in fmt:
-                        lsize = max(1,(w+3)//4)*max(1,(h+3)//4)*16
-                    elif fmt == 'RGB888':
-                        lsize = w*h*(4 if depth==32 else 3)
-                    elif fmt in ('RGB565','ARGB1555','ARGB4444','RGB555'):
-                        lsize = w*h*2
-                    else:  # ARGB8888, LUM8, etc
-                        lsize = w*h*(depth//8)
-                    level_data = xbox_data_block[block_pos:block_pos+lsize]
-                    block_pos += lsize
-                    lw, lh = w, h
-                    if 'DXT' in fmt:
-                        rgba_data = self._decompress_texture(level_data, lw, lh, fmt)
-                    else:
-                        rgba_data = self._decompress_uncompressed(
-                            level_data, lw, lh, fmt, depth=depth,
-                            force_opaque=tex.get('force_opaque', False))
-                    mipmap_level = {'level': level, 'width': lw, 'height': lh,
-                        'rgba_data': rgba_data, 'compressed_data': level_data if is_dxt else None,
-                        'compressed_size': len(level_data)}
-                    tex['mipmap_levels'].append(mipmap_level)
-                    if level == 0:
-                        tex['rgba_data'] = rgba_data
-                        if tex['has_alpha'] and rgba_data and len(rgba_data) == width*height*4:
-                            alpha_mask = bytearray(width*height)
-                            for i in range(width*height):
-                                alpha_mask[i] = rgba_data[i*4+3]
-                            tex['alpha_mask'] = bytes(alpha_mask)
-                    w = max(1, w//2); h = max(1, h//2)
-            else:
-                w, h = width, height
-                for level in range(num_levels):
-                    # Calculate expected size for this mipmap level
-                    if 'DXT1' in fmt:
-                        expected = max(1, (w+3)//4) * max(1, (h+3)//4) * 8
-                    elif 'DXT' in fmt:
-                        expected = max(1, (w+3)//4) * max(1, (h+3)//4) * 16
-                    elif fmt in ('ARGB8888', 'A8L8'):
-                        expected = w * h * 4
-                    elif fmt == 'RGB888':
-                        expected = w * h * (4 if tex.get('depth', 0) == 32 else 3)
-                    elif fmt in ('RGB565', 'ARGB1555', 'ARGB4444', 'RGB555'):
-                        expected = w * h * 2
-                    elif fmt == 'LUM8':
-                        expected = w * h
-                    elif fmt == 'PAL8':
-                        # Layout: palette(1024 raw) + pixel_size(4) + pixels(w*h)
-                        # DragonFF: read_palette has no prefix; read_pixels has 4-byte prefix
-                        expected = 1024 + 4 + w * h
-                    elif fmt == 'PAL4':
-                        # Layout: palette(64 or 128 raw) + pixel_size(4) + pixels((w*h+1)//2)
-                        _pal4_sz = 64 if depth == 4 else 128
-                        expected = _pal4_sz + 4 + (w * h + 1) // 2
-                    else:
-                        expected = w * h * 2
-
-                    # Read declared data_size if present, use it if sane
-                    if has_data_size_field:
-                        if pos + 4 > len(txd_data):
-                            break
-                        declared = struct.unpack('<I', txd_data[pos:pos+4])[0]
-                        pos += 4
-                        size = declared if (expected // 2 <= declared <= expected * 4) else expected
-                    else:
-                        size = expected
-
-                    lw, lh = w, h
-
-                    if pos + size > len(txd_data):
-                        break
-
-                    level_data = txd_data[pos:pos+size]
-                    pos += size
-
-                    # Decompress if needed
-                    lw = max(1, width >> level)
-                    lh = max(1, height >> level)
-                    if 'DXT' in tex['format']:
-                        rgba_data = self._decompress_texture(level_data, lw, lh, tex['format'])
-                    elif tex['format'] in ('PAL8', 'PAL4'):
-                        # GTA3/VC palettes are RGBA; SA (>=0x1803FFFF) palettes are BGRA
-                        # palette_is_bgra stored during header parse
-                        pal_entry_fmt = tex.get('palette_entry_format', 'ARGB8888')
-                        palette_is_bgra = tex.get('palette_is_bgra', True)
-                        # DragonFF: pal8_noalpha when has_alpha()==False
-                        # raster_format_type in (888, 565, 555, LUM) → no alpha
-                        _NO_ALPHA_TYPES = {0x0600, 0x0200, 0x0A00, 0x0400}  # 888,565,555,LUM
-                        _pix_type = tex.get('raster_format_flags', 0) & 0x0F00
-                        force_opaque_pal = _pix_type in _NO_ALPHA_TYPES
-                        # PAL8=1024 bytes, PAL4=64 bytes (depth==4) or 128 bytes (depth!=4)
-                        # Matches DragonFF read_palette() logic
-                        if tex['format'] == 'PAL8':
-                            pal_size = 1024
-                        elif tex.get('depth', 4) == 4:
-                            pal_size = 64
-                        else:
-                            pal_size = 128
-                        if len(level_data) >= pal_size:
-                            pal_data = level_data[:pal_size]
-                            # Skip the 4-byte pixel data size prefix that follows palette
-                            # (DragonFF read_pixels always reads size-prefixed; palette is raw)
-                            pix_offset = pal_size + 4
-                            pix_data = level_data[pix_offset:]
-                            rgba_data = self._decompress_uncompressed(
-                                pix_data, lw, lh, tex['format'],
-                                palette=pal_data, palette_entry_fmt=pal_entry_fmt,
-                                palette_is_bgra=palette_is_bgra,
-                                force_opaque=force_opaque_pal)
-                        else:
-                            rgba_data = b'\x00' * (lw * lh * 4)
-                    else:
-                        rgba_data = self._decompress_uncompressed(
-                            level_data, lw, lh, tex['format'],
-                            depth=tex.get('depth', 0),
-                            force_opaque=tex.get('force_opaque', False))
-
-                    mipmap_level = {
-                        'level': level,
-                        'width': max(1, width >> level),
-                        'height': max(1, height >> level),
-                        'rgba_data': rgba_data,
-                        'compressed_data': level_data if 'DXT' in tex['format'] else None,
-                        'compressed_size': len(level_data)
-                    }
-                    tex['mipmap_levels'].append(mipmap_level)
-
-                    # Store main texture data
-                    if level == 0:
-                        if rgba_data is None:
-                            rgba_data = b'\x00' * (lw * lh * 4)
-                        tex['rgba_data'] = rgba_data
-
-                        # NEW: Extract alpha channel as separate grayscale mask
-                        if tex['has_alpha'] and rgba_data and len(rgba_data) == width * height * 4:
-                            alpha_mask = bytearray(width * height)
-                            for i in range(width * height):
-                                alpha_mask[i] = rgba_data[i * 4 + 3]  # Extract alpha byte
-                            tex['alpha_mask'] = bytes(alpha_mask)
-
-                    # Advance mipmap dimensions
-                    w = max(1, w // 2)
-                    h = max(1, h // 2)
-
-            # Read bumpmap data (if present)
-            if tex['has_bumpmap'] and pos + 5 <= len(txd_data):
-                try:
-                    bumpmap_size = struct.unpack('<I', txd_data[pos:pos+4])[0]
-                    pos += 4
 
-                    bumpmap_type = struct.unpack('<B', txd_data[pos:pos+1])[0]
-                    pos += 1
+    def _decompress_texture(self, compressed_data, width, height, format_str): #vers 6
+        """Decompress DXT texture data to RGBA - see apps/methods/txd_native.py"""
+        return decompress_dxt(compressed_data, width, height, format_str)
 
-                    if pos + bumpmap_size <= len(txd_data):
-                        tex['bumpmap_data'] = txd_data[pos:pos+bumpmap_size]
-                        tex['bumpmap_type'] = bumpmap_type
-                        pos += bumpmap_size
 
-                        if self.main_window and hasattr(self.main_window, 'log_message'):
-                            type_names = ['Height Map', 'Normal Map', 'Both']
-                            type_name = type_names[bumpmap_type] if bumpmap_type < 3 else 'Unknown'
-                            self.main_window.log_message(
-                                f"  Bumpmap: {type_name} ({bumpmap_size} bytes)"
-                            )
-                except Exception as e:
-                    if self.main_window and hasattr(self.main_window, 'log_message'):
-                        self.main_window.log_message(f"  Bumpmap read error: {str(e)}")
-
-            # Read reflection map data (if present)
-            if pos + 8 <= len(txd_data):
-                try:
-                    reflection_size = struct.unpack('<I', txd_data[pos:pos+4])[0]
-                    pos += 4
-
-                    expected_reflection_size = width * height * 3
-                    if reflection_size == expected_reflection_size and pos + reflection_size <= len(txd_data):
-                        tex['reflection_map'] = txd_data[pos:pos+reflection_size]
-                        tex['has_reflection'] = True
-                        pos += reflection_size
-
-                        if pos + 4 <= len(txd_data):
-                            fresnel_size = struct.unpack('<I', txd_data[pos:pos+4])[0]
-                            pos += 4
-
-                            expected_fresnel_size = width * height
-                            if fresnel_size == expected_fresnel_size and pos + fresnel_size <= len(txd_data):
-                                tex['fresnel_map'] = txd_data[pos:pos+fresnel_size]
-                                pos += fresnel_size
-
-                                if self.main_window and hasattr(self.main_window, 'log_message'):
-                                    self.main_window.log_message(
-                                        f"  Reflection maps: "
-                                        f"Vector ({reflection_size}B) + Fresnel ({fresnel_size}B)"
-                                    )
-                except Exception as e:
-                    pass
-
-        except Exception as e:
-            if self.main_window and hasattr(self.main_window, 'log_message'):
-                self.main_window.log_message(f"Texture parse error: {str(e)}")
-
-        return tex
-
-
-    def _decompress_texture(self, compressed_data, width, height, format_str): #vers 3
-        """
-        Decompress DXT texture data to RGBA using PIL (fast) with pure-Python fallback.
-        """
-        import struct, io
-        fmt = 'DXT1' if 'DXT1' in format_str else 'DXT3' if 'DXT3' in format_str else 'DXT5' if 'DXT5' in format_str else None
-        if fmt is None:
-            return compressed_data
-
-        # --- PIL/DDS path (fast, accurate) ---
+    def _decompress_dxt1(self, dxt_data, width, height): #vers 2
+        """DXT1 decompression - vectorised, see apps/methods/dxt_codec.py"""
         try:
-            from PIL import Image
-            fourcc = fmt.encode('ascii')
-            pitch = max(1, (width + 3) // 4) * (8 if fmt == 'DXT1' else 16)
-            hdr = bytearray(128)
-            struct.pack_into('<I', hdr,  0, 0x20534444)        # 'DDS '
-            struct.pack_into('<I', hdr,  4, 124)               # header size
-            struct.pack_into('<I', hdr,  8, 0x1|0x2|0x4|0x1000)
-            struct.pack_into('<I', hdr, 12, height)
-            struct.pack_into('<I', hdr, 16, width)
-            struct.pack_into('<I', hdr, 20, pitch * max(1, (height + 3) // 4))
-            struct.pack_into('<I', hdr, 28, 1)
-            struct.pack_into('<I', hdr, 76, 32)                # pixel format size
-            struct.pack_into('<I', hdr, 80, 0x4)               # DDPF_FOURCC
-            hdr[84:88] = fourcc
-            dds = bytes(hdr) + compressed_data
-            img = Image.open(io.BytesIO(dds)).convert('RGBA')
-            return bytes(img.tobytes())
+            return decode_dxt1(dxt_data, width, height)
         except Exception:
-            pass
-
-        # --- Pure Python fallback ---
-        if fmt == 'DXT1':
-            return self._decompress_dxt1(compressed_data, width, height)
-        elif fmt == 'DXT3':
-            return self._decompress_dxt3(compressed_data, width, height)
-        else:
-            return self._decompress_dxt5(compressed_data, width, height)
-
-
-    def _decompress_dxt1(self, dxt_data, width, height): #vers 1
-        """DXT1 decompression"""
-        try:
-            import struct
-            rgba = bytearray(width * height * 4)
-            blocks_x = (width + 3) // 4
-            blocks_y = (height + 3) // 4
-
-            for by in range(blocks_y):
-                for bx in range(blocks_x):
-                    block_offset = (by * blocks_x + bx) * 8
-                    if block_offset + 8 > len(dxt_data):
-                        break
-
-                    c0, c1 = struct.unpack('<HH', dxt_data[block_offset:block_offset+4])
-                    indices = struct.unpack('<I', dxt_data[block_offset+4:block_offset+8])[0]
-
-                    colors = []
-                    for c in [c0, c1]:
-                        r = ((c >> 11) & 0x1F) << 3
-                        g = ((c >> 5) & 0x3F) << 2
-                        b = (c & 0x1F) << 3
-                        colors.append((r, g, b, 255))
-
-                    if c0 > c1:
-                        colors.append(((2*colors[0][0]+colors[1][0])//3, (2*colors[0][1]+colors[1][1])//3, (2*colors[0][2]+colors[1][2])//3, 255))
-                        colors.append(((colors[0][0]+2*colors[1][0])//3, (colors[0][1]+2*colors[1][1])//3, (colors[0][2]+2*colors[1][2])//3, 255))
-                    else:
-                        colors.append(((colors[0][0]+colors[1][0])//2, (colors[0][1]+colors[1][1])//2, (colors[0][2]+colors[1][2])//2, 255))
-                        colors.append((0, 0, 0, 0))
-
-                    for py in range(4):
-                        for px in range(4):
-                            if (bx*4+px < width) and (by*4+py < height):
-                                index = (indices >> ((py*4+px)*2)) & 0x03
-                                pixel_offset = ((by*4+py)*width+(bx*4+px))*4
-                                rgba[pixel_offset:pixel_offset+4] = colors[index]
-            return bytes(rgba)
-        except:
             return None
 
 
-    def _decompress_dxt3(self, dxt_data, width, height): #vers 1
-        """DXT3 decompression"""
+    def _decompress_dxt3(self, dxt_data, width, height): #vers 2
+        """DXT3 decompression - vectorised, see apps/methods/dxt_codec.py"""
         try:
-            import struct
-            rgba = bytearray(width * height * 4)
-            blocks_x = (width + 3) // 4
-            blocks_y = (height + 3) // 4
-
-            for by in range(blocks_y):
-                for bx in range(blocks_x):
-                    block_offset = (by * blocks_x + bx) * 16
-                    if block_offset + 16 > len(dxt_data):
-                        break
-
-                    alpha_data = struct.unpack('<Q', dxt_data[block_offset:block_offset+8])[0]
-                    c0, c1 = struct.unpack('<HH', dxt_data[block_offset+8:block_offset+12])
-                    indices = struct.unpack('<I', dxt_data[block_offset+12:block_offset+16])[0]
-
-                    colors = []
-                    for c in [c0, c1]:
-                        r = ((c >> 11) & 0x1F) << 3
-                        g = ((c >> 5) & 0x3F) << 2
-                        b = (c & 0x1F) << 3
-                        colors.append((r, g, b))
-
-                    colors.append(((2*colors[0][0]+colors[1][0])//3, (2*colors[0][1]+colors[1][1])//3, (2*colors[0][2]+colors[1][2])//3))
-                    colors.append(((colors[0][0]+2*colors[1][0])//3, (colors[0][1]+2*colors[1][1])//3, (colors[0][2]+2*colors[1][2])//3))
-
-                    for py in range(4):
-                        for px in range(4):
-                            if (bx*4+px < width) and (by*4+py < height):
-                                color_index = (indices >> ((py*4+px)*2)) & 0x03
-                                alpha_index = py*4 + px
-                                alpha = ((alpha_data >> (alpha_index*4)) & 0x0F) * 17
-                                pixel_offset = ((by*4+py)*width+(bx*4+px))*4
-                                rgba[pixel_offset:pixel_offset+3] = colors[color_index]
-                                rgba[pixel_offset+3] = alpha
-            return bytes(rgba)
-        except:
+            return decode_dxt3(dxt_data, width, height)
+        except Exception:
             return None
 
 
-    def _decompress_dxt5(self, dxt_data, width, height): #vers 1
-        """DXT5 decompression"""
+    def _decompress_dxt5(self, dxt_data, width, height): #vers 2
+        """DXT5 decompression - vectorised, see apps/methods/dxt_codec.py"""
         try:
-            import struct
-            rgba = bytearray(width * height * 4)
-            blocks_x = (width + 3) // 4
-            blocks_y = (height + 3) // 4
-
-            for by in range(blocks_y):
-                for bx in range(blocks_x):
-                    block_offset = (by * blocks_x + bx) * 16
-                    if block_offset + 16 > len(dxt_data):
-                        break
-
-                    a0 = dxt_data[block_offset]
-                    a1 = dxt_data[block_offset + 1]
-                    alpha_indices = struct.unpack('<Q', dxt_data[block_offset:block_offset+8])[0] >> 16
-                    alpha_palette = [a0, a1]
-                    if a0 > a1:
-                        # 6 interpolated values: weighted blend a0..a1 in 7 steps
-                        for i in range(1, 7):
-                            alpha_palette.append(round(a0 * ((7-i)/7) + a1 * (i/7)))
-                    else:
-                        # 4 interpolated + hard 0 and 255
-                        for i in range(1, 5):
-                            alpha_palette.append(round(a0 * ((5-i)/5) + a1 * (i/5)))
-                        alpha_palette.extend([0, 255])
-
-                    c0, c1 = struct.unpack('<HH', dxt_data[block_offset+8:block_offset+12])
-                    indices = struct.unpack('<I', dxt_data[block_offset+12:block_offset+16])[0]
-
-                    colors = []
-                    for c in [c0, c1]:
-                        r = ((c >> 11) & 0x1F) << 3
-                        g = ((c >> 5) & 0x3F) << 2
-                        b = (c & 0x1F) << 3
-                        colors.append((r, g, b))
-
-                    colors.append(((2*colors[0][0]+colors[1][0])//3, (2*colors[0][1]+colors[1][1])//3, (2*colors[0][2]+colors[1][2])//3))
-                    colors.append(((colors[0][0]+2*colors[1][0])//3, (colors[0][1]+2*colors[1][1])//3, (colors[0][2]+2*colors[1][2])//3))
-
-                    for py in range(4):
-                        for px in range(4):
-                            if (bx*4+px < width) and (by*4+py < height):
-                                color_index = (indices >> ((py*4+px)*2)) & 0x03
-                                alpha_index = (alpha_indices >> ((py*4+px)*3)) & 0x07
-                                pixel_offset = ((by*4+py)*width+(bx*4+px))*4
-                                rgba[pixel_offset:pixel_offset+3] = colors[color_index]
-                                rgba[pixel_offset+3] = alpha_palette[alpha_index]
-            return bytes(rgba)
-        except:
+            return decode_dxt5(dxt_data, width, height)
+        except Exception:
             return None
 
 
@@ -11448,124 +11529,14 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         return bytes(rgba_data)
 
 
-    # Update _decompress_uncompressed method:
-    def _decompress_uncompressed(self, data, width, height, format_type, palette=None, palette_entry_fmt='ARGB8888', depth=0, force_opaque=False, palette_is_bgra=True): #vers 7
-        """Decompress all RenderWare uncompressed/palettized formats to RGBA"""
-        try:
-            import struct
-            pixel_count = width * height
-            rgba = bytearray(pixel_count * 4)
-
-            if format_type == 'PAL8':
-                # 8-bit indexed, 256 x 4-byte palette entries
-                # GTA3/VC: palette is RGBA (no swap needed)
-                # SA:       palette is BGRA (swap B<->R)
-                if not palette or len(palette) < 1024:
-                    return None
-                force_opaque = (palette_entry_fmt == 'RGB888')
-                for i in range(min(pixel_count, len(data))):
-                    p = data[i] * 4
-                    if p + 3 < len(palette):
-                        if palette_is_bgra:
-                            b, g, r, a = palette[p], palette[p+1], palette[p+2], palette[p+3]
-                        else:
-                            r, g, b, a = palette[p], palette[p+1], palette[p+2], palette[p+3]
-                        rgba[i*4:i*4+4] = [r, g, b, 255 if force_opaque else a]
-
-            elif format_type == 'PAL4':
-                # 4-bit indexed, 16 x 4-byte palette entries
-                # GTA3/VC: palette is RGBA; SA: palette is BGRA
-                # CRITICAL: high nibble = first pixel, low nibble = second (DragonFF)
-                if not palette or len(palette) < 64:
-                    return None
-                force_opaque = (palette_entry_fmt == 'RGB888')
-                pixel = 0
-                for i in range(len(data)):
-                    for idx in ((data[i] >> 4) & 0x0F, data[i] & 0x0F):
-                        if pixel >= pixel_count:
-                            break
-                        p = idx * 4
-                        if p + 3 < len(palette):
-                            if palette_is_bgra:
-                                b, g, r, a = palette[p], palette[p+1], palette[p+2], palette[p+3]
-                            else:
-                                r, g, b, a = palette[p], palette[p+1], palette[p+2], palette[p+3]
-                            rgba[pixel*4:pixel*4+4] = [r, g, b, 255 if force_opaque else a]
-                        pixel += 1
-
-            elif 'ARGB8888' in format_type or 'ARGB32' in format_type:
-                # RenderWare stores as BGRA; X8R8G8B8 (force_opaque) has padding not alpha
-                for i in range(pixel_count):
-                    if i*4+4 <= len(data):
-                        b, g, r, a = data[i*4], data[i*4+1], data[i*4+2], data[i*4+3]
-                        rgba[i*4:i*4+4] = [r, g, b, 255 if force_opaque else a]
-
-            elif 'RGB888' in format_type:
-                # Stored as BGR (3 bpp) or BGRX (4 bpp when depth==32)
-                stride = 4 if depth == 32 else 3
-                for i in range(pixel_count):
-                    if i*stride+stride <= len(data):
-                        b, g, r = data[i*stride], data[i*stride+1], data[i*stride+2]
-                        rgba[i*4:i*4+4] = [r, g, b, 255]
-
-            elif 'RGB565' in format_type:
-                for i in range(pixel_count):
-                    if i*2+2 <= len(data):
-                        pixel = struct.unpack('<H', data[i*2:i*2+2])[0]
-                        r = ((pixel >> 11) & 0x1F) << 3
-                        g = ((pixel >> 5) & 0x3F) << 2
-                        b = (pixel & 0x1F) << 3
-                        rgba[i*4:i*4+4] = [r, g, b, 255]
-
-            elif 'ARGB1555' in format_type:
-                for i in range(pixel_count):
-                    if i*2+2 <= len(data):
-                        pixel = struct.unpack('<H', data[i*2:i*2+2])[0]
-                        a = 255 if (pixel & 0x8000) else 0
-                        r = ((pixel >> 10) & 0x1F) << 3
-                        g = ((pixel >> 5) & 0x1F) << 3
-                        b = (pixel & 0x1F) << 3
-                        rgba[i*4:i*4+4] = [r, g, b, a]
-
-            elif 'ARGB4444' in format_type:
-                for i in range(pixel_count):
-                    if i*2+2 <= len(data):
-                        pixel = struct.unpack('<H', data[i*2:i*2+2])[0]
-                        a = ((pixel >> 12) & 0x0F) * 17
-                        r = ((pixel >> 8) & 0x0F) * 17
-                        g = ((pixel >> 4) & 0x0F) * 17
-                        b = (pixel & 0x0F) * 17
-                        rgba[i*4:i*4+4] = [r, g, b, a]
-
-            elif 'RGB555' in format_type:
-                for i in range(pixel_count):
-                    if i*2+2 <= len(data):
-                        pixel = struct.unpack('<H', data[i*2:i*2+2])[0]
-                        r = ((pixel >> 10) & 0x1F) << 3
-                        g = ((pixel >> 5) & 0x1F) << 3
-                        b = (pixel & 0x1F) << 3
-                        rgba[i*4:i*4+4] = [r, g, b, 255]
-
-            elif 'A8L8' in format_type:
-                for i in range(pixel_count):
-                    if i*2+2 <= len(data):
-                        lum, a = data[i*2], data[i*2+1]
-                        rgba[i*4:i*4+4] = [lum, lum, lum, a]
-
-            elif 'LUM8' in format_type or 'L8' in format_type:
-                for i in range(pixel_count):
-                    if i < len(data):
-                        lum = data[i]
-                        rgba[i*4:i*4+4] = [lum, lum, lum, 255]
-
-            else:
-                # Unknown format - render as grey so it at least shows something
-                for i in range(pixel_count):
-                    rgba[i*4:i*4+4] = [128, 128, 128, 255]
-
-            return bytes(rgba)
-        except Exception as e:
-            return None
+    def _decompress_uncompressed(self, data, width, height, format_type, palette=None, palette_entry_fmt='ARGB8888', depth=0, force_opaque=False, palette_is_bgra=True): #vers 8
+        """Decompress all RenderWare uncompressed/palettized formats to RGBA
+        - NumPy kernels in apps/methods/texture_decode.py"""
+        if get_decoder(format_type) is None:
+            format_type = 'UNKNOWN'   # render as grey so it at least shows something
+        return decode_texture(data, width, height, format_type, palette=palette,
+                              palette_entry_fmt=palette_entry_fmt, depth=depth,
+                              force_opaque=force_opaque, palette_is_bgra=palette_is_bgra)
 
 
     def _create_thumbnail(self, rgba_data, width, height): #vers 2
@@ -12729,9 +12700,11 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             self.setWindowTitle(current_title + "*")
 
 
-    def _rebuild_txd_with_size_management(self): #vers 1
+    def _rebuild_txd_with_size_management(self): #vers 2
         """Rebuild TXD data with support for large texture replacements"""
         try:
+            if not self._wait_for_txd_load():
+                return None
             import struct
 
             if not self.current_txd_data or not self.texture_list:
@@ -12821,7 +12794,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             QMessageBox.critical(self, "Error", f"Failed to open IMG: {str(e)}")
 
 
-    def _find_txd_via_db(self, txd_name: str) -> bool: #vers 1
+    def _find_txd_via_db(self, txd_name: str) -> bool: #vers 3
         """Look up a TXD by name in the asset DB and load it.
         txd_name: stem (e.g. 'landstal') or full name ('landstal.txd').
         Returns True if found and loaded."""
@@ -12841,13 +12814,9 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         if not src_path or not os.path.isfile(src_path):
             return False
         try:
-            from apps.methods.img_core_classes import IMGFile
-            arc = IMGFile(src_path)
+            arc = self._new_img_file(src_path)
             arc.open()
-            entry = next(
-                (e for e in arc.entries
-                 if e.name.lower() == entry_nm.lower()),
-                None)
+            entry = arc.get_entry(entry_nm)
             if entry is None:
                 return False
             data = arc.read_entry_data(entry)
@@ -14701,34 +14670,31 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
             self.main_window.log_message(f"✅ Imported {imported}/{len(self.texture_list)} textures")
 
 
-    def _add_texture_to_table(self, texture): #vers 3
-        """Add texture to table with file size and warning icon"""
+    def _add_texture_to_table(self, texture): #vers 4
+        """Add texture to table with file size and warning icon.
+        Textures still waiting to decode get their thumbnail when scrolled
+        into view (_fill_visible_thumbnails)"""
         row = self.texture_table.rowCount()
         self.texture_table.insertRow(row)
 
-        # Create thumbnail
         thumb_item = QTableWidgetItem()
-        rgba_data = texture.get('rgba_data')
         width = texture.get('width', 0)
         height = texture.get('height', 0)
+        self.texture_table.setItem(row, 0, thumb_item)
 
-        if rgba_data and width > 0:
-            pixmap = self._create_thumbnail(rgba_data, width, height)
-            if pixmap:
-                # Composite warning badge onto thumbnail if alpha looks suspicious
-                if texture.get('has_alpha', False) and self._quick_alpha_check(texture):
-                    pixmap = self._add_warning_badge(pixmap)
-                thumb_item.setData(Qt.ItemDataRole.DecorationRole, pixmap)
-            else:
-                thumb_item.setText("⚠️" if texture.get('has_alpha', False) and self._quick_alpha_check(texture) else "🖼️")
-        else:
+        pending = isinstance(texture, LazyTexture) and not texture.is_decoded()
+        if pending:
+            rgba_size = width * height * 4
             thumb_item.setText("🖼️")
-
-        self.texture_table.setItem(row, 0, thumb_item)
+            thumb_item.setData(Qt.ItemDataRole.UserRole, 'thumb_pending')
+        else:
+            rgba_data = texture.get('rgba_data')
+            rgba_size = len(rgba_data) if rgba_data else 0
+            self._set_row_thumbnail(row, texture)
 
         # Create details with FILE SIZE
         name = texture['name']
-        file_size_kb = len(rgba_data) / 1024 if rgba_data else 0
+        file_size_kb = rgba_size / 1024
         depth = texture.get('depth', 32)
         fmt = texture.get('format', 'Unknown')
         has_alpha = texture.get('has_alpha', False)
@@ -14783,12 +14749,59 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         self.texture_table.setColumnWidth(0, 80)
 
 
-    def _quick_alpha_check(self, texture): #vers 1
-        """Quick check if alpha might be same as RGB (for warning icon)"""
+    def _set_row_thumbnail(self, row, texture): #vers 2
+        """Create the preview pixmap of a table row from the smallest
+        sufficient mip level - see _thumbnail_source"""
+        thumb_item = self.texture_table.item(row, 0)
+        if thumb_item is None:
+            return
+        thumb_item.setData(Qt.ItemDataRole.UserRole, None)
+        rgba_data, width, height = self._thumbnail_source(texture)
+
+        if rgba_data and width > 0:
+            pixmap = self._create_thumbnail(rgba_data, width, height)
+            suspicious = texture.get('has_alpha', False) and self._quick_alpha_check(texture, rgba_data)
+            if pixmap:
+                # Composite warning badge onto thumbnail if alpha looks suspicious
+                if suspicious:
+                    pixmap = self._add_warning_badge(pixmap)
+                thumb_item.setText("")
+                thumb_item.setData(Qt.ItemDataRole.DecorationRole, pixmap)
+            else:
+                thumb_item.setText("⚠️" if suspicious else "🖼️")
+        else:
+            thumb_item.setText("🖼️")
+
+
+    def _thumbnail_source(self, texture, size=64): #vers 2
+        """(rgba, width, height) of the smallest mip level a size px preview
+        needs - see thumbnail_source in apps/methods/txd_native.py"""
+        return thumbnail_source(texture, size)
+
+
+    def _fill_visible_thumbnails(self, *args): #vers 1
+        """Create thumbnails for pending rows inside the table viewport"""
+        table = getattr(self, 'texture_table', None)
+        if table is None or table.rowCount() == 0:
+            return
+        top = max(0, table.rowAt(0))
+        bottom = table.rowAt(table.viewport().height() - 1)
+        if bottom < 0:
+            bottom = table.rowCount() - 1
+        for row in range(top, min(bottom, len(self.texture_list) - 1) + 1):
+            item = table.item(row, 0)
+            if item is not None and item.data(Qt.ItemDataRole.UserRole) == 'thumb_pending':
+                self._set_row_thumbnail(row, self.texture_list[row])
+
+
+    def _quick_alpha_check(self, texture, rgba_data=None): #vers 2
+        """Quick check if alpha might be same as RGB (for warning icon).
+        rgba_data overrides the texture's level 0 (e.g. the thumbnail mip)"""
         if not texture.get('has_alpha', False):
             return False
 
-        rgba_data = texture.get('rgba_data', b'')
+        if rgba_data is None:
+            rgba_data = texture.get('rgba_data', b'')
         if not rgba_data or len(rgba_data) < 400:  # Need at least 100 pixels
             return False
 
@@ -14811,7 +14824,7 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         return (matches / samples) > 0.9
 
 
-    def _load_settings(self): #vers 1
+    def _load_settings(self): #vers 9
         """Load settings from config file"""
         import json
 
@@ -14826,11 +14839,26 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
                     settings = json.load(f)
                     self.save_to_source_location = settings.get('save_to_source_location', True)
                     self.last_save_directory = settings.get('last_save_directory', None)
+                    quality = settings.get('dxt_quality', 'normal')
+                    self.dxt_quality = quality if quality in QUALITY_TIERS else 'normal'
+                    self.decode_cache_mb = int(settings.get('decode_cache_mb', DEFAULT_BUDGET_MB))
+                    self.lazy_decode = bool(settings.get('lazy_decode', True))
+                    self.thumbnail_cache_mb = int(settings.get('thumbnail_cache_mb', DEFAULT_MAX_MB))
+                    self.background_load = bool(settings.get('background_load', True))
+                    self.fast_load = bool(settings.get('fast_load', False))
+                    self.lzo_cache_mb = int(settings.get('lzo_cache_mb', LZO_CACHE_MB))
+                    self.lzo_cache_spill = bool(settings.get('lzo_cache_spill', False))
+                    self.background_rw_detection = bool(settings.get('background_rw_detection', False))
+                    self.lazy_rw_detection = bool(settings.get('lazy_rw_detection', False))
         except Exception as e:
             print(f"Failed to load settings: {e}")
+        get_decoded_cache().set_budget(self.decode_cache_mb * 1024 * 1024)
+        get_thumbnail_cache().max_bytes = self.thumbnail_cache_mb * 1024 * 1024
+        get_lzo_entry_cache().set_budget(self.lzo_cache_mb * 1024 * 1024)
+        get_lzo_entry_cache().spill = self.lzo_cache_spill
 
 
-    def _save_settings(self): #vers 1
+    def _save_settings(self): #vers 9
         """Save settings to config file"""
         import json
 
@@ -14842,7 +14870,17 @@ class TXDWorkshop(ToolMenuMixin, QWidget): #vers 4
         try:
             settings = {
                 'save_to_source_location': self.save_to_source_location,
-                'last_save_directory': self.last_save_directory
+                'last_save_directory': self.last_save_directory,
+                'dxt_quality': self.dxt_quality,
+                'decode_cache_mb': self.decode_cache_mb,
+                'lazy_decode': self.lazy_decode,
+                'thumbnail_cache_mb': self.thumbnail_cache_mb,
+                'background_load': self.background_load,
+                'fast_load': self.fast_load,
+                'lzo_cache_mb': self.lzo_cache_mb,
+                'lzo_cache_spill': self.lzo_cache_spill,
+                'background_rw_detection': self.background_rw_detection,
+                'lazy_rw_detection': self.lazy_rw_detection
             }
 
             with open(settings_file, 'w') as f:
@@ -17983,32 +18021,39 @@ class MipmapManagerWindow(QWidget): #vers 2
         self.close()
 
 
-    def _recompress_modified_levels(self): #vers 1
-        """Recompress modified mipmap levels to DXT format"""
+    def _recompress_modified_levels(self): #vers 2
+        """Recompress modified mipmap levels to DXT format on the compression scheduler"""
         try:
             format_type = self.texture_data['format']
-
-            for level_num, level_data in self.modified_levels.items():
-                rgba_data = level_data.get('rgba_data')
-                if not rgba_data:
+            levels = {lvl.get('level', 0): lvl for lvl in self.texture_data.get('mipmap_levels', [])}
+            quality = getattr(self.parent_workshop, 'dxt_quality', 'normal')
+            punchthrough = bool(self.texture_data.get('has_alpha'))
+
+            jobs = []
+            for level_num in self.modified_levels:
+                level_data = levels.get(level_num)
+                if not level_data or not level_data.get('rgba_data'):
                     continue
+                if 'DXT' not in format_type:
+                    level_data['compressed_data'] = level_data['rgba_data']  # Uncompressed
+                    level_data['compressed_size'] = len(level_data['rgba_data'])
+                    continue
+                jobs.append(CompressJob(level_num, level_data['rgba_data'],
+                                        level_data['width'], level_data['height'],
+                                        format_type, quality, punchthrough))
 
-                width = level_data['width']
-                height = level_data['height']
-
-                # Compress based on format
-                if 'DXT1' in format_type:
-                    compressed_data = self._compress_to_dxt1(rgba_data, width, height)
-                elif 'DXT3' in format_type:
-                    compressed_data = self._compress_to_dxt3(rgba_data, width, height)
-                elif 'DXT5' in format_type:
-                    compressed_data = self._compress_to_dxt5(rgba_data, width, height)
-                else:
-                    compressed_data = rgba_data  # Uncompressed
+            results = _run_compress_jobs(self, jobs, f"Recompressing {len(jobs)} levels...")
+            if results is None:
+                return
 
-                if compressed_data:
-                    level_data['compressed_data'] = compressed_data
-                    level_data['compressed_size'] = len(compressed_data)
+            for level_num, compressed_data in results.items():
+                if not compressed_data:
+                    continue
+                level_data = levels[level_num]
+                level_data['compressed_data'] = compressed_data
+                level_data['compressed_size'] = len(compressed_data)
+                if level_num == 0:
+                    self.texture_data['compressed_data'] = compressed_data
 
             if self.main_window and hasattr(self.main_window, 'log_message'):
                 self.main_window.log_message(f"✅ Recompressed {len(self.modified_levels)} modified levels")
@@ -18018,78 +18063,6 @@ class MipmapManagerWindow(QWidget): #vers 2
                 self.main_window.log_message(f"⚠️ Recompression warning: {str(e)}")
 
 
-    # --- DXT1 and DXT5 encoders (pure Python) ---
-
-    def _compress_to_dxt1(self, rgba_data, width, height): #vers 2
-        """Compress RGBA data to DXT1 format"""
-        try:
-            # Use helper function
-            return _encode_dxt1(rgba_data, width, height)
-        except Exception as e:
-            if self.main_window and hasattr(self.main_window, 'log_message'):
-                self.main_window.log_message(f"⚠️ DXT1 compression error: {str(e)}")
-            return None
-
-
-    def _compress_to_dxt3(self, rgba_data, width, height): #vers 2
-        """Compress RGBA data to DXT3 format"""
-        try:
-            # DXT3 uses DXT1 color + explicit alpha
-            import struct
-
-            blocks_x = (width + 3) // 4
-            blocks_y = (height + 3) // 4
-            dxt3_data = bytearray()
-
-            for by in range(blocks_y):
-                for bx in range(blocks_x):
-                    # Extract 4x4 block
-                    block_alpha = bytearray()
-
-                    for py in range(4):
-                        for px in range(4):
-                            x = bx * 4 + px
-                            y = by * 4 + py
-
-                            if x < width and y < height:
-                                idx = (y * width + x) * 4
-                                alpha = rgba_data[idx + 3]
-                            else:
-                                alpha = 255
-
-                            block_alpha.append(alpha)
-
-                    # Encode explicit alpha (4-bit per pixel)
-                    alpha_block = 0
-                    for i in range(16):
-                        alpha_4bit = block_alpha[i] >> 4  # Convert 8-bit to 4-bit
-                        alpha_block |= (alpha_4bit << (i * 4))
-
-                    # Pack alpha block (8 bytes)
-                    dxt3_data.extend(struct.pack('<Q', alpha_block))
-
-                    # Add DXT1 color block (would need to encode, using placeholder)
-                    dxt3_data.extend(b'\x00' * 8)  # Placeholder for color block
-
-            return bytes(dxt3_data)
-
-        except Exception as e:
-            if self.main_window and hasattr(self.main_window, 'log_message'):
-                self.main_window.log_message(f"⚠️ DXT3 compression error: {str(e)}")
-            return None
-
-
-    def _compress_to_dxt5(self, rgba_data, width, height): #vers 2
-        """Compress RGBA data to DXT5 format"""
-        try:
-            # Use helper function
-            return _encode_dxt5(rgba_data, width, height)
-        except Exception as e:
-            if self.main_window and hasattr(self.main_window, 'log_message'):
-                self.main_window.log_message(f"⚠️ DXT5 compression error: {str(e)}")
-            return None
-
-
 class TexturePropertiesDialog(QDialog): #vers 1
     """Complete texture properties dialog with all settings"""
 
@@ -19021,187 +18994,204 @@ class ZoomablePreview(QLabel): #vers 2
 
 # Footer functions
 
-def _rgb_to_565(r, g, b):  #vers 1
-    return ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
-
-
-def _565_to_rgb(c):  #vers 1
-    r = ((c >> 11) & 0x1F) << 3
-    g = ((c >> 5) & 0x3F) << 2
-    b = (c & 0x1F) << 3
-    return r, g, b
-
-
-def _best_color_index(palette, r, g, b):  #vers 1
-    best = 0
-    best_dist = None
-    for i, (pr, pg, pb) in enumerate(palette):
-        dr = pr - r
-        dg = pg - g
-        db = pb - b
-        dist = dr*dr + dg*dg + db*db
-        if best_dist is None or dist < best_dist:
-            best_dist = dist
-            best = i
-    return best
-
-
-def _encode_dxt1(rgba_bytes, width, height):  #vers 1
-    """Encode raw RGBA bytes (RGBA8888) into DXT1 bytes.
-    Simple block-wise encoder: select endpoints by luminance heuristic and assign indices.
-    """
-    blocks_x = (width + 3) // 4
-    blocks_y = (height + 3) // 4
-    out = bytearray()
-
-    for by in range(blocks_y):
-        for bx in range(blocks_x):
-            pixels = []
-            for py in range(4):
-                for px in range(4):
-                    x = bx*4 + px
-                    y = by*4 + py
-                    if x < width and y < height:
-                        idx = (y*width + x)*4
-                        r = rgba_bytes[idx]
-                        g = rgba_bytes[idx+1]
-                        b = rgba_bytes[idx+2]
-                    else:
-                        r = g = b = 0
-                    pixels.append((r,g,b))
-
-            lum = [0.2126*p[0] + 0.7152*p[1] + 0.0722*p[2] for p in pixels]
-            max_i = lum.index(max(lum))
-            min_i = lum.index(min(lum))
-            c0_rgb = pixels[max_i]
-            c1_rgb = pixels[min_i]
-
-            c0_565 = _rgb_to_565(*c0_rgb)
-            c1_565 = _rgb_to_565(*c1_rgb)
-
-            pr0 = _565_to_rgb(c0_565)
-            pr1 = _565_to_rgb(c1_565)
-            palette = [pr0, pr1]
-            if c0_565 > c1_565:
-                palette.append(((2*pr0[0]+pr1[0])//3, (2*pr0[1]+pr1[1])//3, (2*pr0[2]+pr1[2])//3))
-                palette.append(((pr0[0]+2*pr1[0])//3, (pr0[1]+2*pr1[1])//3, (pr0[2]+2*pr1[2])//3))
-            else:
-                palette.append(((pr0[0]+pr1[0])//2, (pr0[1]+pr1[1])//2, (pr0[2]+pr1[2])//2))
-                palette.append((0,0,0))
-
-            indices = 0
-            bit_pos = 0
-            for (r,g,b) in pixels:
-                idx = _best_color_index(palette, r, g, b)
-                indices |= (idx & 0x3) << bit_pos
-                bit_pos += 2
-
-            out.extend(struct.pack('<HHI', c0_565, c1_565, indices))
-
-    return bytes(out)
-
-
-def _encode_alpha_block(alpha_bytes):  #vers 1
-    """Encode 4x4 alpha block for DXT5.
-    alpha_bytes: list of 16 alpha values (0-255)
-    Returns 8 bytes: a0, a1, and 48-bit index stream (little-endian packed 3 bits per pixel)
-    """
-    a0 = max(alpha_bytes)
-    a1 = min(alpha_bytes)
-
-    # Build alpha palette (must match decoder exactly)
-    alpha_palette = [a0, a1]
-    if a0 > a1:
-        # 6 interpolated values at 1/7 .. 6/7
-        for i in range(1, 7):
-            alpha_palette.append(round(a0 * ((7-i)/7) + a1 * (i/7)))
+def _run_compress_jobs(parent, jobs, label): #vers 1
+    """Run CompressJobs on the shared scheduler behind a cancellable progress
+    dialog. Returns {job.key: bytes}, or None if the user cancelled."""
+    from PyQt6.QtWidgets import QProgressDialog
+
+    if not jobs:
+        return {}
+
+    progress = QProgressDialog(label, "Cancel", 0, 100, parent)
+    progress.setWindowTitle("DXT Compression")
+    progress.setWindowModality(Qt.WindowModality.WindowModal)
+    progress.setMinimumDuration(500)
+
+    def update_progress(done, total):  #vers 1
+        progress.setValue(int(done * 100 / max(1, total)))
+        QApplication.processEvents()
+        return not progress.wasCanceled()
+
+    try:
+        return get_compress_scheduler().compress_all(jobs, update_progress)
+    finally:
+        progress.close()
+
+
+def _txd_texture_count(txd_data, rw_version=None): #vers 2
+    """Return (rw_version, texture_count, first_section_offset) from the TXD
+    dictionary header. Raises ValueError if the header is malformed."""
+    if len(txd_data) < 28:
+        raise ValueError("File too small - missing TXD header")
+    main = read_chunk_header(txd_data, 0)
+    if main.type != RW_TEXTURE_DICTIONARY:
+        raise ValueError(f"Invalid TXD header - expected 0x16, got 0x{main.type:02X}")
+    body = read_chunk_header(txd_data, main.data_offset)
+    if body.type != RW_STRUCT:
+        raise ValueError(f"Invalid struct section - expected 0x01, got 0x{body.type:02X}")
+    if body.size < 4:
+        raise ValueError(f"Struct section too small: {body.size} bytes")
+    if rw_version is None:
+        rw_version = detect_txd_version(txd_data)[0]
+    # SA (RW >= 0x1803FFFF): uint16 tex_count + uint16 device_id
+    # GTA3/VC (RW < 0x1803FFFF): uint32 tex_count
+    if rw_version >= 0x1803FFFF:
+        texture_count = struct.unpack_from('<H', txd_data, 24)[0]
     else:
-        # 4 interpolated + hard 0 and 255
-        for i in range(1, 5):
-            alpha_palette.append(round(a0 * ((5-i)/5) + a1 * (i/5)))
-        alpha_palette.extend([0, 255])
-
-    # For each pixel, find best index (0..7)
-    indices = 0
-    bit_pos = 0
-    for a in alpha_bytes:
-        # find closest
-        best_i = 0
-        best_dist = None
-        for i, av in enumerate(alpha_palette):
-            dist = (av - a) * (av - a)
-            if best_dist is None or dist < best_dist:
-                best_dist = dist
-                best_i = i
-        indices |= (best_i & 0x7) << bit_pos
-        bit_pos += 3
-
-    # pack into 6 bytes little endian
-    idx_bytes = indices.to_bytes(6, 'little')
-    return bytes([a0, a1]) + idx_bytes
-
-
-def _encode_dxt5(rgba_bytes, width, height):  #vers 1
-    """Encode raw RGBA8888 bytes into DXT5 bytes.
-    DXT5 block = 8 bytes alpha block + 8 bytes color block (same as DXT1 color block)
-    """
-    blocks_x = (width + 3) // 4
-    blocks_y = (height + 3) // 4
-    out = bytearray()
-
-    for by in range(blocks_y):
-        for bx in range(blocks_x):
-            alpha_vals = []
-            pixels_rgb = []
-            for py in range(4):
-                for px in range(4):
-                    x = bx*4 + px
-                    y = by*4 + py
-                    if x < width and y < height:
-                        idx = (y*width + x)*4
-                        r = rgba_bytes[idx]
-                        g = rgba_bytes[idx+1]
-                        b = rgba_bytes[idx+2]
-                        a = rgba_bytes[idx+3]
-                    else:
-                        r = g = b = a = 0
-                    pixels_rgb.append((r,g,b))
-                    alpha_vals.append(a)
-
-            # alpha block
-            alpha_block = _encode_alpha_block(alpha_vals)
-
-            # color block same as DXT1
-            lum = [0.2126*p[0] + 0.7152*p[1] + 0.0722*p[2] for p in pixels_rgb]
-            max_i = lum.index(max(lum))
-            min_i = lum.index(min(lum))
-            c0_rgb = pixels_rgb[max_i]
-            c1_rgb = pixels_rgb[min_i]
-            c0_565 = _rgb_to_565(*c0_rgb)
-            c1_565 = _rgb_to_565(*c1_rgb)
-            pr0 = _565_to_rgb(c0_565)
-            pr1 = _565_to_rgb(c1_565)
-            palette = [pr0, pr1]
-            if c0_565 > c1_565:
-                palette.append(((2*pr0[0]+pr1[0])//3, (2*pr0[1]+pr1[1])//3, (2*pr0[2]+pr1[2])//3))
-                palette.append(((pr0[0]+2*pr1[0])//3, (pr0[1]+2*pr1[1])//3, (pr0[2]+2*pr1[2])//3))
-            else:
-                palette.append(((pr0[0]+pr1[0])//2, (pr0[1]+pr1[1])//2, (pr0[2]+pr1[2])//2))
-                palette.append((0,0,0))
+        texture_count = struct.unpack_from('<I', txd_data, 24)[0]
+    if texture_count > 4096:
+        raise ValueError(f"Invalid texture count: {texture_count} (likely corrupt header)")
+    return rw_version, texture_count, body.end
+
+
+def _iter_txd_textures(txd_data, rw_version=None): #vers 3
+    """Yield (index, next_offset, texture) for every Texture Native section,
+    parsed with decode=False; texture is None where parsing failed or the
+    section is not a Texture Native. Raises ValueError for a bad header."""
+    rw_version, texture_count, offset = _txd_texture_count(txd_data, rw_version)
+    if texture_count == 0:
+        return
+    for i, chunk in enumerate(iter_chunks(txd_data, offset)):
+        tex = None
+        if chunk.type == RW_TEXTURE_NATIVE:
+            tex = parse_texture_native(txd_data, chunk.offset, i, rw_version=rw_version,
+                                       decode=False)
+        yield i, chunk.end, tex
+        if i + 1 >= texture_count:
+            break
+
+
+def _build_txd_thumbnails(txd_data): #vers 3
+    """Preview of every texture in a TXD for the thumbnail cache: list of
+    dicts (tex_index, name, width, height, format, image=PNG bytes). Only the
+    smallest sufficient mip level of each texture is decoded."""
+    thumbs = []
+    try:
+        for i, _, tex in _iter_txd_textures(txd_data):
+            if not tex:
+                continue
+            rgba, width, height = thumbnail_source(tex, THUMB_SIZE)
+            if rgba and width > 0 and height > 0 and len(rgba) >= width * height * 4:
+                small, w, h = downscale_rgba(rgba, width, height)
+                thumbs.append({'tex_index': i, 'name': tex.get('name', f'texture_{i}'),
+                               'width': tex.get('width', width), 'height': tex.get('height', height),
+                               'format': str(tex.get('format', '')),
+                               'image': encode_png(small, w, h)})
+    except (ValueError, struct.error):
+        pass  # malformed TXD - keep what was read
+    return thumbs
+
+
+class TXDLoadSignals(QObject): #vers 1
+    """Signals of a TXDLoadTask (QRunnable is not a QObject). Every signal
+    carries the load_id so results of a superseded load can be ignored."""
+    textures_ready = pyqtSignal(int, list)   # load_id, textures in TXD order
+    progress = pyqtSignal(int, int, int)     # load_id, bytes parsed, total bytes
+    finished = pyqtSignal(int, int)          # load_id, textures parsed
+    failed = pyqtSignal(int, str)            # load_id, error message
+
+
+class TXDLoadTask(QRunnable): #vers 1
+    """Parse a TXD on the global QThreadPool, streaming parsed textures in
+    small batches. With decode=True levels are decoded here; otherwise only
+    the thumbnail mip of each texture is (the rest stays lazy)."""
+
+    # Emit a batch after this many textures or this many seconds
+    BATCH_TEXTURES = 16
+    BATCH_SECONDS = 0.05
+
+    def __init__(self, load_id, txd_data, rw_version, decode=False): #vers 1
+        super().__init__()
+        self.load_id = load_id
+        self.txd_data = txd_data
+        self.rw_version = rw_version
+        self.decode = decode
+        self.signals = TXDLoadSignals()
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+
+
+    def cancel(self): #vers 1
+        """Stop after the texture being parsed; nothing more is emitted."""
+        self._cancelled.set()
+
+
+    def wait(self, timeout=None) -> bool: #vers 1
+        """Block until run() has returned. True unless timed out."""
+        return self._done.wait(timeout)
+
+
+    def _flush(self, batch): #vers 1
+        if self.decode:
+            decode_pending(batch)
+        if not self._cancelled.is_set():
+            self.signals.textures_ready.emit(self.load_id, batch)
+
+
+    def run(self): #vers 2
+        import time
+        total = len(self.txd_data)
+        count = 0
+        try:
+            if _txd_texture_count(self.txd_data, self.rw_version)[1] == 0:
+                self.signals.failed.emit(self.load_id, "__STUB_TXD__")
+                return
+            batch = []
+            last_emit = time.perf_counter()
+            for _, offset, tex in _iter_txd_textures(self.txd_data, self.rw_version):
+                if self._cancelled.is_set():
+                    return
+                if not tex:
+                    continue
+                if not self.decode:
+                    thumbnail_source(tex)
+                batch.append(tex)
+                count += 1
+                now = time.perf_counter()
+                if len(batch) >= self.BATCH_TEXTURES or now - last_emit >= self.BATCH_SECONDS:
+                    self._flush(batch)
+                    self.signals.progress.emit(self.load_id, min(offset, total), total)
+                    batch = []
+                    last_emit = now
+            if batch:
+                self._flush(batch)
+            if not self._cancelled.is_set():
+                self.signals.progress.emit(self.load_id, total, total)
+                self.signals.finished.emit(self.load_id, count)
+        except Exception as e:
+            if not self._cancelled.is_set():
+                self.signals.failed.emit(self.load_id, str(e))
+        finally:
+            self._done.set()
 
-            indices = 0
-            bit_pos = 0
-            for (r,g,b) in pixels_rgb:
-                idx = _best_color_index(palette, r, g, b)
-                indices |= (idx & 0x3) << bit_pos
-                bit_pos += 2
 
-            color_bytes = struct.pack('<HHI', c0_565, c1_565, indices)
+class TXDThumbnailWorker(QThread): #vers 1
+    """Background builder of cached TXD previews for one IMG archive.
+    Emits thumbnails_ready(entry, thumbs) after each TXD is stored. Reads
+    through the shared IMGFile, so it is registered as a background reader
+    there and stops when the archive is about to be rewritten."""
+    thumbnails_ready = pyqtSignal(object, list)
 
-            out.extend(alpha_block)
-            out.extend(color_bytes)
+    def __init__(self, img, img_path, mtime, entries, cache, parent=None): #vers 1
+        super().__init__(parent)
+        self.img = img
+        self.img_path = img_path
+        self.mtime = mtime
+        self.entries = list(entries)
+        self.cache = cache
+
+
+    def run(self): #vers 1
+        for entry in self.entries:
+            if self.isInterruptionRequested():
+                return
+            try:
+                thumbs = _build_txd_thumbnails(self.img.read_entry_data(entry))
+            except Exception:
+                continue  # unreadable entry - retried next time the archive opens
+            self.cache.put(self.img_path, self.mtime, entry, thumbs)
+            self.thumbnails_ready.emit(entry, thumbs)
 
-    return bytes(out)
 
 # --- External AI upscaler integration helper ---
 import subprocess
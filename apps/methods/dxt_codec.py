@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/dxt_codec.py - Version: 4
+# X-Seti - October17 2026 - IMG Factory 1.6
+# DXT1/DXT3/DXT5 (BC1/BC2/BC3) block codec, BC4/BC5 decode - NumPy, whole-texture batches
+
+"""
+Shared DXT codec for TXD Workshop and the XTD (WTD/YTD) reader.
+
+Every block of a texture is decoded in one pass: the 565 endpoints are
+unpacked for all blocks at once, the 4-entry colour palettes (and 8-entry
+DXT5 alpha palettes) are built as arrays and the 2/3/4-bit indices are
+gathered with fancy indexing - no per-pixel Python loops.
+
+Two palette conventions are in use in the tree and both are kept, so output
+stays byte-identical to the per-pixel decoders this replaced:
+  expand='shift'  565 -> 888 by plain shift (c5 << 3, c6 << 2)    TXD Workshop
+  expand='scale'  565 -> 888 by c * 255 // max                     XTD reader
+  alpha_interp='round'  DXT5 alpha = round(a0*(7-i)/7 + a1*i/7)   TXD Workshop
+  alpha_interp='floor'  DXT5 alpha = ((7-i)*a0 + i*a1) // 7        XTD reader
+
+Blocks missing from truncated data decode as transparent black.
+
+BC4 (ATI1) and BC5 (ATI2) reuse the DXT5 alpha block decoder per channel,
+with the XTD reader's 'floor' interpolation.
+
+The encoder works the same way - all blocks of an image (in chunks of
+_ENCODE_CHUNK) are fitted at once. Quality tiers:
+  'fast'    bounding-box endpoints
+  'normal'  PCA range fit along each block's principal axis
+  'high'    range fit + least-squares endpoint refinement, 6-value DXT5 alpha
+"""
+
+from typing import Optional
+
+import numpy as np
+
+## Methods list -
+# _alpha_palette
+# _assign_color_indices
+# _blocks_from_data
+# _color_palette
+# _encode_blocks
+# _endpoints_bbox
+# _endpoints_pca
+# _expand_565
+# _fit_alpha_blocks
+# _fit_color_blocks
+# _fit_explicit_alpha
+# _gather_alpha
+# _gather_colors
+# _quantize_565
+# _refine_endpoints
+# _rgba_blocks
+# _tile_blocks
+# decode_bc4
+# decode_bc5
+# decode_dxt
+# decode_dxt1
+# decode_dxt3
+# decode_dxt5
+# encode_dxt
+# encode_dxt1
+# encode_dxt3
+# encode_dxt5
+
+# Bit shifts for the 16 pixels of a 4x4 block, row-major
+_SHIFT_2BIT = np.arange(16, dtype=np.uint32) * 2
+_SHIFT_3BIT = np.arange(16, dtype=np.uint64) * 3
+
+
+def _blocks_from_data(data, width: int, height: int, block_size: int): #vers 1
+    """Return (blocks uint8 (n, block_size), total_blocks) for the complete
+    blocks present in data. n may be less than total_blocks."""
+    total = ((width + 3) // 4) * ((height + 3) // 4)
+    n = min(total, len(data) // block_size)
+    raw = np.frombuffer(data, dtype=np.uint8, count=n * block_size)
+    return raw.reshape(n, block_size), total
+
+
+def _expand_565(c, expand: str = 'shift'): #vers 1
+    """Unpack an array of 565 words to (n, 3) int32 RGB."""
+    c = c.astype(np.int32)
+    r = (c >> 11) & 0x1F
+    g = (c >> 5) & 0x3F
+    b = c & 0x1F
+    if expand == 'scale':
+        r = r * 255 // 31
+        g = g * 255 // 63
+        b = b * 255 // 31
+    else:
+        r = r << 3
+        g = g << 2
+        b = b << 3
+    return np.stack((r, g, b), axis=1)
+
+
+def _color_palette(color_blocks, expand: str = 'shift', punchthrough: bool = False): #vers 1
+    """Build (n, 4, 4) RGBA palettes from 8-byte colour blocks.
+
+    punchthrough=True applies the DXT1 rule: c0 <= c1 selects 3-colour mode
+    with index 3 transparent black. DXT3/DXT5 colour blocks are always
+    4-colour mode."""
+    words = np.ascontiguousarray(color_blocks[:, 0:4]).view('<u2')
+    c0 = words[:, 0]
+    c1 = words[:, 1]
+    p0 = _expand_565(c0, expand)
+    p1 = _expand_565(c1, expand)
+
+    n = len(color_blocks)
+    pal = np.empty((n, 4, 4), dtype=np.int32)
+    pal[:, 0, :3] = p0
+    pal[:, 1, :3] = p1
+    pal[:, 2, :3] = (2 * p0 + p1) // 3
+    pal[:, 3, :3] = (p0 + 2 * p1) // 3
+    pal[:, :, 3] = 255
+
+    if punchthrough:
+        three = c0 <= c1
+        if three.any():
+            pal[three, 2, :3] = (p0[three] + p1[three]) // 2
+            pal[three, 3, :] = 0
+    return pal
+
+
+def _gather_colors(color_blocks, pal): #vers 1
+    """Resolve the 2-bit colour indices of each block to (n, 16, 4) RGBA."""
+    bits = np.ascontiguousarray(color_blocks[:, 4:8]).view('<u4')[:, 0]
+    idx = (bits[:, None] >> _SHIFT_2BIT) & 3
+    return np.take_along_axis(pal, idx[:, :, None].astype(np.intp), axis=1)
+
+
+def _alpha_palette(a0, a1, alpha_interp: str = 'round'): #vers 1
+    """Build (n, 8) interpolated alpha palettes (DXT5 / BC4 style)."""
+    n = len(a0)
+    a0 = a0.astype(np.int32)
+    a1 = a1.astype(np.int32)
+    pal = np.empty((n, 8), dtype=np.int32)
+    pal[:, 0] = a0
+    pal[:, 1] = a1
+    seven = a0 > a1
+    five = ~seven
+
+    if alpha_interp == 'floor':
+        for i in range(1, 7):
+            pal[seven, 1 + i] = ((7 - i) * a0[seven] + i * a1[seven]) // 7
+        for i in range(1, 5):
+            pal[five, 1 + i] = ((5 - i) * a0[five] + i * a1[five]) // 5
+    else:
+        # Same float expression as the scalar decoder; np.rint and round()
+        # both round half to even
+        f0 = a0.astype(np.float64)
+        f1 = a1.astype(np.float64)
+        for i in range(1, 7):
+            v = f0[seven] * ((7 - i) / 7) + f1[seven] * (i / 7)
+            pal[seven, 1 + i] = np.rint(v).astype(np.int32)
+        for i in range(1, 5):
+            v = f0[five] * ((5 - i) / 5) + f1[five] * (i / 5)
+            pal[five, 1 + i] = np.rint(v).astype(np.int32)
+    pal[five, 6] = 0
+    pal[five, 7] = 255
+    return pal
+
+
+def _gather_alpha(alpha_blocks, alpha_interp: str = 'round'): #vers 1
+    """Decode 8-byte interpolated alpha blocks to (n, 16) values."""
+    pal = _alpha_palette(alpha_blocks[:, 0], alpha_blocks[:, 1], alpha_interp)
+    padded = np.zeros((len(alpha_blocks), 8), dtype=np.uint8)
+    padded[:, :6] = alpha_blocks[:, 2:8]
+    bits = padded.view('<u8')[:, 0]
+    idx = ((bits[:, None] >> _SHIFT_3BIT) & 7).astype(np.intp)
+    return np.take_along_axis(pal, idx, axis=1)
+
+
+def _tile_blocks(pixels, total: int, width: int, height: int) -> bytes: #vers 1
+    """Lay out (n, 16, 4) block pixels as a width x height RGBA8888 image.
+    Blocks beyond n (truncated data) stay zero."""
+    bx = (width + 3) // 4
+    by = (height + 3) // 4
+    full = np.zeros((total, 16, 4), dtype=np.uint8)
+    full[:len(pixels)] = pixels
+    img = full.reshape(by, bx, 4, 4, 4).transpose(0, 2, 1, 3, 4).reshape(by * 4, bx * 4, 4)
+    return img[:height, :width].tobytes()
+
+
+def decode_dxt1(data, width: int, height: int, expand: str = 'shift') -> bytes: #vers 1
+    """Decode DXT1/BC1 data to RGBA8888 bytes (1-bit alpha punch-through)."""
+    if width <= 0 or height <= 0:
+        return b''
+    blocks, total = _blocks_from_data(data, width, height, 8)
+    pal = _color_palette(blocks, expand, punchthrough=True)
+    return _tile_blocks(_gather_colors(blocks, pal), total, width, height)
+
+
+def decode_dxt3(data, width: int, height: int, expand: str = 'shift') -> bytes: #vers 1
+    """Decode DXT3/BC2 data (explicit 4-bit alpha) to RGBA8888 bytes."""
+    if width <= 0 or height <= 0:
+        return b''
+    blocks, total = _blocks_from_data(data, width, height, 16)
+    color = blocks[:, 8:16]
+    pixels = _gather_colors(color, _color_palette(color, expand))
+    nibbles = blocks[:, 0:8]
+    alpha = np.stack((nibbles & 0x0F, nibbles >> 4), axis=2).reshape(len(blocks), 16)
+    pixels[:, :, 3] = alpha.astype(np.int32) * 17
+    return _tile_blocks(pixels, total, width, height)
+
+
+def decode_dxt5(data, width: int, height: int, expand: str = 'shift',
+                alpha_interp: str = 'round') -> bytes: #vers 1
+    """Decode DXT5/BC3 data (interpolated alpha) to RGBA8888 bytes."""
+    if width <= 0 or height <= 0:
+        return b''
+    blocks, total = _blocks_from_data(data, width, height, 16)
+    color = blocks[:, 8:16]
+    pixels = _gather_colors(color, _color_palette(color, expand))
+    pixels[:, :, 3] = _gather_alpha(blocks[:, 0:8], alpha_interp)
+    return _tile_blocks(pixels, total, width, height)
+
+
+def decode_dxt(data, width: int, height: int, fmt: str, **kwargs) -> Optional[bytes]: #vers 1
+    """Decode by format name ('DXT1'/'BC1', 'DXT3'/'BC2', 'DXT5'/'BC3').
+    Returns None for formats this module does not handle."""
+    fmt = fmt.upper()
+    if 'DXT1' in fmt or fmt == 'BC1':
+        return decode_dxt1(data, width, height, kwargs.get('expand', 'shift'))
+    if 'DXT3' in fmt or fmt == 'BC2':
+        return decode_dxt3(data, width, height, kwargs.get('expand', 'shift'))
+    if 'DXT5' in fmt or fmt == 'BC3':
+        return decode_dxt5(data, width, height, **kwargs)
+    return None
+
+
+def decode_bc4(data, width: int, height: int) -> bytes: #vers 1
+    """Decode BC4/ATI1 single-channel data to opaque greyscale RGBA8888 bytes."""
+    if width <= 0 or height <= 0:
+        return b''
+    blocks, total = _blocks_from_data(data, width, height, 8)
+    grey = _gather_alpha(blocks, 'floor')
+    pixels = np.empty((len(blocks), 16, 4), dtype=np.int32)
+    pixels[:, :, :3] = grey[:, :, None]
+    pixels[:, :, 3] = 255
+    out = bytearray(_tile_blocks(pixels, total, width, height))
+    out[3::4] = b'\xff' * (width * height)
+    return bytes(out)
+
+
+def decode_bc5(data, width: int, height: int) -> bytes: #vers 1
+    """Decode BC5/ATI2 two-channel normal maps to RGBA8888 bytes.
+    B is rebuilt from the unit normal: sqrt(1 - x^2 - y^2)."""
+    if width <= 0 or height <= 0:
+        return b''
+    blocks, total = _blocks_from_data(data, width, height, 16)
+    r = _gather_alpha(blocks[:, 0:8], 'floor')
+    g = _gather_alpha(blocks[:, 8:16], 'floor')
+    nx = r / 127.5 - 1.0
+    ny = g / 127.5 - 1.0
+    nz2 = np.maximum(0.0, 1.0 - nx * nx - ny * ny)
+    pixels = np.empty((len(blocks), 16, 4), dtype=np.int32)
+    pixels[:, :, 0] = r
+    pixels[:, :, 1] = g
+    pixels[:, :, 2] = ((np.sqrt(nz2) * 0.5 + 0.5) * 255).astype(np.int32)
+    pixels[:, :, 3] = 255
+    return _tile_blocks(pixels, total, width, height)
+
+
+# =============================================================================
+# Encoder
+# =============================================================================
+
+# Encoder quality tiers: bounding box / PCA range fit / + least-squares refinement
+QUALITY_TIERS = ('fast', 'normal', 'high')
+
+# Blocks encoded per NumPy batch - bounds temporary memory on 2048x2048 maps
+_ENCODE_CHUNK = 16384
+
+# Palette weight of endpoint c0 for each index in 4-colour mode
+_W0_4 = np.array([1.0, 0.0, 2.0 / 3.0, 1.0 / 3.0], dtype=np.float32)
+
+
+def _rgba_blocks(rgba, width: int, height: int): #vers 1
+    """Split RGBA8888 bytes into (n, 16, 4) uint8 blocks. Partial edge blocks
+    are filled by replicating the last row/column so they don't pull the
+    endpoints towards black."""
+    img = np.frombuffer(rgba, dtype=np.uint8, count=width * height * 4).reshape(height, width, 4)
+    bx = (width + 3) // 4
+    by = (height + 3) // 4
+    pad_y = by * 4 - height
+    pad_x = bx * 4 - width
+    if pad_x or pad_y:
+        img = np.pad(img, ((0, pad_y), (0, pad_x), (0, 0)), mode='edge')
+    return img.reshape(by, 4, bx, 4, 4).transpose(0, 2, 1, 3, 4).reshape(by * bx, 16, 4)
+
+
+def _quantize_565(e): #vers 1
+    """Round (n, 3) float RGB endpoints to 565 words."""
+    e = np.clip(e, 0.0, 255.0)
+    r = np.rint(e[:, 0] * (31.0 / 255.0)).astype(np.int32)
+    g = np.rint(e[:, 1] * (63.0 / 255.0)).astype(np.int32)
+    b = np.rint(e[:, 2] * (31.0 / 255.0)).astype(np.int32)
+    return (r << 11) | (g << 5) | b
+
+
+def _endpoints_bbox(px): #vers 1
+    """'fast' tier - bounding-box corners, inset by 1/16 of the range."""
+    mn = px.min(axis=1)
+    mx = px.max(axis=1)
+    inset = (mx - mn) / 16.0
+    return mx - inset, mn + inset
+
+
+def _endpoints_pca(px): #vers 1
+    """'normal' tier - range fit along the principal axis of each block."""
+    mean = px.mean(axis=1)
+    d = px - mean[:, None, :]
+    cov = np.einsum('nki,nkj->nij', d, d)
+    # Power iteration from the bounding-box diagonal
+    v = px.max(axis=1) - px.min(axis=1)
+    for _ in range(6):
+        v = np.einsum('nij,nj->ni', cov, v)
+        norm = np.sqrt((v * v).sum(axis=1, keepdims=True))
+        v = v / np.where(norm > 0, norm, 1.0)
+    t = np.einsum('nki,ni->nk', d, v)
+    e0 = mean + t.max(axis=1)[:, None] * v
+    e1 = mean + t.min(axis=1)[:, None] * v
+    return e0, e1
+
+
+def _assign_color_indices(px, c0, c1, punchthrough: bool, transparent=None): #vers 1
+    """Pick the nearest palette entry per pixel. Returns (c0, c1, idx, err).
+
+    Endpoints are ordered for the block mode: c0 > c1 (4-colour) for opaque
+    blocks, c0 <= c1 (3-colour + transparent) for DXT1 blocks that contain
+    transparent pixels."""
+    swap = c0 < c1
+    if transparent is not None:
+        has_t = transparent.any(axis=1)
+        swap = np.where(has_t, c0 > c1, swap)
+    c0, c1 = np.where(swap, c1, c0), np.where(swap, c0, c1)
+
+    words = np.empty((len(c0), 4), dtype='<u2')
+    words[:, 0] = c0
+    words[:, 1] = c1
+    pal = _color_palette(words.view(np.uint8), punchthrough=punchthrough)
+    pal_rgb = pal[:, :, :3].astype(np.float32)
+
+    dist = ((px[:, :, None, :] - pal_rgb[:, None, :, :]) ** 2).sum(axis=3)
+    if punchthrough:
+        # Index 3 is transparent black in 3-colour mode - never use it for
+        # an opaque pixel
+        three = (c0 <= c1)
+        dist[three, :, 3] = np.inf
+    idx = dist.argmin(axis=2)
+    err = np.take_along_axis(dist, idx[:, :, None], axis=2)[:, :, 0]
+    if transparent is not None:
+        idx = np.where(transparent, 3, idx)
+        err = np.where(transparent, 0.0, err)
+    return c0, c1, idx, err.sum(axis=1)
+
+
+def _refine_endpoints(px, idx): #vers 1
+    """Least-squares endpoints for fixed 4-colour indices ('high' tier)."""
+    a = _W0_4[idx]
+    b = 1.0 - a
+    aa = (a * a).sum(axis=1)
+    bb = (b * b).sum(axis=1)
+    ab = (a * b).sum(axis=1)
+    ax = (a[:, :, None] * px).sum(axis=1)
+    bx = (b[:, :, None] * px).sum(axis=1)
+    det = aa * bb - ab * ab
+    ok = np.abs(det) > 1e-6
+    safe = np.where(ok, det, 1.0)[:, None]
+    e0 = (bb[:, None] * ax - ab[:, None] * bx) / safe
+    e1 = (aa[:, None] * bx - ab[:, None] * ax) / safe
+    return e0, e1, ok
+
+
+def _fit_color_blocks(blocks, quality: str = 'normal', punchthrough: bool = False): #vers 1
+    """Encode the colour half of (n, 16, 4) blocks to (n, 8) uint8 DXT1
+    colour blocks. Shared by the DXT1, DXT3 and DXT5 encoders."""
+    px = blocks[:, :, :3].astype(np.float32)
+    transparent = None
+    if punchthrough:
+        transparent = blocks[:, :, 3] < 128
+        if transparent.any():
+            # Fit endpoints to the opaque pixels only: replacing the rest
+            # with the opaque mean leaves bbox and principal axis unchanged
+            opaque = (~transparent)[:, :, None]
+            count = np.maximum(opaque.sum(axis=1), 1)
+            mean = (px * opaque).sum(axis=1) / count
+            px = np.where(opaque, px, mean[:, None, :])
+        else:
+            transparent = None
+
+    if quality == 'fast':
+        e0, e1 = _endpoints_bbox(px)
+    else:
+        e0, e1 = _endpoints_pca(px)
+
+    c0, c1, idx, err = _assign_color_indices(
+        px, _quantize_565(e0), _quantize_565(e1), punchthrough, transparent)
+
+    if quality == 'high':
+        four = (c0 > c1)
+        for _ in range(3):
+            r0, r1, ok = _refine_endpoints(px, idx)
+            n0, n1, nidx, nerr = _assign_color_indices(
+                px, _quantize_565(r0), _quantize_565(r1), punchthrough, transparent)
+            better = ok & four & (nerr < err)
+            if not better.any():
+                break
+            c0 = np.where(better, n0, c0)
+            c1 = np.where(better, n1, c1)
+            idx = np.where(better[:, None], nidx, idx)
+            err = np.where(better, nerr, err)
+
+    out = np.empty((len(blocks), 8), dtype=np.uint8)
+    words = out.view('<u2')
+    words[:, 0] = c0
+    words[:, 1] = c1
+    bits = (idx.astype(np.uint32) << _SHIFT_2BIT).sum(axis=1, dtype=np.uint32)
+    out.view('<u4')[:, 1] = bits
+    return out
+
+
+def _fit_alpha_blocks(alpha, quality: str = 'normal'): #vers 1
+    """Encode (n, 16) alpha values to (n, 8) uint8 DXT5 alpha blocks.
+
+    Palettes match the workshop decoder ('round'). The 'high' tier also
+    tries the 6-value mode (explicit 0 and 255) and keeps the better fit."""
+    alpha = alpha.astype(np.int32)
+
+    def _nearest(a0, a1):
+        pal = _alpha_palette(a0, a1, 'round')
+        dist = (alpha[:, :, None] - pal[:, None, :]) ** 2
+        idx = dist.argmin(axis=2)
+        err = np.take_along_axis(dist, idx[:, :, None], axis=2)[:, :, 0].sum(axis=1)
+        return idx, err
+
+    a0 = alpha.max(axis=1)
+    a1 = alpha.min(axis=1)
+    idx, err = _nearest(a0, a1)
+
+    if quality == 'high':
+        lo = np.where(alpha > 0, alpha, 256).min(axis=1)
+        hi = np.where(alpha < 255, alpha, -1).max(axis=1)
+        empty = lo > hi
+        lo = np.where(empty, 0, lo)
+        hi = np.where(empty, 0, hi)
+        idx6, err6 = _nearest(lo, hi)
+        better = err6 < err
+        a0 = np.where(better, lo, a0)
+        a1 = np.where(better, hi, a1)
+        idx = np.where(better[:, None], idx6, idx)
+
+    out = np.zeros((len(alpha), 8), dtype=np.uint8)
+    bits = (idx.astype(np.uint64) << _SHIFT_3BIT).sum(axis=1, dtype=np.uint64)
+    out.view('<u8')[:, 0] = bits << np.uint64(16)
+    out[:, 0] = a0
+    out[:, 1] = a1
+    return out
+
+
+def _fit_explicit_alpha(alpha): #vers 1
+    """Encode (n, 16) alpha values to (n, 8) uint8 DXT3 explicit 4-bit alpha.
+    Rounds to the nearest of the 16 levels the decoder expands with * 17."""
+    a4 = ((alpha.astype(np.int32) * 15 + 127) // 255).astype(np.uint8)
+    return (a4[:, 0::2] | (a4[:, 1::2] << 4)).astype(np.uint8)
+
+
+def _encode_blocks(rgba, width: int, height: int, fmt: str, quality: str,
+                   punchthrough: bool = False) -> bytes: #vers 2
+    """Run the block-batched fitters over a whole image in chunks."""
+    if quality not in QUALITY_TIERS:
+        raise ValueError(f"Unknown DXT quality tier: {quality}")
+    if width <= 0 or height <= 0:
+        return b''
+    blocks = _rgba_blocks(rgba, width, height)
+    parts = []
+    for start in range(0, len(blocks), _ENCODE_CHUNK):
+        chunk = blocks[start:start + _ENCODE_CHUNK]
+        if fmt == 'DXT1':
+            parts.append(_fit_color_blocks(chunk, quality, punchthrough))
+        elif fmt == 'DXT3':
+            alpha = _fit_explicit_alpha(chunk[:, :, 3])
+            color = _fit_color_blocks(chunk, quality)
+            parts.append(np.concatenate((alpha, color), axis=1))
+        else:
+            alpha = _fit_alpha_blocks(chunk[:, :, 3], quality)
+            color = _fit_color_blocks(chunk, quality)
+            parts.append(np.concatenate((alpha, color), axis=1))
+    return np.concatenate(parts).tobytes()
+
+
+def encode_dxt1(rgba, width: int, height: int, quality: str = 'normal',
+                punchthrough: bool = False) -> bytes: #vers 1
+    """Encode RGBA8888 bytes to DXT1. quality: 'fast' | 'normal' | 'high'.
+    punchthrough=True stores pixels with alpha < 128 as 1-bit transparent."""
+    return _encode_blocks(rgba, width, height, 'DXT1', quality, punchthrough)
+
+
+def encode_dxt3(rgba, width: int, height: int, quality: str = 'normal') -> bytes: #vers 1
+    """Encode RGBA8888 bytes to DXT3 (explicit 4-bit alpha + 4-colour DXT1 block)."""
+    return _encode_blocks(rgba, width, height, 'DXT3', quality)
+
+
+def encode_dxt5(rgba, width: int, height: int, quality: str = 'normal') -> bytes: #vers 1
+    """Encode RGBA8888 bytes to DXT5 (interpolated alpha + DXT1 colour block)."""
+    return _encode_blocks(rgba, width, height, 'DXT5', quality)
+
+
+def encode_dxt(rgba, width: int, height: int, fmt: str, quality: str = 'normal',
+               punchthrough: bool = False) -> Optional[bytes]: #vers 2
+    """Encode by format name. Returns None for formats this module does not handle."""
+    fmt = fmt.upper()
+    if 'DXT1' in fmt or fmt == 'BC1':
+        return encode_dxt1(rgba, width, height, quality, punchthrough)
+    if 'DXT3' in fmt or fmt == 'BC2':
+        return encode_dxt3(rgba, width, height, quality)
+    if 'DXT5' in fmt or fmt == 'BC3':
+        return encode_dxt5(rgba, width, height, quality)
+    return None
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/dxt_scheduler.py - Version: 1
+# X-Seti - October17 2026 - IMG Factory 1.6
+# DXT compression scheduler - process pool, per texture / mip level / band
+
+"""
+Parallel DXT compression for TXD Workshop.
+
+Work is split into jobs per texture and per mip level (one CompressJob
+each); large levels are further cut into bands of whole block rows, so a
+single 2048x2048 level keeps every core busy. DXT blocks are independent
+and stored row-major, so the encoded bands of a level simply concatenate.
+
+Bands run on a ProcessPoolExecutor sized to the machine. Results stream back
+as each job completes; compress() is a generator, and a progress callback
+returning False (or cancel()) drops all pending work.
+
+Small batches are encoded in-process - starting the pool would cost more
+than the work.
+"""
+
+import os
+import threading
+import multiprocessing
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from apps.methods.dxt_codec import encode_dxt
+
+## Methods list -
+# _encode_band
+# get_compress_scheduler
+#
+##class CompressJob: -
+# block_count
+#
+##class CompressScheduler: -
+# __init__
+# _bands
+# _get_pool
+# cancel
+# compress
+# compress_all
+# shutdown
+
+# Blocks per band - 8192 blocks = a 512x256 slice of a DXT level
+_BAND_BLOCKS = 8192
+
+# Below this many blocks in a batch, encode inline instead of using the pool
+_POOL_MIN_BLOCKS = 4096
+
+
+@dataclass
+class CompressJob: #vers 1
+    """One texture or mip level to encode. key is returned with the result."""
+    key: object
+    rgba: bytes
+    width: int
+    height: int
+    fmt: str
+    quality: str = 'normal'
+    punchthrough: bool = False
+
+    def block_count(self) -> int: #vers 1
+        return ((self.width + 3) // 4) * ((self.height + 3) // 4)
+
+
+def _encode_band(rgba: bytes, width: int, height: int, fmt: str,
+                 quality: str, punchthrough: bool) -> bytes: #vers 1
+    """Worker entry point - must stay module-level so it pickles."""
+    return encode_dxt(rgba, width, height, fmt, quality, punchthrough) or b''
+
+
+class CompressScheduler: #vers 1
+    """Schedules CompressJobs over a shared process pool"""
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 band_blocks: int = _BAND_BLOCKS): #vers 1
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.band_blocks = band_blocks
+        self._pool = None
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+
+    def _get_pool(self) -> ProcessPoolExecutor: #vers 1
+        """Start the pool on first use. 'spawn' keeps workers free of the
+        parent's Qt state."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'))
+            return self._pool
+
+
+    def _bands(self, job: CompressJob) -> List[Tuple[bytes, int]]: #vers 1
+        """Cut a job into (rgba_slice, height) bands of whole block rows."""
+        blocks_x = (job.width + 3) // 4
+        rows_per_band = max(1, self.band_blocks // max(1, blocks_x)) * 4
+        if rows_per_band >= job.height:
+            return [(bytes(job.rgba), job.height)]
+        stride = job.width * 4
+        data = memoryview(job.rgba)
+        bands = []
+        for y in range(0, job.height, rows_per_band):
+            h = min(rows_per_band, job.height - y)
+            bands.append((bytes(data[y * stride:(y + h) * stride]), h))
+        return bands
+
+
+    def cancel(self): #vers 1
+        """Drop all pending work of the running compress() call."""
+        self._cancelled.set()
+
+
+    def compress(self, jobs: Iterable[CompressJob],
+                 progress_callback: Optional[Callable[[int, int], bool]] = None,
+                 poll_interval: float = 0.05) -> Iterator[Tuple[object, bytes]]: #vers 1
+        """Yield (job.key, encoded_bytes) as each job completes.
+
+        progress_callback(done_bands, total_bands) is called on every poll;
+        returning False cancels. Completion order is not job order."""
+        jobs = [job for job in jobs if job.rgba and job.width > 0 and job.height > 0]
+        self._cancelled.clear()
+        if not jobs:
+            return
+
+        if sum(job.block_count() for job in jobs) < _POOL_MIN_BLOCKS:
+            for done, job in enumerate(jobs):
+                if progress_callback and progress_callback(done, len(jobs)) is False:
+                    self._cancelled.set()
+                if self._cancelled.is_set():
+                    return
+                yield job.key, _encode_band(job.rgba, job.width, job.height,
+                                            job.fmt, job.quality, job.punchthrough)
+            if progress_callback:
+                progress_callback(len(jobs), len(jobs))
+            return
+
+        pool = self._get_pool()
+        parts = {}
+        pending = {}
+        for job_index, job in enumerate(jobs):
+            bands = self._bands(job)
+            parts[job_index] = [None] * len(bands)
+            for band_index, (rgba, h) in enumerate(bands):
+                future = pool.submit(_encode_band, rgba, job.width, h, job.fmt,
+                                     job.quality, job.punchthrough)
+                pending[future] = (job_index, band_index)
+
+        total = len(pending)
+        done_count = 0
+        remaining = set(pending)
+        try:
+            while remaining:
+                if progress_callback and progress_callback(done_count, total) is False:
+                    self._cancelled.set()
+                if self._cancelled.is_set():
+                    return
+                done, remaining = wait(remaining, timeout=poll_interval,
+                                       return_when=FIRST_COMPLETED)
+                for future in done:
+                    job_index, band_index = pending.pop(future)
+                    job_parts = parts[job_index]
+                    job_parts[band_index] = future.result()
+                    done_count += 1
+                    if all(part is not None for part in job_parts):
+                        del parts[job_index]
+                        yield jobs[job_index].key, b''.join(job_parts)
+            if progress_callback:
+                progress_callback(total, total)
+        finally:
+            # Also runs when the consumer stops iterating early
+            for future in remaining:
+                future.cancel()
+
+
+    def compress_all(self, jobs: Iterable[CompressJob],
+                     progress_callback: Optional[Callable[[int, int], bool]] = None) -> Optional[dict]: #vers 1
+        """Run compress() to completion. Returns {key: bytes}, or None if cancelled."""
+        results = dict(self.compress(jobs, progress_callback))
+        if self._cancelled.is_set():
+            return None
+        return results
+
+
+    def shutdown(self): #vers 1
+        """Stop the pool, discarding queued work."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+_scheduler = None
+
+
+def get_compress_scheduler() -> CompressScheduler: #vers 1
+    """Process-wide scheduler, so the worker pool is started once."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = CompressScheduler()
+    return _scheduler
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/img_index.py - Version: 1
+# X-Seti - October17 2026 - IMG Factory 1.6
+# Sidecar IMG index - parsed directory + per-entry metadata per archive state
+
+"""
+Sidecar index of parsed IMG archives.
+
+A full IMGFile.open() detects the version and platform, parses the directory
+and reads the RW header of every DFF / TXD. The result is saved here, one
+small file per archive in the user cache directory, together with the size
+and mtime of every file it was read from (the .img, plus the .dir of a
+DIR/IMG pair). While those still match, open() reads the index back in one
+read and skips all of that work. A rebuild or an edit by another tool
+changes size / mtime, so the index is simply not used (and is rewritten by
+the next full open).
+
+Layout: MAGIC, format version, length of a JSON meta block, the meta block,
+then one zlib block holding the NUL-separated entry names followed by one
+RECORD per entry.
+"""
+
+import os
+import json
+import zlib
+import struct
+import hashlib
+from typing import List, Optional, Sequence, Tuple
+
+from apps.methods.thumbnail_cache import user_cache_dir
+
+## Methods list -
+# file_stamp
+# index_path
+# load_index
+# remove_index
+# save_index
+
+MAGIC = b'IMGI'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+
+# offset, size, rw_version, file type (index into meta['types']), flags,
+# content hash (0 = not computed)
+RECORD = struct.Struct('<QIIBBxxQ')
+
+# Record flags
+FLAG_RW_SCANNED = 0x01
+FLAG_RW_DETECTED = 0x02
+FLAG_LZO = 0x04
+
+# A record as passed in / handed back:
+# (name, offset, size, file_type, rw_version, flags, content_hash)
+IndexRecord = Tuple[str, int, int, str, int, int, int]
+
+
+def index_path(archive_path: str) -> str: #vers 1
+    """Index file of an archive, named by a hash of its absolute path."""
+    key = os.path.normcase(os.path.abspath(archive_path)).encode('utf-8', 'surrogateescape')
+    return os.path.join(user_cache_dir(), 'img_index', hashlib.sha1(key).hexdigest() + '.idx')
+
+
+def file_stamp(path: str) -> Optional[Tuple[int, int]]: #vers 1
+    """(size, mtime_ns) of path, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def save_index(archive_path: str, files: Sequence[str], meta: dict,
+               records: Sequence[IndexRecord]) -> bool: #vers 1
+    """Write the index of archive_path. files are every file the entries
+    were read from; their current size / mtime become the validity key."""
+    stamps = []
+    for path in files:
+        stamp = file_stamp(path)
+        if stamp is None:
+            return False
+        stamps.append([os.path.abspath(path), stamp[0], stamp[1]])
+
+    types = sorted({record[3] for record in records})
+    type_index = {file_type: i for i, file_type in enumerate(types)}
+    names = '\0'.join(record[0] for record in records).encode('utf-8', 'surrogateescape')
+    body = bytearray(names)
+    for name, offset, size, file_type, rw_version, flags, content_hash in records:
+        body += RECORD.pack(offset, size, rw_version, type_index[file_type], flags, content_hash)
+
+    meta = dict(meta, files=stamps, count=len(records), types=types, names_size=len(names))
+    meta_blob = json.dumps(meta).encode('utf-8')
+
+    path = index_path(archive_path)
+    tmp_path = path + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(meta_blob)))
+            f.write(meta_blob)
+            f.write(zlib.compress(bytes(body), 1))
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        return False
+
+
+def load_index(archive_path: str) -> Optional[Tuple[dict, List[IndexRecord]]]: #vers 1
+    """(meta, records) if an index exists and every file it was built from
+    still has the recorded size and mtime; otherwise None."""
+    try:
+        with open(index_path(archive_path), 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return None
+    try:
+        magic, version, meta_size = _HEADER.unpack_from(blob, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            return None
+        start = _HEADER.size
+        meta = json.loads(blob[start:start + meta_size].decode('utf-8'))
+        for path, size, mtime_ns in meta['files']:
+            if file_stamp(path) != (size, mtime_ns):
+                return None
+
+        body = zlib.decompress(blob[start + meta_size:])
+        count, names_size, types = meta['count'], meta['names_size'], meta['types']
+        if len(body) != names_size + count * RECORD.size:
+            return None
+        names = body[:names_size].decode('utf-8', 'surrogateescape').split('\0') if count else []
+        records = [(name, offset, size, types[type_no], rw_version, flags, content_hash)
+                   for name, (offset, size, rw_version, type_no, flags, content_hash)
+                   in zip(names, RECORD.iter_unpack(memoryview(body)[names_size:]))]
+        return meta, records
+    except (ValueError, KeyError, IndexError, TypeError, struct.error, zlib.error):
+        return None
+
+
+def remove_index(archive_path: str): #vers 1
+    """Delete the index of archive_path, if any."""
+    try:
+        os.remove(index_path(archive_path))
+    except OSError:
+        pass
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/lazy_texture.py - Version: 3
+# X-Seti - October17 2026 - IMG Factory 1.6
+# Lazy texture dicts - RGBA decoded on first access to rgba_data
+
+"""
+Texture and mipmap level dicts that decode on demand.
+
+parse_texture_native (apps/methods/txd_native.py) records each level's
+raster as a decode spec (a zero-copy memoryview slice of the TXD plus
+format parameters, see apps/methods/texture_decode.py) instead of decoding
+it. The level becomes a LazyLevel: reading level['rgba_data'] (or .get)
+decodes that level once. The texture becomes a LazyTexture: reading
+tex['rgba_data'] or tex['alpha_mask'] decodes level 0 and fills both
+fields.
+
+Everything else about the dicts is unchanged, so code that reads
+texture['rgba_data'] keeps working and simply pays for the decode the first
+time. Assigning rgba_data replaces the pending decode. copy() keeps the
+pending state; pickling / deepcopy decode first and produce plain dicts.
+
+A level's compressed_data may likewise be held as a memoryview into the TXD;
+it becomes bytes (one copy) when first read through the dict.
+
+decode_pending() decodes the outstanding levels of many textures in one
+decode_many() batch - the eager load path.
+"""
+
+from typing import Iterable, Optional
+
+from apps.methods.texture_decode import decode_many, get_decoder
+
+## Methods list -
+# _spec_args
+# decode_pending
+#
+##class LazyLevel: -
+# __getitem__
+# __init__
+# __reduce_ex__
+# __setitem__
+# _materialize
+# copy
+# decode
+# get
+# is_decoded
+# items
+# values
+#
+##class LazyTexture: -
+# __getitem__
+# __init__
+# __reduce_ex__
+# __setitem__
+# copy
+# decode
+# get
+# is_decoded
+
+_DERIVED_KEYS = ('rgba_data', 'alpha_mask')
+
+# Level keys that may hold a memoryview slice of the TXD until read
+_VIEW_KEYS = ('compressed_data',)
+
+
+def _spec_args(spec: dict) -> dict: #vers 1
+    """Spec ready for decode_many(); unrecognised raster types decode as grey,
+    as _decompress_uncompressed always did."""
+    if get_decoder(spec.get('format')) is None:
+        spec = dict(spec, format='UNKNOWN')
+    return spec
+
+
+class LazyLevel(dict): #vers 1
+    """Mipmap level dict whose rgba_data is decoded from spec on first read"""
+
+    def __init__(self, level: dict, spec: Optional[dict] = None): #vers 1
+        super().__init__(level)
+        self.spec = spec
+
+
+    def is_decoded(self) -> bool: #vers 1
+        return self.spec is None
+
+
+    def decode(self) -> Optional[bytes]: #vers 1
+        """Decode now if still pending; returns rgba_data."""
+        if self.spec is not None:
+            rgba = decode_many([_spec_args(self.spec)])[0]
+            self.spec = None
+            dict.__setitem__(self, 'rgba_data', rgba)
+        return dict.get(self, 'rgba_data')
+
+
+    def _materialize(self, keys=_VIEW_KEYS): #vers 1
+        """Replace memoryview values of keys with bytes."""
+        for key in keys:
+            value = dict.get(self, key)
+            if isinstance(value, memoryview):
+                dict.__setitem__(self, key, bytes(value))
+
+
+    def __getitem__(self, key): #vers 2
+        if key == 'rgba_data' and self.spec is not None:
+            self.decode()
+        elif key in _VIEW_KEYS:
+            self._materialize((key,))
+        return dict.__getitem__(self, key)
+
+
+    def get(self, key, default=None): #vers 2
+        if key == 'rgba_data' and self.spec is not None:
+            self.decode()
+        elif key in _VIEW_KEYS:
+            self._materialize((key,))
+        return dict.get(self, key, default)
+
+
+    def items(self): #vers 1
+        self._materialize()
+        return dict.items(self)
+
+
+    def values(self): #vers 1
+        self._materialize()
+        return dict.values(self)
+
+
+    def __setitem__(self, key, value): #vers 1
+        if key == 'rgba_data':
+            self.spec = None
+        dict.__setitem__(self, key, value)
+
+
+    def copy(self): #vers 1
+        return LazyLevel(self, self.spec)
+
+
+    def __reduce_ex__(self, protocol): #vers 2
+        self.decode()
+        self._materialize()
+        return (dict, (dict(self),))
+
+
+class LazyTexture(dict): #vers 1
+    """Texture dict whose rgba_data / alpha_mask come from level 0 on first read"""
+
+    def __init__(self, tex: dict, base_level: Optional[LazyLevel] = None): #vers 1
+        super().__init__(tex)
+        self.base_level = base_level
+
+
+    def is_decoded(self) -> bool: #vers 1
+        return self.base_level is None
+
+
+    def decode(self) -> Optional[bytes]: #vers 1
+        """Decode level 0 if still pending and fill rgba_data / alpha_mask."""
+        level = self.base_level
+        if level is not None:
+            self.base_level = None
+            rgba = level.get('rgba_data')
+            if rgba is None:
+                rgba = b'\x00' * (level.get('width', 0) * level.get('height', 0) * 4)
+            dict.__setitem__(self, 'rgba_data', rgba)
+            # Separate grayscale alpha mask for display switching
+            width, height = dict.get(self, 'width', 0), dict.get(self, 'height', 0)
+            if dict.get(self, 'has_alpha') and len(rgba) == width * height * 4:
+                dict.__setitem__(self, 'alpha_mask', rgba[3::4])
+        return dict.get(self, 'rgba_data')
+
+
+    def __getitem__(self, key): #vers 1
+        if key in _DERIVED_KEYS and self.base_level is not None:
+            self.decode()
+        return dict.__getitem__(self, key)
+
+
+    def get(self, key, default=None): #vers 1
+        if key in _DERIVED_KEYS and self.base_level is not None:
+            self.decode()
+        return dict.get(self, key, default)
+
+
+    def __setitem__(self, key, value): #vers 1
+        if key in _DERIVED_KEYS:
+            self.base_level = None
+        dict.__setitem__(self, key, value)
+
+
+    def copy(self): #vers 1
+        return LazyTexture(self, self.base_level)
+
+
+    def __reduce_ex__(self, protocol): #vers 1
+        self.decode()
+        return (dict, (dict(self),))
+
+
+def decode_pending(textures: Iterable[dict]): #vers 1
+    """Decode every pending level of textures in one decode_many() batch,
+    then fill rgba_data / alpha_mask of each LazyTexture."""
+    textures = list(textures)
+    pending = [level for tex in textures for level in tex.get('mipmap_levels', [])
+               if isinstance(level, LazyLevel) and level.spec is not None]
+    results = decode_many(_spec_args(level.spec) for level in pending)
+    for level, rgba in zip(pending, results):
+        level['rgba_data'] = rgba
+    for tex in textures:
+        if isinstance(tex, LazyTexture):
+            tex.decode()
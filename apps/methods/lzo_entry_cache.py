@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/lzo_entry_cache.py - Version: 2
+# X-Seti - October17 2026 - IMG Factory 1.6
+# Decompressed Xbox LZO entry cache - process-wide LRU, optional disk spill
+
+"""
+Process-wide cache of decompressed Xbox IMG entries.
+
+Every entry of an Xbox archive is LZO compressed, and each read_entry_data
+call (table refresh, preview, export, TXD open) ran the decompressor again.
+Decompressed payloads are kept here keyed by archive path, the archive's
+size and mtime, and the entry's offset and size - at most budget_bytes of
+them; the least recently used are dropped first. IMGFile calls
+drop_archive() before it rewrites an archive; an archive changed by
+another program simply stops matching its old keys.
+
+With spill on, payloads dropped from memory are written to the user cache
+directory instead (at most spill_max_bytes, oldest removed first) and read
+back from there on a later miss. Spill files are named by the key plus the
+archive's size and mtime too.
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from apps.methods.img_index import file_stamp
+from apps.methods.thumbnail_cache import user_cache_dir
+
+## Methods list -
+# get_lzo_entry_cache
+#
+##class LZOEntryCache: -
+# __init__
+# __len__
+# _evict
+# _key
+# _read_spill
+# _spill_index
+# _spill_name
+# _write_spill
+# clear
+# drop_archive
+# get
+# put
+# set_budget
+# stats
+
+# Default memory budget - a few dozen decompressed Xbox TXDs
+DEFAULT_BUDGET_MB = 128
+
+# Default cap on spilled payloads
+DEFAULT_SPILL_MB = 512
+
+_SPILL_DIR = 'lzo_entries'
+
+# (normalized archive path, archive size, archive mtime_ns, offset, size)
+EntryKey = Tuple[str, int, int, int, int]
+
+
+class LZOEntryCache: #vers 1
+    """Thread-safe LRU of decompressed entry payloads bounded by total size"""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_MB * 1024 * 1024,
+                 spill: bool = False, spill_max_bytes: int = DEFAULT_SPILL_MB * 1024 * 1024,
+                 spill_dir: Optional[str] = None): #vers 1
+        self.budget_bytes = budget_bytes
+        self.size_bytes = 0
+        self.spill = spill
+        self.spill_max_bytes = spill_max_bytes
+        self.spill_dir = spill_dir or os.path.join(user_cache_dir(), _SPILL_DIR)
+        self.spill_bytes = 0
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._spilled = None    # spill file name -> size, oldest first
+        self._lock = threading.Lock()
+
+
+    def __len__(self): #vers 1
+        return len(self._entries)
+
+
+    @staticmethod
+    def _key(archive: str, offset: int, size: int) -> Optional[EntryKey]: #vers 2
+        """Key of an entry - None if the archive can't be stat'ed."""
+        path = os.path.normcase(os.path.abspath(archive))
+        stamp = file_stamp(path)
+        if stamp is None:
+            return None
+        return path, stamp[0], stamp[1], int(offset), int(size)
+
+
+    def _evict(self): #vers 1
+        """Drop (or spill) least recently used entries until within budget.
+        Lock held."""
+        while self._entries and self.size_bytes > self.budget_bytes:
+            key, data = self._entries.popitem(last=False)
+            self.size_bytes -= len(data)
+            self.evictions += 1
+            if self.spill:
+                self._write_spill(key, data)
+
+
+    def _spill_index(self) -> OrderedDict: #vers 1
+        """Spill files on disk, read from the directory on first use so
+        earlier sessions' files count towards the cap. Lock held."""
+        if self._spilled is None:
+            self._spilled = OrderedDict()
+            self.spill_bytes = 0
+            try:
+                found = []
+                for item in os.scandir(self.spill_dir):
+                    if item.name.endswith('.bin'):
+                        st = item.stat()
+                        found.append((st.st_mtime_ns, item.name, st.st_size))
+            except OSError:
+                found = []
+            for _, name, size in sorted(found):
+                self._spilled[name] = size
+                self.spill_bytes += size
+        return self._spilled
+
+
+    @staticmethod
+    def _spill_name(key: EntryKey) -> str: #vers 2
+        """File name of a spilled payload."""
+        ident = '|'.join(str(part) for part in key)
+        return hashlib.sha1(ident.encode('utf-8', 'surrogateescape')).hexdigest() + '.bin'
+
+
+    def _write_spill(self, key: EntryKey, data: bytes): #vers 2
+        """Write an evicted payload to disk, trimming the oldest files to
+        stay under spill_max_bytes. Lock held."""
+        if len(data) > self.spill_max_bytes:
+            return
+        name = self._spill_name(key)
+        spilled = self._spill_index()
+        if name in spilled:
+            return
+        path = os.path.join(self.spill_dir, name)
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(path + '.tmp', path)
+        except OSError:
+            return
+        spilled[name] = len(data)
+        self.spill_bytes += len(data)
+        while self.spill_bytes > self.spill_max_bytes:
+            old, size = spilled.popitem(last=False)
+            self.spill_bytes -= size
+            try:
+                os.remove(os.path.join(self.spill_dir, old))
+            except OSError:
+                pass
+
+
+    def _read_spill(self, key: EntryKey) -> Optional[bytes]: #vers 2
+        """A spilled payload, or None. Lock held."""
+        spilled = self._spill_index()
+        name = self._spill_name(key)
+        if name not in spilled:
+            return None
+        try:
+            with open(os.path.join(self.spill_dir, name), 'rb') as f:
+                data = f.read()
+        except OSError:
+            data = None
+        if data is None or len(data) != spilled[name]:
+            self.spill_bytes -= spilled.pop(name)
+            return None
+        spilled.move_to_end(name)
+        return data
+
+
+    def get(self, archive: str, offset: int, size: int) -> Optional[bytes]: #vers 2
+        """Decompressed payload of the entry stored at offset / size in
+        archive, or None. Counts a hit (memory or spill) or a miss."""
+        key = self._key(archive, offset, size)
+        with self._lock:
+            if key is None:
+                self.misses += 1
+                return None
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            if self.spill:
+                data = self._read_spill(key)
+                if data is not None:
+                    self.spill_hits += 1
+                    self._entries[key] = data
+                    self.size_bytes += len(data)
+                    self._evict()
+                    return data
+            self.misses += 1
+            return None
+
+
+    def put(self, archive: str, offset: int, size: int, data: bytes): #vers 2
+        """Store a decompressed payload. Payloads larger than the budget
+        are not kept."""
+        if not data or len(data) > self.budget_bytes:
+            return
+        key = self._key(archive, offset, size)
+        if key is None:
+            return
+        data = bytes(data)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size_bytes -= len(old)
+            self._entries[key] = data
+            self.size_bytes += len(data)
+            self._evict()
+
+
+    def drop_archive(self, archive: str): #vers 2
+        """Forget every in-memory payload of archive (about to be rewritten,
+        or closed). Nothing is spilled - the bytes on disk may be changing."""
+        path = os.path.normcase(os.path.abspath(archive))
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self.size_bytes -= len(self._entries.pop(key))
+
+
+    def clear(self, spill: bool = False): #vers 1
+        """Drop every in-memory entry, and with spill=True every spill file
+        too; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            if spill:
+                for name in self._spill_index():
+                    try:
+                        os.remove(os.path.join(self.spill_dir, name))
+                    except OSError:
+                        pass
+                self._spilled.clear()
+                self.spill_bytes = 0
+
+
+    def set_budget(self, budget_bytes: int): #vers 1
+        """Change the memory budget, evicting at once if it shrank."""
+        with self._lock:
+            self.budget_bytes = max(0, int(budget_bytes))
+            self._evict()
+
+
+    def stats(self) -> dict: #vers 1
+        """Counters and occupancy for display."""
+        with self._lock:
+            lookups = self.hits + self.spill_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self.size_bytes,
+                'budget_bytes': self.budget_bytes,
+                'spill_bytes': self.spill_bytes,
+                'hits': self.hits,
+                'spill_hits': self.spill_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits + self.spill_hits) / lookups if lookups else 0.0,
+            }
+
+
+_cache = None
+
+
+def get_lzo_entry_cache() -> LZOEntryCache: #vers 1
+    """Process-wide cache shared by every open archive."""
+    global _cache
+    if _cache is None:
+        _cache = LZOEntryCache()
+    return _cache
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/ring_log.py - Version: 1
+# X-Seti - October17 2026 - IMG Factory 1.6
+# Ring buffer log and repaint frame limiter for load diagnostics
+
+"""
+Cheap diagnostics for long loads.
+
+RingLog keeps the last N log lines in memory. Appending is a deque append -
+no widget, no repaint - so a loader can log every section it reads and the
+lines are only rendered when someone opens the log.
+
+FrameLimiter answers "is it time to repaint yet?" so a loader that does
+show progress refreshes the UI at a fixed rate (default 30 fps) instead of
+once per log line.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import List
+
+## Methods list -
+#
+##class FrameLimiter: -
+# __init__
+# due
+#
+##class RingLog: -
+# __init__
+# __len__
+# append
+# clear
+# lines
+# text
+
+# Lines kept by default - about 40 structural-log TXD loads
+DEFAULT_CAPACITY = 20000
+
+# Default repaint rate for progress UIs
+DEFAULT_FPS = 30
+
+
+class RingLog: #vers 1
+    """Thread-safe ring buffer of text lines; the oldest lines drop off"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY): #vers 1
+        self._lines = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+
+    def __len__(self): #vers 1
+        return len(self._lines)
+
+
+    def append(self, line: str): #vers 1
+        with self._lock:
+            if len(self._lines) == self._lines.maxlen:
+                self.dropped += 1
+            self._lines.append(line)
+
+
+    def clear(self): #vers 1
+        with self._lock:
+            self._lines.clear()
+            self.dropped = 0
+
+
+    def lines(self) -> List[str]: #vers 1
+        """Snapshot of the buffered lines, oldest first."""
+        with self._lock:
+            return list(self._lines)
+
+
+    def text(self) -> str: #vers 1
+        """Buffered lines joined for display, noting any that dropped off."""
+        lines = self.lines()
+        if self.dropped:
+            lines.insert(0, f"... {self.dropped} older lines discarded ...")
+        return "\n".join(lines)
+
+
+class FrameLimiter: #vers 1
+    """Rate limiter for repaints: due() is True at most fps times a second"""
+
+    def __init__(self, fps: float = DEFAULT_FPS): #vers 1
+        self.interval = 1.0 / fps
+        self._last = 0.0
+
+
+    def due(self) -> bool: #vers 1
+        """True (and restart the interval) if a frame interval has passed."""
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            self._last = now
+            return True
+        return False
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/rw_chunks.py - Version: 1
+# X-Seti - October17 2026 - IMG Factory 1.6
+# RenderWare chunk walker - zero-copy headers and payload views
+
+"""
+Zero-copy walking of RenderWare binary streams (TXD, DFF, ...).
+
+Every RW stream is a tree of chunks: a 12-byte header (type, payload size,
+library version) followed by the payload, which for container types is a
+sequence of child chunks. Headers are read with struct.unpack_from straight
+out of the buffer - bytes, bytearray, memoryview or mmap - so walking never
+slices the data. payload() hands out memoryview slices; call bytes() on one
+only where a copy has to be kept.
+
+    for chunk in iter_chunks(data, start, end):        # siblings
+        ...
+    walker = ChunkWalker(data)                        # whole tree
+    for depth, chunk in walker:
+        if chunk.type == RW_GEOMETRY_LIST:
+            walker.skip()                             # don't descend
+"""
+
+import struct
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+## Methods list -
+# as_view
+# find_chunk
+# iter_chunks
+# payload
+# read_chunk_header
+# read_cstring
+#
+##class ChunkWalker: -
+# __init__
+# __iter__
+# skip
+#
+##class RWChunk: -
+# data_offset
+# end
+
+HEADER = struct.Struct('<III')
+HEADER_SIZE = HEADER.size
+
+# Chunk types
+RW_STRUCT = 0x01
+RW_STRING = 0x02
+RW_EXTENSION = 0x03
+RW_TEXTURE = 0x06
+RW_MATERIAL = 0x07
+RW_MATERIAL_LIST = 0x08
+RW_FRAME_LIST = 0x0E
+RW_GEOMETRY = 0x0F
+RW_CLUMP = 0x10
+RW_ATOMIC = 0x14
+RW_TEXTURE_NATIVE = 0x15
+RW_TEXTURE_DICTIONARY = 0x16
+RW_GEOMETRY_LIST = 0x1A
+
+# Types whose payload is a list of child chunks (Struct / String are data)
+CONTAINER_TYPES = frozenset({
+    RW_EXTENSION, RW_TEXTURE, RW_MATERIAL, RW_MATERIAL_LIST, RW_FRAME_LIST,
+    RW_GEOMETRY, RW_CLUMP, RW_ATOMIC, RW_TEXTURE_NATIVE, RW_TEXTURE_DICTIONARY,
+    RW_GEOMETRY_LIST,
+})
+
+
+class RWChunk(NamedTuple): #vers 1
+    """One chunk header. offset is the header position in the buffer."""
+    type: int
+    size: int
+    version: int
+    offset: int
+
+    @property
+    def data_offset(self) -> int: #vers 1
+        return self.offset + HEADER_SIZE
+
+    @property
+    def end(self) -> int: #vers 1
+        return self.offset + HEADER_SIZE + self.size
+
+
+def as_view(data) -> memoryview: #vers 1
+    """memoryview over bytes / bytearray / mmap (or an existing view)."""
+    return data if isinstance(data, memoryview) else memoryview(data)
+
+
+def read_chunk_header(data, pos: int, end: Optional[int] = None) -> Optional[RWChunk]: #vers 1
+    """Chunk header at pos, or None if fewer than 12 bytes remain before end."""
+    if end is None:
+        end = len(data)
+    if pos < 0 or pos + HEADER_SIZE > end:
+        return None
+    chunk_type, size, version = HEADER.unpack_from(data, pos)
+    return RWChunk(chunk_type, size, version, pos)
+
+
+def iter_chunks(data, start: int = 0, end: Optional[int] = None) -> Iterator[RWChunk]: #vers 1
+    """Sibling chunks in data[start:end]. Stops at a truncated header or at
+    a chunk reaching past end (which is still yielded, callers clamp)."""
+    if end is None:
+        end = len(data)
+    pos = start
+    while pos + HEADER_SIZE <= end:
+        chunk = HEADER.unpack_from(data, pos)
+        yield RWChunk(chunk[0], chunk[1], chunk[2], pos)
+        pos += HEADER_SIZE + chunk[1]
+
+
+def find_chunk(data, chunk_type: int, start: int = 0,
+               end: Optional[int] = None) -> Optional[RWChunk]: #vers 1
+    """First sibling of chunk_type in data[start:end], or None."""
+    for chunk in iter_chunks(data, start, end):
+        if chunk.type == chunk_type:
+            return chunk
+    return None
+
+
+def payload(data, chunk: RWChunk) -> memoryview: #vers 1
+    """Zero-copy view of a chunk's payload, clamped to the buffer."""
+    return as_view(data)[chunk.data_offset:min(chunk.end, len(data))]
+
+
+def read_cstring(data, pos: int, size: int, encoding: str = 'ascii') -> str: #vers 1
+    """NUL-terminated string in data[pos:pos+size] (copies only those bytes)."""
+    raw = bytes(data[pos:pos + size])
+    nul = raw.find(b'\x00')
+    return (raw[:nul] if nul >= 0 else raw).decode(encoding, errors='replace')
+
+
+class ChunkWalker: #vers 1
+    """Depth-first walk of a chunk tree; iterating yields (depth, chunk).
+    Call skip() to not descend into the chunk just yielded. Children are
+    only walked for CONTAINER_TYPES (pass containers= to change that)."""
+
+    def __init__(self, data, start: int = 0, end: Optional[int] = None,
+                 containers=CONTAINER_TYPES): #vers 1
+        self.data = data
+        self.start = start
+        self.end = len(data) if end is None else end
+        self.containers = containers
+        self._skip = False
+
+
+    def skip(self): #vers 1
+        """Skip the subtree of the most recently yielded chunk."""
+        self._skip = True
+
+
+    def __iter__(self) -> Iterator[Tuple[int, RWChunk]]: #vers 1
+        data = self.data
+        stack = [(self.start, self.end)]
+        while stack:
+            pos, end = stack[-1]
+            if pos + HEADER_SIZE > end:
+                stack.pop()
+                continue
+            chunk_type, size, version = HEADER.unpack_from(data, pos)
+            chunk = RWChunk(chunk_type, size, version, pos)
+            stack[-1] = (chunk.end, end)
+            self._skip = False
+            yield len(stack) - 1, chunk
+            if not self._skip and chunk_type in self.containers and size >= HEADER_SIZE:
+                stack.append((chunk.data_offset, min(chunk.end, end)))
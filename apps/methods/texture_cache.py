@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/texture_cache.py - Version: 1
+# X-Seti - October17 2026 - IMG Factory 1.6
+# Decoded texture cache - process-wide LRU of RGBA buffers, content-hash keys
+
+"""
+Process-wide cache of decoded RGBA8888 buffers.
+
+Re-opening a TXD, switching tabs or restoring an undo state decodes the same
+rasters again. Entries are keyed by a BLAKE2b digest of the raster bytes,
+the palette and every decode parameter (format, size, depth, opacity...),
+so identical data hits no matter which file or entry it came from.
+
+The cache holds at most budget_bytes of RGBA; the least recently used
+buffers are dropped first. Cached values are immutable bytes and are shared,
+never copied. hits / misses / evictions are counted for the stats readout.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+## Methods list -
+# get_decoded_cache
+# make_cache_key
+#
+##class DecodedTextureCache: -
+# __init__
+# __len__
+# _evict
+# clear
+# get
+# put
+# set_budget
+# stats
+
+# Default memory budget - 256 MB of RGBA, about sixteen 2048x2048 textures
+DEFAULT_BUDGET_MB = 256
+
+
+def make_cache_key(data, fmt: str, width: int, height: int, palette=None, **params) -> bytes: #vers 1
+    """16-byte digest of everything that determines the decoded output."""
+    h = hashlib.blake2b(digest_size=16)
+    header = f"{fmt}|{width}|{height}|" + "|".join(
+        f"{k}={params[k]!r}" for k in sorted(params))
+    h.update(header.encode('utf-8'))
+    h.update(len(data).to_bytes(8, 'little'))
+    h.update(data)
+    if palette:
+        h.update(palette)
+    return h.digest()
+
+
+class DecodedTextureCache: #vers 1
+    """Thread-safe LRU of decoded RGBA buffers bounded by total size"""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_MB * 1024 * 1024): #vers 1
+        self.budget_bytes = budget_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def __len__(self): #vers 1
+        return len(self._entries)
+
+
+    def _evict(self): #vers 1
+        """Drop least recently used entries until within budget. Lock held."""
+        while self._entries and self.size_bytes > self.budget_bytes:
+            _, rgba = self._entries.popitem(last=False)
+            self.size_bytes -= len(rgba)
+            self.evictions += 1
+
+
+    def get(self, key: bytes) -> Optional[bytes]: #vers 1
+        """Cached RGBA for key, or None. Counts a hit or a miss."""
+        with self._lock:
+            rgba = self._entries.get(key)
+            if rgba is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rgba
+
+
+    def put(self, key: bytes, rgba: bytes): #vers 1
+        """Store a decoded buffer. Buffers larger than the budget are not kept."""
+        if not rgba or len(rgba) > self.budget_bytes:
+            return
+        rgba = bytes(rgba)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size_bytes -= len(old)
+            self._entries[key] = rgba
+            self.size_bytes += len(rgba)
+            self._evict()
+
+
+    def clear(self): #vers 1
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+
+    def set_budget(self, budget_bytes: int): #vers 1
+        """Change the memory budget, evicting at once if it shrank."""
+        with self._lock:
+            self.budget_bytes = max(0, int(budget_bytes))
+            self._evict()
+
+
+    def stats(self) -> dict: #vers 1
+        """Counters and occupancy for display."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self.size_bytes,
+                'budget_bytes': self.budget_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+_cache = None
+
+
+def get_decoded_cache() -> DecodedTextureCache: #vers 1
+    """Process-wide cache shared by every TXD Workshop window."""
+    global _cache
+    if _cache is None:
+        _cache = DecodedTextureCache()
+    return _cache
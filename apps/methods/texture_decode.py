@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/texture_decode.py - Version: 3
+# X-Seti - October17 2026 - IMG Factory 1.6
+# Texture decoder registry - format name -> RGBA8888 decoder, batch decode
+
+"""
+One place to turn any texture raster TXD Workshop reads into RGBA8888.
+
+Decoders are registered by format name ('DXT1', 'PAL8', 'RGB565', 'BC7'...)
+with short aliases ('565', '1555', '4444', '888', '8888', 'BC1'..'BC3',
+'ATI1', 'ATI2'). Format strings are matched the way the old per-format
+if/elif chain did, so 'ARGB32' or 'UNKNOWN_00000000' still resolve.
+
+Backends:
+  PIL DDS    DXT1/3/5 and BC7 when Pillow is installed. The C decoder drops
+             the GIL, so decode_many() runs these on a thread pool.
+  NumPy      every uncompressed and palettised format, BC4/BC5, and the
+             DXT fallback - whole-texture vectorised kernels, run inline.
+  Python     ETC1, PVRTC (existing mobile decoders).
+
+All kernels are byte-identical to the per-pixel loops they replaced:
+pixels past the end of short data stay zero, PAL4 reads the high nibble
+first, ARGB8888 is stored BGRA.
+
+Decoded buffers go through the process-wide content-hash cache
+(apps/methods/texture_cache.py), so re-opening a TXD is a lookup.
+
+Texture specs for decode_many() are dicts:
+  {'data': bytes, 'width': int, 'height': int, 'format': str, ...}
+Any other keys (palette, palette_is_bgra, force_opaque, depth,
+palette_entry_fmt) are passed to the decoder.
+"""
+
+import io
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from apps.methods.dxt_codec import (decode_bc4, decode_bc5, decode_dxt1,
+                                    decode_dxt3, decode_dxt5)
+from apps.methods.texture_cache import get_decoded_cache, make_cache_key
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+## Methods list -
+# _canonical_format
+# _dds_header
+# _decode_a8l8
+# _decode_argb1555
+# _decode_argb4444
+# _decode_argb8888
+# _decode_bc7
+# _decode_dxt1
+# _decode_dxt3
+# _decode_dxt5
+# _decode_etc1
+# _decode_lum8
+# _decode_pal4
+# _decode_pal8
+# _decode_pvrtc
+# _decode_rgb555
+# _decode_rgb565
+# _decode_rgb888
+# _decode_spec
+# _decode_unknown
+# _get_pool
+# _palette_rgba
+# _pil_dds_decode
+# _rgba_out
+# _words
+# decode_many
+# decode_texture
+# get_decoder
+# register_decoder
+# registered_formats
+
+# name -> (decoder(data, width, height, **params), releases_gil)
+_DECODERS: Dict[str, Tuple[Callable, bool]] = {}
+_ALIASES: Dict[str, str] = {}
+
+# Substring fallbacks, in the order the old if/elif chain tested them
+_SUBSTRING_RULES = (
+    ('DXT1', 'DXT1'), ('DXT3', 'DXT3'), ('DXT5', 'DXT5'),
+    ('ARGB8888', 'ARGB8888'), ('ARGB32', 'ARGB8888'), ('RGB888', 'RGB888'),
+    ('RGB565', 'RGB565'), ('ARGB1555', 'ARGB1555'), ('ARGB4444', 'ARGB4444'),
+    ('RGB555', 'RGB555'), ('A8L8', 'A8L8'), ('LUM8', 'LUM8'), ('L8', 'LUM8'),
+)
+
+# DXGI_FORMAT_BC7_UNORM, for the DDS DX10 extension header
+_DXGI_BC7_UNORM = 98
+
+# Batches with fewer GIL-releasing textures than this decode inline
+_POOL_MIN_TEXTURES = 2
+
+
+def register_decoder(name: str, decoder: Callable, releases_gil: bool = False,
+                     aliases: Iterable[str] = ()): #vers 1
+    """Register decoder(data, width, height, **params) -> RGBA bytes.
+    releases_gil marks backends worth running on the decode thread pool."""
+    name = name.upper()
+    _DECODERS[name] = (decoder, releases_gil)
+    for alias in aliases:
+        _ALIASES[alias.upper()] = name
+
+
+def registered_formats() -> List[str]: #vers 1
+    """Names of all registered formats."""
+    return sorted(_DECODERS)
+
+
+def _canonical_format(fmt) -> Optional[str]: #vers 1
+    """Resolve a format string to a registered name, or None."""
+    if not fmt:
+        return None
+    key = str(fmt).upper()
+    if key in _DECODERS:
+        return key
+    if key in _ALIASES:
+        return _ALIASES[key]
+    if key.startswith('UNKNOWN'):
+        return 'UNKNOWN'
+    for needle, name in _SUBSTRING_RULES:
+        if needle in key:
+            return name
+    return None
+
+
+def get_decoder(fmt) -> Optional[Callable]: #vers 1
+    """Decoder registered for fmt, or None if the format is not supported."""
+    name = _canonical_format(fmt)
+    return _DECODERS[name][0] if name else None
+
+
+def decode_texture(data, width: int, height: int, fmt: str, **params) -> Optional[bytes]: #vers 2
+    """Decode one raster to RGBA8888 bytes. None for unsupported formats,
+    empty sizes or decoder errors. Results are cached by content."""
+    name = _canonical_format(fmt)
+    if name is None or width <= 0 or height <= 0:
+        return None
+    if data is None:
+        data = b''
+    cache = get_decoded_cache()
+    key = make_cache_key(data, name, width, height, **params)
+    rgba = cache.get(key)
+    if rgba is not None:
+        return rgba
+    try:
+        rgba = _DECODERS[name][0](data, width, height, **params)
+    except Exception:
+        return None
+    if rgba:
+        cache.put(key, rgba)
+    return rgba
+
+
+def _decode_spec(spec: dict) -> Optional[bytes]: #vers 1
+    """decode_texture() for one decode_many() spec dict."""
+    params = {k: v for k, v in spec.items()
+              if k not in ('data', 'width', 'height', 'format')}
+    return decode_texture(spec.get('data'), spec.get('width', 0),
+                          spec.get('height', 0), spec.get('format', ''), **params)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor: #vers 1
+    """Shared decode thread pool, one worker per core."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                       thread_name_prefix='texture-decode')
+        return _pool
+
+
+def decode_many(textures: Iterable[dict]) -> List[Optional[bytes]]: #vers 1
+    """Decode a batch of texture specs; results are in input order.
+
+    Specs whose backend releases the GIL are fanned out to the thread pool
+    first, the NumPy / Python ones then decode on the calling thread while
+    the pool works."""
+    specs = list(textures)
+    results: List[Optional[bytes]] = [None] * len(specs)
+
+    threaded = []
+    inline = []
+    for index, spec in enumerate(specs):
+        name = _canonical_format(spec.get('format'))
+        if name and _DECODERS[name][1]:
+            threaded.append(index)
+        else:
+            inline.append(index)
+
+    futures = {}
+    if len(threaded) >= _POOL_MIN_TEXTURES:
+        pool = _get_pool()
+        futures = {index: pool.submit(_decode_spec, specs[index]) for index in threaded}
+    else:
+        inline = threaded + inline
+
+    for index in inline:
+        results[index] = _decode_spec(specs[index])
+    for index, future in futures.items():
+        results[index] = future.result()
+    return results
+
+
+#    PIL DDS backend
+
+@lru_cache(maxsize=256)
+def _dds_header(fourcc: bytes, width: int, height: int, dxgi_format: int = 0) -> bytes: #vers 1
+    """128-byte DDS header (plus DX10 extension for BC7), cached per size."""
+    block_bytes = 8 if fourcc == b'DXT1' else 16
+    pitch = max(1, (width + 3) // 4) * block_bytes
+    hdr = bytearray(128)
+    struct.pack_into('<I', hdr,  0, 0x20534444)        # 'DDS '
+    struct.pack_into('<I', hdr,  4, 124)               # header size
+    struct.pack_into('<I', hdr,  8, 0x1|0x2|0x4|0x1000)
+    struct.pack_into('<I', hdr, 12, height)
+    struct.pack_into('<I', hdr, 16, width)
+    struct.pack_into('<I', hdr, 20, pitch * max(1, (height + 3) // 4))
+    struct.pack_into('<I', hdr, 28, 1)
+    struct.pack_into('<I', hdr, 76, 32)                # pixel format size
+    struct.pack_into('<I', hdr, 80, 0x4)               # DDPF_FOURCC
+    hdr[84:88] = fourcc
+    if fourcc == b'DX10':
+        # dxgiFormat, resourceDimension=TEXTURE2D, miscFlag, arraySize, miscFlags2
+        hdr += struct.pack('<5I', dxgi_format, 3, 0, 1, 0)
+    return bytes(hdr)
+
+
+def _pil_dds_decode(data, width: int, height: int, fourcc: bytes,
+                    dxgi_format: int = 0) -> Optional[bytes]: #vers 1
+    """Decode block-compressed data through Pillow's DDS plugin, None on failure."""
+    if Image is None:
+        return None
+    try:
+        dds = _dds_header(fourcc, width, height, dxgi_format) + bytes(data)
+        return Image.open(io.BytesIO(dds)).convert('RGBA').tobytes()
+    except Exception:
+        return None
+
+
+def _decode_dxt1(data, width, height, **_): #vers 1
+    return _pil_dds_decode(data, width, height, b'DXT1') or decode_dxt1(data, width, height)
+
+
+def _decode_dxt3(data, width, height, **_): #vers 1
+    return _pil_dds_decode(data, width, height, b'DXT3') or decode_dxt3(data, width, height)
+
+
+def _decode_dxt5(data, width, height, **_): #vers 1
+    return _pil_dds_decode(data, width, height, b'DXT5') or decode_dxt5(data, width, height)
+
+
+def _decode_bc7(data, width, height, **_): #vers 1
+    """BC7 through Pillow; without it, a magenta checkerboard marks the
+    texture as undecodable."""
+    rgba = _pil_dds_decode(data, width, height, b'DX10', _DXGI_BC7_UNORM)
+    if rgba:
+        return rgba
+    y, x = np.mgrid[0:height, 0:width]
+    even = ((x // 8 + y // 8) % 2) == 0
+    out = np.empty((height, width, 4), dtype=np.uint8)
+    out[..., 0] = np.where(even, 255, 180)
+    out[..., 1] = 0
+    out[..., 2] = out[..., 0]
+    out[..., 3] = 255
+    return out.tobytes()
+
+
+#    NumPy kernels - uncompressed and palettised
+
+def _rgba_out(pixel_count: int, r, g, b, a) -> bytes: #vers 1
+    """Pack channel arrays into pixel_count RGBA pixels; pixels past the
+    decoded ones stay zero."""
+    out = np.zeros((pixel_count, 4), dtype=np.uint8)
+    n = len(r)
+    out[:n, 0] = r
+    out[:n, 1] = g
+    out[:n, 2] = b
+    out[:n, 3] = a
+    return out.tobytes()
+
+
+def _words(data, pixel_count: int): #vers 1
+    """Little-endian 16-bit pixels present in data, as int32."""
+    n = min(pixel_count, len(data) // 2)
+    return np.frombuffer(data, dtype='<u2', count=n).astype(np.int32)
+
+
+def _palette_rgba(palette, entries: int, palette_is_bgra: bool, opaque: bool): #vers 1
+    """(entries, 4) RGBA palette from raw 4-byte entries."""
+    pal = np.frombuffer(palette, dtype=np.uint8, count=entries * 4).reshape(entries, 4)
+    pal = pal[:, [2, 1, 0, 3]] if palette_is_bgra else pal.copy()
+    if opaque:
+        pal[:, 3] = 255
+    return pal
+
+
+def _decode_pal8(data, width, height, palette=None, palette_entry_fmt='ARGB8888',
+                 force_opaque=False, palette_is_bgra=True, **_): #vers 2
+    """8-bit indexed, 256 x 4-byte entries. GTA3/VC palettes are RGBA, SA BGRA.
+    Only an RGB888 palette_entry_fmt makes it opaque - force_opaque is
+    ignored, as in the per-pixel decoder this replaced."""
+    if not palette or len(palette) < 1024:
+        return None
+    pixel_count = width * height
+    pal = _palette_rgba(palette, 256, palette_is_bgra, palette_entry_fmt == 'RGB888')
+    idx = np.frombuffer(data, dtype=np.uint8, count=min(pixel_count, len(data)))
+    out = np.zeros((pixel_count, 4), dtype=np.uint8)
+    out[:len(idx)] = pal[idx]
+    return out.tobytes()
+
+
+def _decode_pal4(data, width, height, palette=None, palette_entry_fmt='ARGB8888',
+                 force_opaque=False, palette_is_bgra=True, **_): #vers 2
+    """4-bit indexed, 16 entries; high nibble is the first pixel (DragonFF).
+    Opaque only for an RGB888 palette_entry_fmt, like PAL8."""
+    if not palette or len(palette) < 64:
+        return None
+    pixel_count = width * height
+    pal = _palette_rgba(palette, 16, palette_is_bgra, palette_entry_fmt == 'RGB888')
+    packed = np.frombuffer(data, dtype=np.uint8)
+    idx = np.stack((packed >> 4, packed & 0x0F), axis=1).reshape(-1)[:pixel_count]
+    out = np.zeros((pixel_count, 4), dtype=np.uint8)
+    out[:len(idx)] = pal[idx]
+    return out.tobytes()
+
+
+def _decode_argb8888(data, width, height, force_opaque=False, **_): #vers 1
+    """Stored BGRA; X8R8G8B8 (force_opaque) has padding, not alpha."""
+    pixel_count = width * height
+    n = min(pixel_count, len(data) // 4)
+    px = np.frombuffer(data, dtype=np.uint8, count=n * 4).reshape(n, 4)
+    return _rgba_out(pixel_count, px[:, 2], px[:, 1], px[:, 0],
+                     255 if force_opaque else px[:, 3])
+
+
+def _decode_rgb888(data, width, height, depth=0, **_): #vers 1
+    """Stored BGR (3 bpp) or BGRX (4 bpp when depth == 32)."""
+    pixel_count = width * height
+    stride = 4 if depth == 32 else 3
+    n = min(pixel_count, len(data) // stride)
+    px = np.frombuffer(data, dtype=np.uint8, count=n * stride).reshape(n, stride)
+    return _rgba_out(pixel_count, px[:, 2], px[:, 1], px[:, 0], 255)
+
+
+def _decode_rgb565(data, width, height, **_): #vers 1
+    p = _words(data, width * height)
+    return _rgba_out(width * height, ((p >> 11) & 0x1F) << 3,
+                     ((p >> 5) & 0x3F) << 2, (p & 0x1F) << 3, 255)
+
+
+def _decode_argb1555(data, width, height, **_): #vers 1
+    p = _words(data, width * height)
+    return _rgba_out(width * height, ((p >> 10) & 0x1F) << 3,
+                     ((p >> 5) & 0x1F) << 3, (p & 0x1F) << 3,
+                     np.where(p & 0x8000, 255, 0))
+
+
+def _decode_argb4444(data, width, height, **_): #vers 1
+    p = _words(data, width * height)
+    return _rgba_out(width * height, ((p >> 8) & 0x0F) * 17,
+                     ((p >> 4) & 0x0F) * 17, (p & 0x0F) * 17,
+                     ((p >> 12) & 0x0F) * 17)
+
+
+def _decode_rgb555(data, width, height, **_): #vers 1
+    p = _words(data, width * height)
+    return _rgba_out(width * height, ((p >> 10) & 0x1F) << 3,
+                     ((p >> 5) & 0x1F) << 3, (p & 0x1F) << 3, 255)
+
+
+def _decode_a8l8(data, width, height, **_): #vers 1
+    pixel_count = width * height
+    n = min(pixel_count, len(data) // 2)
+    px = np.frombuffer(data, dtype=np.uint8, count=n * 2).reshape(n, 2)
+    return _rgba_out(pixel_count, px[:, 0], px[:, 0], px[:, 0], px[:, 1])
+
+
+def _decode_lum8(data, width, height, **_): #vers 1
+    pixel_count = width * height
+    lum = np.frombuffer(data, dtype=np.uint8, count=min(pixel_count, len(data)))
+    return _rgba_out(pixel_count, lum, lum, lum, 255)
+
+
+def _decode_unknown(data, width, height, **_): #vers 1
+    """Unknown raster type - mid grey so it at least shows something."""
+    return b'\x80\x80\x80\xff' * (width * height)
+
+
+#    Mobile formats - existing pure-Python decoders
+
+def _decode_etc1(data, width, height, **_): #vers 1
+    from apps.methods.mobile_texture_decode import decode_etc1
+    return decode_etc1(bytes(data), width, height)
+
+
+def _decode_pvrtc(data, width, height, **_): #vers 1
+    from apps.methods.pvrtc_decode import decode_pvrtc2
+    return decode_pvrtc2(bytes(data), width, height)
+
+
+_PIL_BACKEND = Image is not None
+
+register_decoder('DXT1', _decode_dxt1, _PIL_BACKEND, aliases=('BC1',))
+register_decoder('DXT3', _decode_dxt3, _PIL_BACKEND, aliases=('BC2',))
+register_decoder('DXT5', _decode_dxt5, _PIL_BACKEND, aliases=('BC3',))
+register_decoder('BC4', lambda data, w, h, **_: decode_bc4(data, w, h), aliases=('ATI1',))
+register_decoder('BC5', lambda data, w, h, **_: decode_bc5(data, w, h), aliases=('ATI2',))
+register_decoder('BC7', _decode_bc7, _PIL_BACKEND)
+register_decoder('PAL8', _decode_pal8)
+register_decoder('PAL4', _decode_pal4)
+register_decoder('ARGB8888', _decode_argb8888, aliases=('8888', 'ARGB32'))
+register_decoder('RGB888', _decode_rgb888, aliases=('888',))
+register_decoder('RGB565', _decode_rgb565, aliases=('565',))
+register_decoder('ARGB1555', _decode_argb1555, aliases=('1555',))
+register_decoder('ARGB4444', _decode_argb4444, aliases=('4444',))
+register_decoder('RGB555', _decode_rgb555, aliases=('555',))
+register_decoder('A8L8', _decode_a8l8)
+register_decoder('LUM8', _decode_lum8, aliases=('L8',))
+register_decoder('ETC1', _decode_etc1, aliases=('ETC',))
+register_decoder('PVRTC', _decode_pvrtc, aliases=('PVRTC2',))
+register_decoder('UNKNOWN', _decode_unknown)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/thumbnail_cache.py - Version: 1
+# X-Seti - October17 2026 - IMG Factory 1.6
+# Persistent thumbnail cache - SQLite store of TXD previews per IMG entry
+
+"""
+On-disk cache of texture previews for TXD entries inside IMG archives.
+
+Browsing an archive in TXD Workshop builds small previews of every texture
+of every TXD. They are stored in an SQLite database in the user cache
+directory, keyed by (IMG path, entry name, offset, size, IMG mtime), so
+re-opening an archive browsed before shows the previews at once without
+reading any IMG data. Rebuilding or editing the archive changes the mtime
+(and usually offset / size) and the stale rows simply stop matching.
+
+Previews are PNG (encoded here with zlib, so PIL is not required), at most
+THUMB_SIZE px on the longer side. The database is capped at max_bytes of
+image data; the least recently used TXD entries are dropped first.
+
+One connection is shared between the GUI thread (lookups) and the
+background populator (inserts), guarded by a lock.
+"""
+
+import os
+import sys
+import time
+import zlib
+import struct
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+## Methods list -
+# downscale_rgba
+# encode_png
+# get_thumbnail_cache
+# user_cache_dir
+#
+##class ThumbnailCache: -
+# __init__
+# _connect
+# clear
+# close
+# entry_key
+# evict
+# get
+# get_archive
+# put
+# stats
+
+# Longest side of a stored preview
+THUMB_SIZE = 64
+
+# Default cap on stored image data - 64 MB is roughly 40k 64x64 previews
+DEFAULT_MAX_MB = 64
+
+_DB_NAME = 'txd_thumbs.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    img_path TEXT NOT NULL,
+    entry_name TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    bytes INTEGER NOT NULL,
+    UNIQUE (img_path, entry_name, offset, size, mtime)
+);
+CREATE INDEX IF NOT EXISTS entries_archive ON entries (img_path, mtime);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (last_used);
+CREATE TABLE IF NOT EXISTS thumbs (
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    tex_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    image BLOB NOT NULL,
+    PRIMARY KEY (entry_id, tex_index)
+);
+"""
+
+
+def user_cache_dir(app_name: str = 'imgfactory') -> str: #vers 1
+    """Per-user cache directory (XDG on Linux, LOCALAPPDATA on Windows,
+    ~/Library/Caches on macOS)."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, app_name)
+
+
+def downscale_rgba(rgba, width: int, height: int,
+                   size: int = THUMB_SIZE) -> Tuple[bytes, int, int]: #vers 1
+    """Box-filter RGBA down so the longer side is at most size px.
+    Smaller images are returned unchanged."""
+    if max(width, height) <= size:
+        return bytes(rgba), width, height
+    step = -(-max(width, height) // size)
+    out_w, out_h = max(1, width // step), max(1, height // step)
+    pixels = np.frombuffer(rgba, dtype=np.uint8, count=width * height * 4).reshape(height, width, 4)
+    pixels = pixels[:out_h * step, :out_w * step].reshape(out_h, step, out_w, step, 4)
+    return pixels.mean(axis=(1, 3), dtype=np.float32).round().astype(np.uint8).tobytes(), out_w, out_h
+
+
+def encode_png(rgba, width: int, height: int) -> bytes: #vers 1
+    """Minimal RGBA8 PNG (filter type 0 on every row)."""
+    def chunk(tag, payload):
+        return (struct.pack('>I', len(payload)) + tag + payload +
+                struct.pack('>I', zlib.crc32(tag + payload) & 0xFFFFFFFF))
+
+    rows = np.frombuffer(rgba, dtype=np.uint8, count=width * height * 4).reshape(height, width * 4)
+    raw = np.hstack([np.zeros((height, 1), dtype=np.uint8), rows]).tobytes()
+    return (b'\x89PNG\r\n\x1a\n' +
+            chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)) +
+            chunk(b'IDAT', zlib.compress(raw, 6)) +
+            chunk(b'IEND', b''))
+
+
+class ThumbnailCache: #vers 1
+    """SQLite-backed preview store, LRU-evicted to max_bytes"""
+
+    def __init__(self, path: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024): #vers 1
+        self.path = path or os.path.join(user_cache_dir(), _DB_NAME)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = None
+
+
+    def _connect(self) -> sqlite3.Connection: #vers 1
+        """Open (and create) the database on first use. Lock held."""
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute('PRAGMA foreign_keys=ON')
+            db.executescript(_SCHEMA)
+            self._db = db
+        return self._db
+
+
+    @staticmethod
+    def entry_key(entry) -> Tuple[str, int, int]: #vers 1
+        """(name, offset, size) of an IMGEntry - together with the archive
+        path and mtime this identifies the stored bytes."""
+        return entry.name, int(entry.offset), int(entry.size)
+
+
+    def get_archive(self, img_path: str, mtime: int) -> Dict[Tuple[str, int, int], List[dict]]: #vers 1
+        """Every cached TXD of one archive state in a single query:
+        {(entry_name, offset, size): [thumb, ...]}. Thumbs are dicts with
+        tex_index, name, width, height, format and image (PNG bytes)."""
+        result = {}
+        try:
+            with self._lock:
+                db = self._connect()
+                rows = db.execute(
+                    'SELECT e.id, e.entry_name, e.offset, e.size, t.tex_index, t.name, '
+                    't.width, t.height, t.format, t.image FROM entries e '
+                    'LEFT JOIN thumbs t ON t.entry_id = e.id '
+                    'WHERE e.img_path = ? AND e.mtime = ? ORDER BY e.id, t.tex_index',
+                    (img_path, mtime)).fetchall()
+                if rows:
+                    db.execute('UPDATE entries SET last_used = ? WHERE img_path = ? AND mtime = ?',
+                               (time.time(), img_path, mtime))
+                    db.commit()
+        except sqlite3.Error:
+            return result
+        for _, name, offset, size, tex_index, tex_name, width, height, fmt, image in rows:
+            thumbs = result.setdefault((name, offset, size), [])
+            if tex_index is not None:
+                thumbs.append({'tex_index': tex_index, 'name': tex_name, 'width': width,
+                               'height': height, 'format': fmt, 'image': image})
+        return result
+
+
+    def get(self, img_path: str, mtime: int, entry) -> Optional[List[dict]]: #vers 1
+        """Cached thumbs of one TXD entry, or None if it was never stored."""
+        name, offset, size = self.entry_key(entry)
+        try:
+            with self._lock:
+                db = self._connect()
+                row = db.execute(
+                    'SELECT id FROM entries WHERE img_path = ? AND entry_name = ? '
+                    'AND offset = ? AND size = ? AND mtime = ?',
+                    (img_path, name, offset, size, mtime)).fetchone()
+                if row is None:
+                    return None
+                db.execute('UPDATE entries SET last_used = ? WHERE id = ?', (time.time(), row[0]))
+                db.commit()
+                rows = db.execute(
+                    'SELECT tex_index, name, width, height, format, image FROM thumbs '
+                    'WHERE entry_id = ? ORDER BY tex_index', (row[0],)).fetchall()
+        except sqlite3.Error:
+            return None
+        return [{'tex_index': r[0], 'name': r[1], 'width': r[2], 'height': r[3],
+                 'format': r[4], 'image': r[5]} for r in rows]
+
+
+    def put(self, img_path: str, mtime: int, entry, thumbs: Iterable[dict]): #vers 1
+        """Store the thumbs of one TXD entry (replacing any previous set)
+        and evict down to max_bytes. An empty list is stored too, so TXDs
+        without textures are not parsed again."""
+        name, offset, size = self.entry_key(entry)
+        thumbs = list(thumbs)
+        total = sum(len(t['image']) for t in thumbs)
+        try:
+            with self._lock:
+                db = self._connect()
+                db.execute('DELETE FROM entries WHERE img_path = ? AND entry_name = ? '
+                           'AND offset = ? AND size = ? AND mtime = ?',
+                           (img_path, name, offset, size, mtime))
+                cur = db.execute(
+                    'INSERT INTO entries (img_path, entry_name, offset, size, mtime, last_used, bytes) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (img_path, name, offset, size, mtime, time.time(), total))
+                db.executemany(
+                    'INSERT INTO thumbs (entry_id, tex_index, name, width, height, format, image) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(cur.lastrowid, t['tex_index'], t['name'], t['width'], t['height'],
+                      t['format'], sqlite3.Binary(t['image'])) for t in thumbs])
+                db.commit()
+        except sqlite3.Error:
+            return
+        self.evict()
+
+
+    def evict(self) -> int: #vers 1
+        """Drop least recently used entries until stored image data fits
+        max_bytes. Returns the number of entries removed."""
+        removed = 0
+        try:
+            with self._lock:
+                db = self._connect()
+                total = db.execute('SELECT COALESCE(SUM(bytes), 0) FROM entries').fetchone()[0]
+                if total <= self.max_bytes:
+                    return 0
+                doomed = []
+                for entry_id, size in db.execute('SELECT id, bytes FROM entries ORDER BY last_used'):
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((entry_id,))
+                    total -= size
+                db.executemany('DELETE FROM entries WHERE id = ?', doomed)
+                db.commit()
+                removed = len(doomed)
+        except sqlite3.Error:
+            pass
+        return removed
+
+
+    def clear(self): #vers 1
+        """Remove every stored preview."""
+        try:
+            with self._lock:
+                db = self._connect()
+                db.execute('DELETE FROM entries')
+                db.commit()
+                db.execute('VACUUM')
+        except sqlite3.Error:
+            pass
+
+
+    def stats(self) -> dict: #vers 1
+        """Entry / texture counts and stored bytes for display."""
+        try:
+            with self._lock:
+                db = self._connect()
+                entries, size = db.execute(
+                    'SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM entries').fetchone()
+                textures = db.execute('SELECT COUNT(*) FROM thumbs').fetchone()[0]
+        except sqlite3.Error:
+            entries = size = textures = 0
+        return {'entries': entries, 'textures': textures, 'size_bytes': size,
+                'max_bytes': self.max_bytes, 'path': self.path}
+
+
+    def close(self): #vers 1
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_cache = None
+
+
+def get_thumbnail_cache() -> ThumbnailCache: #vers 1
+    """Process-wide cache shared by every TXD Workshop window."""
+    global _cache
+    if _cache is None:
+        _cache = ThumbnailCache()
+    return _cache
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/txd_native.py - Version: 1
+# X-Seti - October17 2026 - IMG Factory 1.6
+# Texture Native parsing - shared by TXD Workshop and its background loaders
+
+"""
+Texture Native (RW section 0x15) parsing without a TXD Workshop instance.
+
+TXDWorkshop._parse_single_texture, TXDLoadTask and the TXD preview builder
+all parse through parse_texture_native(), so the thread-pool loaders need
+no widget. Levels are LazyLevels over the TXD bytes (apps/methods/
+lazy_texture.py); thumbnail_source() picks the mip level a preview needs.
+"""
+
+import struct
+from typing import Callable, Optional, Tuple
+
+from apps.methods.lazy_texture import LazyLevel, LazyTexture, decode_pending
+from apps.methods.rw_chunks import RW_STRUCT, RW_TEXTURE_NATIVE, as_view, read_chunk_header
+from apps.methods.texture_decode import decode_texture
+
+## Methods list -
+# decompress_dxt
+# parse_texture_native
+# thumbnail_source
+
+
+def decompress_dxt(compressed_data, width: int, height: int, format_str: str): #vers 1
+    """DXT1/3/5 data to RGBA (see apps/methods/texture_decode.py). Data of
+    any other format is returned unchanged."""
+    fmt = 'DXT1' if 'DXT1' in format_str else 'DXT3' if 'DXT3' in format_str else 'DXT5' if 'DXT5' in format_str else None
+    if fmt is None:
+        return compressed_data
+    return decode_texture(compressed_data, width, height, fmt)
+
+
+def parse_texture_native(txd_data, offset: int, index: int, rw_version: int = 0x1803FFFF,
+                         decode: bool = True, log: Optional[Callable[[str], None]] = None) -> dict: #vers 1
+    """Parse the Texture Native section at offset of txd_data, with bumpmap
+    and reflection maps. decode=False returns a LazyTexture whose levels hold
+    zero-copy raster slices (decoded on first access, or in one batch by
+    decode_pending()). Bumpmap / reflection details and parse errors go to
+    log(message) when given."""
+    tex = {
+        'name': f'texture_{index}',
+        'width': 0,
+        'height': 0,
+        'depth': 32,
+        'format': 'DXT1',
+        'has_alpha': False,
+        'mipmaps': 1,
+        'rgba_data': b'',
+        'alpha_mask': b'',              # NEW: Separate grayscale alpha channel
+        'compressed_data': b'',
+        'original_bgra_data': b'',
+        'mipmap_levels': [],
+        'bumpmap_data': b'',
+        'bumpmap_type': 0,
+        'has_bumpmap': False,
+        'reflection_map': b'',
+        'fresnel_map': b'',
+        'has_reflection': False,
+        'raster_format_flags': 0
+    }
+
+    try:
+        # Raster slices are views into txd_data - no copy until decoded
+        raster = as_view(txd_data)
+
+        # TextureNative structure
+        native = read_chunk_header(raster, offset)
+        if native is None or native.type != RW_TEXTURE_NATIVE:
+            return tex
+
+        # Struct section
+        body = read_chunk_header(raster, native.data_offset)
+        if body is None or body.type != RW_STRUCT:
+            return tex
+
+        pos = body.data_offset
+
+        # Read 88-byte header
+        platform_id, filter_mode, uv_addressing = struct.unpack_from('<I2B', raster, pos)
+
+        #    Xbox (platform_id == 5): delegate to Xbox parser               
+        if platform_id == 5:
+            try:
+                from apps.methods.txd_platform_xbox import parse_xbox_nativetex
+                xbox_tex = parse_xbox_nativetex(txd_data, offset, index)
+                if xbox_tex:
+                    # Decode compressed data to RGBA for display
+                    if xbox_tex.get('compressed_data') and not xbox_tex.get('rgba_data'):
+                        fmt = xbox_tex.get('format', 'DXT1')
+                        w   = xbox_tex.get('width', 0)
+                        h   = xbox_tex.get('height', 0)
+                        if w > 0 and h > 0 and 'DXT' in fmt:
+                            xbox_tex['rgba_data'] = decompress_dxt(
+                                xbox_tex['compressed_data'], w, h, fmt)
+                    return xbox_tex
+            except Exception as _xe:
+                print(f"[Xbox TXD] Texture {index}: {_xe}")
+            return tex  # return empty rather than crash
+        #    End Xbox                                                      
+
+        pos += 8  # Skip padding
+
+        name_bytes = bytes(raster[pos:pos+32])
+        # Use first-null termination (like C strlen) not rstrip — DragonFF does this too
+        _null = name_bytes.find(b'\x00')
+        tex['name'] = (name_bytes[:_null] if _null >= 0 else name_bytes).decode('ascii', errors='ignore') or f'texture_{index}'
+        pos += 32
+
+        mask_bytes = bytes(raster[pos:pos+32])
+        _null2 = mask_bytes.find(b'\x00')
+        alpha_name = (mask_bytes[:_null2] if _null2 >= 0 else mask_bytes).decode('ascii', errors='ignore')
+        if alpha_name:
+            tex['alpha_name'] = alpha_name
+            tex['has_alpha'] = True
+        pos += 32
+
+        raster_format_flags, d3d_format, width, height, depth, num_levels, raster_type = struct.unpack_from('<IIHHBBB', raster, pos)
+        tex['width'] = width
+        tex['height'] = height
+        tex['depth'] = depth
+        tex['mipmaps'] = num_levels
+        tex['raster_format_flags'] = raster_format_flags
+
+        # Check for bumpmap flag (bit 0x10)
+        if raster_format_flags & 0x10:
+            tex['has_bumpmap'] = True
+
+        pos += 15
+
+        platform_prop = raster[pos]
+        pos += 1
+
+        # Format detection - version-aware
+        is_pal8     = bool(raster_format_flags & 0x2000)  # FORMAT_EXT_PAL8
+        is_pal4     = bool(raster_format_flags & 0x4000)  # FORMAT_EXT_PAL4
+        pixel_fmt   = raster_format_flags & 0x0F00  # bits 8-11 only, excludes PAL flags
+        is_sa_plus  = (rw_version >= 0x1803FFFF)
+        # GTA3/VC: RGBA palette (no swap); SA: BGRA palette (swap B<->R)
+        tex['palette_is_bgra'] = is_sa_plus
+
+        raster_pixel_map = {
+            0x0100: 'ARGB1555', 0x0200: 'RGB565',
+            0x0300: 'ARGB4444', 0x0400: 'LUM8',
+            0x0500: 'ARGB8888', 0x0600: 'RGB888',
+            0x0A00: 'RGB555',
+        }
+
+        # Xbox (platform_id=5): compression byte 0x0C/0x0E/0x10 = DXT1/3/5
+        # D3D8 GTA3/VC: platform_prop 1/3/5 = DXT1/3/5
+        # SA D3D9: use d3d_format FourCC
+        is_xbox = (platform_id == 5)
+        if is_pal8:
+            tex['format'] = 'PAL8'
+        elif is_pal4:
+            tex['format'] = 'PAL4'
+        elif is_xbox and platform_prop == 0x00:
+            # Raw ARGB8888 - use raster_format pixel bits
+            tex['format'] = {0x0500:'ARGB8888',0x0600:'RGB888'}.get(pixel_fmt, 'ARGB8888')
+        elif is_xbox and platform_prop in (0x0B, 0x0C):
+            # 0x0B = LIN_DXT1 (linear/standard), 0x0C = DXT1 (swizzled)
+            # Both decode identically via PIL DDS
+            tex['format'] = 'DXT1'
+        elif is_xbox and platform_prop in (0x0E, 0x0F):
+            # 0x0E = DXT3 (swizzled), 0x0F = LIN_DXT3 (linear/standard)
+            tex['format'] = 'DXT3'
+            tex['has_alpha'] = True
+        elif is_xbox and platform_prop in (0x10, 0x11):
+            # 0x10 = DXT5 (swizzled), 0x11 = LIN_DXT5 (linear/standard)
+            tex['format'] = 'DXT5'
+            tex['has_alpha'] = True
+        elif d3d_format == 0x31545844:
+            tex['format'] = 'DXT1'
+        elif d3d_format == 0x33545844:
+            tex['format'] = 'DXT3'
+            tex['has_alpha'] = True
+        elif d3d_format == 0x35545844:
+            tex['format'] = 'DXT5'
+            tex['has_alpha'] = True
+        elif not is_xbox and platform_id == 8 and platform_prop == 1:
+            # D3D8 only: platform_prop 1/3/5 = DXT type
+            # D3D9 uses d3d_format field — platform_prop is alpha/cube/mip/compressed flags
+            tex['format'] = 'DXT1'
+        elif not is_xbox and platform_id == 8 and platform_prop == 3:
+            tex['format'] = 'DXT3'
+            tex['has_alpha'] = True
+        elif not is_xbox and platform_id == 8 and platform_prop == 5:
+            tex['format'] = 'DXT5'
+            tex['has_alpha'] = True
+        elif is_sa_plus:
+            d3d_fmt_map = {
+                # D3D9 format enum -> internal format name
+                21: 'ARGB8888',  # D3DFMT_A8R8G8B8 - stored BGRA 4bpp
+                22: 'ARGB8888',  # D3DFMT_X8R8G8B8 - stored BGRX 4bpp, treat as ARGB8888 (alpha=255)
+                32: 'ARGB8888',  # D3DFMT_A8B8G8R8
+                20: 'RGB888',    # D3DFMT_R8G8B8   - true 24-bit, rare
+                23: 'RGB565',    # D3DFMT_R5G6B5
+                25: 'ARGB1555',  # D3DFMT_A1R5G5B5
+                26: 'ARGB4444',  # D3DFMT_A4R4G4B4
+                24: 'RGB555',    # D3DFMT_X1R5G5B5
+                50: 'LUM8',      # D3DFMT_L8
+                51: 'A8L8',      # D3DFMT_A8L8
+                41: 'PAL8',      # D3DFMT_P8
+            }
+            tex['format'] = d3d_fmt_map.get(d3d_format,
+                raster_pixel_map.get(pixel_fmt, f'UNKNOWN_{raster_format_flags:08X}'))
+        else:
+            tex['format'] = raster_pixel_map.get(pixel_fmt,
+                f'UNKNOWN_{raster_format_flags:08X}')
+
+        # D3DFMT_X8R8G8B8 (22): stored BGRX, X channel is padding not alpha
+        if d3d_format == 22:
+            tex['force_opaque'] = True  # force alpha=255 when decoding
+
+        if tex['format'] in ('ARGB8888', 'ARGB1555', 'ARGB4444', 'DXT3', 'DXT5', 'PAL8', 'A8L8'):
+            if not tex.get('has_alpha') and not tex.get('force_opaque'):
+                tex['has_alpha'] = True
+
+        # Read mipmap data
+        # SA (D3D9, RW >= 0x1803FFFF): ALL formats have a 4-byte data_size field PER mipmap level
+        # GTA3/VC (D3D8): ONLY DXT formats have data_size per level; raw/PAL data follows directly
+        # Xbox (platform_id=5): ONE total data_size field covers ALL mipmap levels combined
+        fmt = tex['format']
+        is_dxt = 'DXT' in fmt
+        is_xbox = (platform_id == 5)
+        has_data_size_field = (is_dxt or is_sa_plus) and not is_xbox
+
+        # Xbox: read single total size, then consume all levels from that block
+        if is_xbox and pos + 4 <= len(txd_data):
+            xbox_total_size = struct.unpack_from('<I', raster, pos)[0]
+            pos += 4
+            xbox_data_block = raster[pos:pos+xbox_total_size]
+            pos += xbox_total_size
+            # Split into per-level chunks using calculated sizes
+            block_pos = 0
+            w, h = width, height
+            for level in range(num_levels):
+                if 'DXT1' in fmt:
+                    lsize = max(1,(w+3)//4)*max(1,(h+3)//4)*8
+                elif 'DXT' in fmt:
+                    lsize = max(1,(w+3)//4)*max(1,(h+3)//4)*16
+                elif fmt == 'RGB888':
+                    lsize = w*h*(4 if depth==32 else 3)
+                elif fmt in ('RGB565','ARGB1555','ARGB4444','RGB555'):
+                    lsize = w*h*2
+                else:  # ARGB8888, LUM8, etc
+                    lsize = w*h*(depth//8)
+                level_data = xbox_data_block[block_pos:block_pos+lsize]
+                block_pos += lsize
+                lw, lh = w, h
+                mipmap_level = LazyLevel({'level': level, 'width': lw, 'height': lh,
+                    'rgba_data': None, 'compressed_data': level_data if is_dxt else None,
+                    'compressed_size': len(level_data)},
+                    {'data': level_data, 'width': lw, 'height': lh,
+                     'format': fmt, 'depth': depth,
+                     'force_opaque': tex.get('force_opaque', False)})
+                tex['mipmap_levels'].append(mipmap_level)
+                w = max(1, w//2); h = max(1, h//2)
+        else:
+            w, h = width, height
+            for level in range(num_levels):
+                # Calculate expected size for this mipmap level
+                if 'DXT1' in fmt:
+                    expected = max(1, (w+3)//4) * max(1, (h+3)//4) * 8
+                elif 'DXT' in fmt:
+                    expected = max(1, (w+3)//4) * max(1, (h+3)//4) * 16
+                elif fmt in ('ARGB8888', 'A8L8'):
+                    expected = w * h * 4
+                elif fmt == 'RGB888':
+                    expected = w * h * (4 if tex.get('depth', 0) == 32 else 3)
+                elif fmt in ('RGB565', 'ARGB1555', 'ARGB4444', 'RGB555'):
+                    expected = w * h * 2
+                elif fmt == 'LUM8':
+                    expected = w * h
+                elif fmt == 'PAL8':
+                    # Layout: palette(1024 raw) + pixel_size(4) + pixels(w*h)
+                    # DragonFF: read_palette has no prefix; read_pixels has 4-byte prefix
+                    expected = 1024 + 4 + w * h
+                elif fmt == 'PAL4':
+                    # Layout: palette(64 or 128 raw) + pixel_size(4) + pixels((w*h+1)//2)
+                    _pal4_sz = 64 if depth == 4 else 128
+                    expected = _pal4_sz + 4 + (w * h + 1) // 2
+                else:
+                    expected = w * h * 2
+
+                # Read declared data_size if present, use it if sane
+                if has_data_size_field:
+                    if pos + 4 > len(txd_data):
+                        break
+                    declared = struct.unpack_from('<I', raster, pos)[0]
+                    pos += 4
+                    size = declared if (expected // 2 <= declared <= expected * 4) else expected
+                else:
+                    size = expected
+
+                lw, lh = w, h
+
+                if pos + size > len(txd_data):
+                    break
+
+                level_data = raster[pos:pos+size]
+                pos += size
+
+                # Decompress if needed - deferred, see LazyLevel
+                lw = max(1, width >> level)
+                lh = max(1, height >> level)
+                rgba_data = None
+                decode_spec = None
+                if 'DXT' in tex['format']:
+                    decode_spec = {'data': level_data, 'width': lw, 'height': lh,
+                                   'format': tex['format']}
+                elif tex['format'] in ('PAL8', 'PAL4'):
+                    # GTA3/VC palettes are RGBA; SA (>=0x1803FFFF) palettes are BGRA
+                    # palette_is_bgra stored during header parse
+                    pal_entry_fmt = tex.get('palette_entry_format', 'ARGB8888')
+                    palette_is_bgra = tex.get('palette_is_bgra', True)
+                    # DragonFF: pal8_noalpha when has_alpha()==False
+                    # raster_format_type in (888, 565, 555, LUM) → no alpha
+                    _NO_ALPHA_TYPES = {0x0600, 0x0200, 0x0A00, 0x0400}  # 888,565,555,LUM
+                    _pix_type = tex.get('raster_format_flags', 0) & 0x0F00
+                    force_opaque_pal = _pix_type in _NO_ALPHA_TYPES
+                    # PAL8=1024 bytes, PAL4=64 bytes (depth==4) or 128 bytes (depth!=4)
+                    # Matches DragonFF read_palette() logic
+                    if tex['format'] == 'PAL8':
+                        pal_size = 1024
+                    elif tex.get('depth', 4) == 4:
+                        pal_size = 64
+                    else:
+                        pal_size = 128
+                    if len(level_data) >= pal_size:
+                        pal_data = level_data[:pal_size]
+                        # Skip the 4-byte pixel data size prefix that follows palette
+                        # (DragonFF read_pixels always reads size-prefixed; palette is raw)
+                        pix_offset = pal_size + 4
+                        pix_data = level_data[pix_offset:]
+                        decode_spec = {'data': pix_data, 'width': lw, 'height': lh,
+                                       'format': tex['format'], 'palette': pal_data,
+                                       'palette_entry_fmt': pal_entry_fmt,
+                                       'palette_is_bgra': palette_is_bgra,
+                                       'force_opaque': force_opaque_pal}
+                    else:
+                        rgba_data = b'\x00' * (lw * lh * 4)
+                else:
+                    decode_spec = {'data': level_data, 'width': lw, 'height': lh,
+                                   'format': tex['format'], 'depth': tex.get('depth', 0),
+                                   'force_opaque': tex.get('force_opaque', False)}
+
+                mipmap_level = {
+                    'level': level,
+                    'width': max(1, width >> level),
+                    'height': max(1, height >> level),
+                    'rgba_data': rgba_data,
+                    'compressed_data': level_data if 'DXT' in tex['format'] else None,
+                    'compressed_size': len(level_data)
+                }
+                if decode_spec is not None:
+                    # LazyLevel also turns the compressed_data view into bytes on read
+                    mipmap_level = LazyLevel(mipmap_level, decode_spec)
+                elif level == 0:
+                    tex['rgba_data'] = rgba_data
+                tex['mipmap_levels'].append(mipmap_level)
+
+                # Advance mipmap dimensions
+                w = max(1, w // 2)
+                h = max(1, h // 2)
+
+        # Read bumpmap data (if present)
+        if tex['has_bumpmap'] and pos + 5 <= len(txd_data):
+            try:
+                bumpmap_size = struct.unpack_from('<I', raster, pos)[0]
+                pos += 4
+
+                bumpmap_type = raster[pos]
+                pos += 1
+
+                if pos + bumpmap_size <= len(txd_data):
+                    tex['bumpmap_data'] = bytes(raster[pos:pos+bumpmap_size])
+                    tex['bumpmap_type'] = bumpmap_type
+                    pos += bumpmap_size
+
+                    if log is not None:
+                        type_names = ['Height Map', 'Normal Map', 'Both']
+                        type_name = type_names[bumpmap_type] if bumpmap_type < 3 else 'Unknown'
+                        log(
+                            f"  Bumpmap: {type_name} ({bumpmap_size} bytes)"
+                        )
+            except Exception as e:
+                if log is not None:
+                    log(f"  Bumpmap read error: {str(e)}")
+
+        # Read reflection map data (if present)
+        if pos + 8 <= len(txd_data):
+            try:
+                reflection_size = struct.unpack_from('<I', raster, pos)[0]
+                pos += 4
+
+                expected_reflection_size = width * height * 3
+                if reflection_size == expected_reflection_size and pos + reflection_size <= len(txd_data):
+                    tex['reflection_map'] = bytes(raster[pos:pos+reflection_size])
+                    tex['has_reflection'] = True
+                    pos += reflection_size
+
+                    if pos + 4 <= len(txd_data):
+                        fresnel_size = struct.unpack_from('<I', raster, pos)[0]
+                        pos += 4
+
+                        expected_fresnel_size = width * height
+                        if fresnel_size == expected_fresnel_size and pos + fresnel_size <= len(txd_data):
+                            tex['fresnel_map'] = bytes(raster[pos:pos+fresnel_size])
+                            pos += fresnel_size
+
+                            if log is not None:
+                                log(
+                                    f"  Reflection maps: "
+                                    f"Vector ({reflection_size}B) + Fresnel ({fresnel_size}B)"
+                                )
+            except Exception as e:
+                pass
+
+    except Exception as e:
+        if log is not None:
+            log(f"Texture parse error: {str(e)}")
+
+    levels = tex.get('mipmap_levels')
+    if levels and isinstance(levels[0], LazyLevel) and not levels[0].is_decoded():
+        tex = LazyTexture(tex, levels[0])
+        if decode:
+            decode_pending([tex])
+    return tex
+
+
+def thumbnail_source(texture: dict, size: int = 64) -> Tuple[Optional[bytes], int, int]: #vers 1
+    """Return (rgba, width, height) of the smallest stored mip level whose
+    longer side is at least size px. Only that level is decoded - for a
+    2048x2048 chain that is the 64x64 level, 1/1024 of the pixels.
+
+    The chain is trusted only while it still matches rgba_data: an
+    untouched lazy texture, or level 0 being the same buffer. Edited
+    textures (mips not regenerated) use their full-size rgba_data."""
+    width = texture.get('width', 0)
+    height = texture.get('height', 0)
+    levels = [lvl for lvl in texture.get('mipmap_levels') or []
+              if lvl.get('width', 0) > 0 and lvl.get('height', 0) > 0]
+    if levels and levels[0].get('width') == width and levels[0].get('height') == height:
+        pending = isinstance(texture, LazyTexture) and not texture.is_decoded()
+        base = dict.get(texture, 'rgba_data')
+        if pending or (base and dict.get(levels[0], 'rgba_data') is base):
+            big_enough = [lvl for lvl in levels if max(lvl['width'], lvl['height']) >= size]
+            level = (min(big_enough, key=lambda lvl: lvl['width'] * lvl['height'])
+                     if big_enough else levels[0])
+            rgba = level.get('rgba_data')
+            if rgba and len(rgba) == level['width'] * level['height'] * 4:
+                return rgba, level['width'], level['height']
+    return texture.get('rgba_data'), width, height
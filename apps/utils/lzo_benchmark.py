@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+#this belongs in apps/utils/lzo_benchmark.py - Version: 1
+# X-Seti - October17 2026 - IMG Factory 1.6
+"""
+Xbox LZO decompression benchmark.
+
+Times the pure-Python LZO1X decoder (img_core_classes._lzo1x_decompress)
+on the real LZO entries of an Xbox IMG archive, and python-lzo on the same
+blocks when it is installed (its output is also used to check ours).
+
+    python -m apps.utils.lzo_benchmark path/to/gta3.img [--repeat 3] [--limit 200]
+"""
+
+import argparse
+import struct
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+from apps.methods.img_core_classes import (
+    IMGFile, _is_xbox_lzo, _lzo1x_decompress, _XBOX_LZO_MAGIC)
+
+## Methods list -
+# collect_blocks
+# time_decoder
+# xbox_lzo_blocks
+# main
+
+# (decompressed size, compressed block) as stored in the entry
+Block = Tuple[int, bytes]
+
+
+def xbox_lzo_blocks(data: bytes) -> List[Block]: #vers 1
+    """Split an Xbox LZO entry into its blocks (same framing as
+    _xbox_lzo_decompress_entry)."""
+    blocks = []
+    if len(data) < 12 or struct.unpack_from('<I', data, 0)[0] != _XBOX_LZO_MAGIC:
+        return blocks
+    pos = 12
+    while pos + 12 <= len(data):
+        _always, decomp_sz, comp_sz = struct.unpack_from('<III', data, pos)
+        pos += 12
+        if comp_sz == 0:
+            break
+        blocks.append((decomp_sz, bytes(data[pos:pos + comp_sz])))
+        pos += comp_sz
+    return blocks
+
+
+def collect_blocks(img_path: str, limit: int = 0) -> Tuple[int, List[Block]]: #vers 1
+    """(LZO entry count, blocks) of the first limit LZO entries of an
+    archive (all of them when limit is 0)."""
+    img = IMGFile(img_path)
+    if not img.open():
+        raise RuntimeError(f"Could not open {img_path}")
+    count = 0
+    blocks: List[Block] = []
+    try:
+        for entry in img.entries:
+            raw = img._read_raw(entry)
+            if not _is_xbox_lzo(raw):
+                continue
+            blocks.extend(xbox_lzo_blocks(bytes(raw)))
+            count += 1
+            if limit and count >= limit:
+                break
+    finally:
+        img.close()
+    return count, blocks
+
+
+def time_decoder(decode: Callable[[bytes, int], bytes], blocks: List[Block],
+                 repeat: int = 3) -> float: #vers 1
+    """Best wall time of repeat passes of decode over every block."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for decomp_sz, block in blocks:
+            decode(block, decomp_sz)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int: #vers 1
+    parser = argparse.ArgumentParser(description="Benchmark Xbox LZO entry decompression")
+    parser.add_argument('img_path', help="Xbox IMG archive (.img or .dir)")
+    parser.add_argument('--repeat', type=int, default=3, help="passes per decoder, best is reported")
+    parser.add_argument('--limit', type=int, default=0, help="only the first N LZO entries")
+    args = parser.parse_args(argv)
+
+    count, blocks = collect_blocks(args.img_path, args.limit)
+    if not blocks:
+        print("No Xbox LZO entries found")
+        return 1
+    packed = sum(len(block) for _, block in blocks)
+    unpacked = sum(decomp_sz for decomp_sz, _ in blocks)
+    print(f"{count} LZO entries, {len(blocks)} blocks, "
+          f"{packed / 1e6:.2f} MB -> {unpacked / 1e6:.2f} MB")
+
+    elapsed = time_decoder(_lzo1x_decompress, blocks, args.repeat)
+    print(f"pure-Python: {elapsed:.3f} s, {unpacked / 1e6 / elapsed:.1f} MB/s")
+
+    try:
+        import lzo
+    except ImportError:
+        print("python-lzo: not installed")
+        return 0
+
+    def decode_lzo(block, decomp_sz):
+        return lzo.decompress(block, False, decomp_sz)
+
+    mismatches = sum(_lzo1x_decompress(block, decomp_sz) != decode_lzo(block, decomp_sz)
+                     for decomp_sz, block in blocks)
+    lzo_elapsed = time_decoder(decode_lzo, blocks, args.repeat)
+    print(f"python-lzo:  {lzo_elapsed:.3f} s, {unpacked / 1e6 / lzo_elapsed:.1f} MB/s "
+          f"({elapsed / lzo_elapsed:.0f}x faster), {mismatches} mismatched blocks")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())